@@ -455,7 +455,7 @@ json_file = f'tesis3/results/mejores_soluciones_genes_{timestamp}.json'
 # Los genes son listas de listas de enteros, se pueden serializar directamente
 genes_serializados = {
     'solucion_1_prioriza_makespan': {
-        'genes': solucion_1['cromosoma'].genes,
+        'genes': solucion_1['cromosoma'].genes.tolist(),
         'metricas': {
             'makespan': float(solucion_1['makespan']),
             'balance': float(solucion_1['balance']),
@@ -464,7 +464,7 @@ genes_serializados = {
         'descripcion': 'Solución que prioriza minimizar el makespan (tiempo de ejecución total)'
     },
     'solucion_2_prioriza_balance': {
-        'genes': solucion_2['cromosoma'].genes,
+        'genes': solucion_2['cromosoma'].genes.tolist(),
         'metricas': {
             'makespan': float(solucion_2['makespan']),
             'balance': float(solucion_2['balance']),
@@ -473,7 +473,7 @@ genes_serializados = {
         'descripcion': 'Solución que prioriza minimizar el balance de carga entre máquinas'
     },
     'solucion_3_prioriza_energia': {
-        'genes': solucion_3['cromosoma'].genes,
+        'genes': solucion_3['cromosoma'].genes.tolist(),
         'metricas': {
             'makespan': float(solucion_3['makespan']),
             'balance': float(solucion_3['balance']),
@@ -0,0 +1,60 @@
+"""Benchmark de la clasificación no dominada: matriz n x n vs. O(N log² N) para M = 3
+
+Mide ambas versiones para varios tamaños de población y reporta el punto de
+cruce, usado para fijar los umbrales de tesis3/src/algorithms/no_dominados.py.
+Con TESIS3_BACKEND=python se mide la versión NumPy de la matriz de dominancia.
+
+Uso:
+    python tesis3/experiments/benchmark_clasificacion.py [repeticiones]
+"""
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import numpy as np
+
+from tesis3.src.algorithms.no_dominados import frentes_tres_objetivos, umbral_tres_objetivos
+from tesis3.src.algorithms.nsga2 import _clasificacion_cuadratica
+from tesis3.src.utils import aceleracion
+
+TAMANOS = [50, 100, 200, 400, 600, 800, 1600, 3200]
+
+
+def medir(funcion, fitness_array, repeticiones):
+    """Tiempo medio (ms) de funcion(fitness_array)"""
+    funcion(fitness_array)
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion(fitness_array)
+    return (time.perf_counter() - inicio) / repeticiones * 1000
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    rng = np.random.default_rng(0)
+    
+    print(f"Backend: {aceleracion.BACKEND}")
+    print(f"{'n':>6} {'matriz (ms)':>12} {'M=3 (ms)':>10} {'speedup':>8} {'frentes':>8}")
+    cruce = None
+    for n in TAMANOS:
+        # Objetivos en conflicto con ruido: varios frentes de tamaño variable
+        base = rng.random((n, 2))
+        fitness_array = np.column_stack([base, 1.5 - base.sum(axis=1) + 0.3 * rng.random(n)])
+        
+        frentes = frentes_tres_objetivos(fitness_array)
+        assert frentes == _clasificacion_cuadratica(fitness_array)
+        
+        t_matriz = medir(_clasificacion_cuadratica, fitness_array, repeticiones)
+        t_tres = medir(frentes_tres_objetivos, fitness_array, repeticiones)
+        if cruce is None and t_tres < t_matriz:
+            cruce = n
+        speedup = t_matriz / t_tres
+        print(f"{n:>6} {t_matriz:>12.2f} {t_tres:>10.2f} {speedup:>7.1f}x {len(frentes):>8}")
+    
+    print(f"\nPunto de cruce medido: n = {cruce}")
+    print(f"Umbral configurado: n >= {umbral_tres_objetivos(aceleracion.usar_numba())}")
+
+
+if __name__ == "__main__":
+    main()
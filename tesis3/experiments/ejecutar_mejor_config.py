@@ -5,6 +5,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from tesis3.src.core.problem import ProblemConfig
 from tesis3.src.algorithms.nsga2 import nsga2
+from tesis3.src.fitness.paralelo import evaluador_desde_entorno
 from tesis3.src.operators.crossover import aplicar_cruce
 from tesis3.src.operators.mutation import aplicar_mutacion
 import time
@@ -20,20 +21,29 @@ def mutacion_wrapper(pob, cfg, prob):
 print("Mejor configuración: Uniforme + Invert")
 print("Población: 100, Generaciones: 300")
 
+# TESIS3_WORKERS_EVALUACION=N reparte las evaluaciones de cada generación en N procesos
+evaluador = evaluador_desde_entorno(config)
+
 inicio = time.time()
-frente, fitness, _ = nsga2(
-    config=config,
-    metodo_cruce=cruce_wrapper,
-    metodo_mutacion=mutacion_wrapper,
-    tamano_poblacion=100,
-    num_generaciones=300,
-    prob_cruce=0.95,
-    prob_mutacion=0.3,
-    verbose=True
-)
+try:
+    frente, fitness, _ = nsga2(
+        config=config,
+        metodo_cruce=cruce_wrapper,
+        metodo_mutacion=mutacion_wrapper,
+        tamano_poblacion=100,
+        num_generaciones=300,
+        prob_cruce=0.95,
+        prob_mutacion=0.3,
+        verbose=True,
+        evaluador=evaluador
+    )
+finally:
+    # Los workers se cierran también si la corrida falla o se interrumpe
+    if evaluador is not None:
+        evaluador.cerrar()
 tiempo = time.time() - inicio
 
-metricas = [(1/f[0], 1/f[1]-1, 1/f[2]-1, 1/f[3]-1) for f in fitness]
+metricas = [(1/f[0], 1/f[1]-1, 1/f[2]-1) for f in fitness]
 mejor_mk = min(m[0] for m in metricas)
 
 print(f"\nMejor makespan: {mejor_mk:.2f}s")
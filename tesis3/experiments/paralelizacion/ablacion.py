@@ -10,6 +10,13 @@ from tesis3.src.algorithms.nsga2 import nsga2
 from tesis3.src.algorithms.nsga2_memetic import nsga2_memetic
 from tesis3.src.fitness.multi_objective import fitness_multiobjetivo
 from tesis3.src.utils.seeds import cargar_semillas
+from tesis3.src.fitness.almacen import ruta_almacen_desde_entorno
+from tesis3.src.fitness.memo_compartido import (
+    cache_del_worker,
+    inicializar_worker,
+    memo_desde_entorno,
+    reportar_memo,
+)
 import numpy as np
 import random
 import time
@@ -120,6 +127,7 @@ def ejecutar_semilla_ablacion(args):
         return aplicar_mutacion(pob, cfg, metodo=metodo_mutacion, tasa_mut=prob)
     
     inicio = time.time()
+    estadisticas_cache = {}
     
     # Determinar qué algoritmo usar
     if variante['algoritmo'] == 'nsga2':
@@ -134,7 +142,9 @@ def ejecutar_semilla_ablacion(args):
             prob_mutacion=prob_mutacion,
             epsilon_filtro=epsilon_filtro,
             cada_k_filtro=30,
-            verbose=False
+            verbose=False,
+            cache=cache_del_worker(),
+            estadisticas=estadisticas_cache
         )
     else:  # memetic
         epsilon_filtro = 0.01 if variante.get('filtro_epsilon', True) else 0.0
@@ -157,7 +167,9 @@ def ejecutar_semilla_ablacion(args):
             max_iter_local=max_iter_local,
             epsilon_filtro=epsilon_filtro,
             cada_k_filtro=30,
-            verbose=False
+            verbose=False,
+            cache=cache_del_worker(),
+            estadisticas=estadisticas_cache
         )
     
     tiempo = time.time() - inicio
@@ -167,6 +179,7 @@ def ejecutar_semilla_ablacion(args):
         'tiempo': tiempo,
         **metricas,
         'historial': historial,
+        **estadisticas_cache,
         'variante': variante['nombre'],
         'semilla': semilla,
         'cruce': variante.get('cruce', 'uniforme'),
@@ -363,33 +376,47 @@ def main():
     print(f"Timestamp inicio: {time.strftime('%H:%M:%S')}")
     print(f"{'='*80}\n")
     
-    with ProcessPoolExecutor(max_workers=num_nucleos) as executor:
-        # Enviar todas las tareas
-        futures = []
-        for tarea in tareas:
-            futures.append(executor.submit(ejecutar_semilla_ablacion, tarea))
+    # Memo compartido entre workers (TESIS3_MEMO_COMPARTIDO) y almacén persistente
+    # de evaluaciones (TESIS3_ALMACEN_EVALUACIONES), ambos opcionales.
+    # Reduce los tiempos medidos: no activarlo si se comparan tiempos entre variantes
+    memo = memo_desde_entorno(config)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=num_nucleos,
+            initializer=inicializar_worker,
+            initargs=(memo.nombre if memo else None, config, ruta_almacen_desde_entorno()),
+        ) as executor:
+            # Enviar todas las tareas
+            futures = []
+            for tarea in tareas:
+                futures.append(executor.submit(ejecutar_semilla_ablacion, tarea))
+            
+            # Procesar resultados conforme se completan
+            for i, future in enumerate(as_completed(futures)):
+                try:
+                    resultado = future.result()
+                    todos_resultados.append(resultado)
+                    
+                    # Mostrar progreso
+                    progreso = (i+1) / len(tareas) * 100
+                    tiempo_transcurrido = time.time() - inicio_total
+                    tiempo_por_ejecucion = tiempo_transcurrido / (i+1)
+                    tiempo_restante = tiempo_por_ejecucion * (len(tareas) - i-1)
+                    
+                    timestamp = time.strftime('%H:%M:%S')
+                    print(f"  [{progreso:5.1f}%] {i+1:4d}/{len(tareas)} - "
+                          f"{resultado['variante']:<30} Semilla {resultado['semilla']:<3} - "
+                          f"Tiempo: {resultado['tiempo']:.2f}s - "
+                          f"Score: {resultado['score_agregado']:.4f} - "
+                          f"Restante: {tiempo_restante/60:.1f}min")
+                except Exception as e:
+                    print(f"  [ERROR] Tarea falló: {e}")
         
-        # Procesar resultados conforme se completan
-        for i, future in enumerate(as_completed(futures)):
-            try:
-                resultado = future.result()
-                todos_resultados.append(resultado)
-                
-                # Mostrar progreso
-                progreso = (i+1) / len(tareas) * 100
-                tiempo_transcurrido = time.time() - inicio_total
-                tiempo_por_ejecucion = tiempo_transcurrido / (i+1)
-                tiempo_restante = tiempo_por_ejecucion * (len(tareas) - i-1)
-                
-                timestamp = time.strftime('%H:%M:%S')
-                print(f"  [{progreso:5.1f}%] {i+1:4d}/{len(tareas)} - "
-                      f"{resultado['variante']:<30} Semilla {resultado['semilla']:<3} - "
-                      f"Tiempo: {resultado['tiempo']:.2f}s - "
-                      f"Score: {resultado['score_agregado']:.4f} - "
-                      f"Restante: {tiempo_restante/60:.1f}min")
-            except Exception as e:
-                print(f"  [ERROR] Tarea falló: {e}")
-    
+        reportar_memo(memo, todos_resultados)
+    finally:
+        # También ante una excepción o Ctrl-C: el segmento no sobrevive al script
+        if memo is not None:
+            memo.liberar()
     tiempo_total = time.time() - inicio_total
     print(f"\n{'='*80}")
     print(f"EJECUCIÓN COMPLETADA")
@@ -468,7 +495,8 @@ def main():
     with open(archivo_detallado, 'w', newline='') as f:
         fieldnames = ['variante', 'semilla', 'cruce', 'mutacion', 'tiempo',
                      'makespan', 'balance', 'energia', 'score_agregado',
-                     'tamano_frente']
+                     'tamano_frente', 'cache_aciertos', 'cache_fallos',
+                     'cache_desalojos', 'cache_bytes']
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         for r in resultados:
@@ -483,7 +511,11 @@ def main():
                     'balance': r['balance'],
                     'energia': r['energia'],
                     'score_agregado': r['score_agregado'],
-                    'tamano_frente': r['tamano_frente']
+                    'tamano_frente': r['tamano_frente'],
+                    'cache_aciertos': r.get('cache_aciertos'),
+                    'cache_fallos': r.get('cache_fallos'),
+                    'cache_desalojos': r.get('cache_desalojos'),
+                    'cache_bytes': r.get('cache_bytes')
                 })
     
     # Guardar resumen
@@ -7,6 +7,13 @@ from tesis3.src.core.problem import ProblemConfig
 from tesis3.src.algorithms.nsga2_memetic import nsga2_memetic
 from tesis3.src.operators.crossover import aplicar_cruce
 from tesis3.src.operators.mutation import aplicar_mutacion
+from tesis3.src.fitness.almacen import ruta_almacen_desde_entorno
+from tesis3.src.fitness.memo_compartido import (
+    cache_del_worker,
+    inicializar_worker,
+    memo_desde_entorno,
+    reportar_memo,
+)
 import numpy as np
 import random
 import time
@@ -135,6 +142,7 @@ def ejecutar_semilla_operador(args):
         mutacion_func = mutacion_invert
     
     inicio = time.time()
+    estadisticas_cache = {}
     frente_pareto, fitness_pareto, _ = nsga2_memetic(
         config, cruce_func, mutacion_func,
         tamano_poblacion=configuracion['tamano_poblacion'],
@@ -143,7 +151,9 @@ def ejecutar_semilla_operador(args):
         prob_mutacion=configuracion['prob_mutacion'],
         cada_k_gen=configuracion['cada_k_gen'],
         max_iter_local=configuracion['max_iter_local'],
-        verbose=False
+        verbose=False,
+        cache=cache_del_worker(),
+        estadisticas=estadisticas_cache
     )
     tiempo = time.time() - inicio
     
@@ -178,7 +188,8 @@ def ejecutar_semilla_operador(args):
         'energia': prom_eng,
         'tiempo': tiempo,
         'tamano_frente': len(frente_pareto),
-        'score_agregado': score_agregado
+        'score_agregado': score_agregado,
+        **estadisticas_cache
     }
 
 def detectar_capacidades_sistema():
@@ -283,67 +294,80 @@ def main():
     mejor_config = None
     configuraciones_ya_guardadas = set()  # Para evitar guardar la misma configuración múltiples veces
     
-    with ProcessPoolExecutor(max_workers=num_nucleos) as executor:
-        print(f"[INICIANDO] {len(tareas)} TAREAS EN {num_nucleos} NUCLEOS...")
-        print(f"[TIEMPO] Timestamp inicio: {time.strftime('%H:%M:%S')}")
-        print()
-        
-        # Enviar todas las tareas
-        futures = []
-        for tarea in tareas:
-            futures.append(executor.submit(ejecutar_semilla_operador, tarea))
-        
-        # Procesar resultados conforme se completan
-        for i, future in enumerate(as_completed(futures)):
-            try:
-                resultado = future.result()
-                todos_resultados.append(resultado)
-                
-                # Agrupar resultados por configuración
-                config_key = resultado['configuracion']['nombre']
-                
-                # Calcular promedio de la configuración actual
-                config_resultados = [r for r in todos_resultados if r['configuracion']['nombre'] == config_key]
-                if len(config_resultados) == num_semillas:
-                    prom_score = np.mean([r['score_agregado'] for r in config_resultados])
-                    if prom_score < mejor_score:
-                        mejor_score = prom_score
-                        mejor_config = resultado['configuracion']['nombre']
-                
-                # Mostrar progreso detallado
-                progreso = (i+1) / len(tareas) * 100
-                tiempo_transcurrido = time.time() - inicio_total
-                tiempo_por_ejecucion = tiempo_transcurrido / (i+1)
-                tiempo_restante = tiempo_por_ejecucion * (len(tareas) - i-1)
-                
-                timestamp = time.strftime('%H:%M:%S')
-                print(f"  [{progreso:5.1f}%] {i+1:4d}/{len(tareas)} - {timestamp} - "
-                      f"Config: {resultado['configuracion']['nombre']:<20} - "
-                      f"Semilla: {resultado['semilla']:2d} - "
-                      f"Score: {resultado['score_agregado']:.4f} - "
-                      f"Mejor: {mejor_score:.4f} - "
-                      f"ETA: {tiempo_restante/60:.1f}min")
-                
-                # Verificar si se completó alguna configuración
-                configuraciones_completas = verificar_configuraciones_completas(todos_resultados, 30)
-                if configuraciones_completas:
-                    # Verificar si hay configuraciones nuevas completadas
-                    configuraciones_nuevas = []
-                    for config in configuraciones_completas:
-                        if config not in configuraciones_ya_guardadas:
-                            configuraciones_nuevas.append(config)
-                            configuraciones_ya_guardadas.add(config)
+    # Memo compartido entre workers (TESIS3_MEMO_COMPARTIDO) y almacén persistente
+    # de evaluaciones (TESIS3_ALMACEN_EVALUACIONES), ambos opcionales
+    memo = memo_desde_entorno(config)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=num_nucleos,
+            initializer=inicializar_worker,
+            initargs=(memo.nombre if memo else None, config, ruta_almacen_desde_entorno()),
+        ) as executor:
+            print(f"[INICIANDO] {len(tareas)} TAREAS EN {num_nucleos} NUCLEOS...")
+            print(f"[TIEMPO] Timestamp inicio: {time.strftime('%H:%M:%S')}")
+            print()
+            
+            # Enviar todas las tareas
+            futures = []
+            for tarea in tareas:
+                futures.append(executor.submit(ejecutar_semilla_operador, tarea))
+            
+            # Procesar resultados conforme se completan
+            for i, future in enumerate(as_completed(futures)):
+                try:
+                    resultado = future.result()
+                    todos_resultados.append(resultado)
                     
-                    if configuraciones_nuevas:
-                        print(f"    Mejor config actual: {mejor_config}")
-                        print(f"    [OK] Configuraciones completadas: {len(configuraciones_nuevas)}")
-                        
-                        # Guardar resultados parciales
-                        guardar_resultados_parciales(todos_resultados, 30)
+                    # Agrupar resultados por configuración
+                    config_key = resultado['configuracion']['nombre']
                     
-            except Exception as exc:
-                print(f"  Generó una excepción: {exc}")
-    
+                    # Calcular promedio de la configuración actual
+                    config_resultados = [r for r in todos_resultados if r['configuracion']['nombre'] == config_key]
+                    if len(config_resultados) == num_semillas:
+                        prom_score = np.mean([r['score_agregado'] for r in config_resultados])
+                        if prom_score < mejor_score:
+                            mejor_score = prom_score
+                            mejor_config = resultado['configuracion']['nombre']
+                    
+                    # Mostrar progreso detallado
+                    progreso = (i+1) / len(tareas) * 100
+                    tiempo_transcurrido = time.time() - inicio_total
+                    tiempo_por_ejecucion = tiempo_transcurrido / (i+1)
+                    tiempo_restante = tiempo_por_ejecucion * (len(tareas) - i-1)
+                    
+                    timestamp = time.strftime('%H:%M:%S')
+                    print(f"  [{progreso:5.1f}%] {i+1:4d}/{len(tareas)} - {timestamp} - "
+                          f"Config: {resultado['configuracion']['nombre']:<20} - "
+                          f"Semilla: {resultado['semilla']:2d} - "
+                          f"Score: {resultado['score_agregado']:.4f} - "
+                          f"Mejor: {mejor_score:.4f} - "
+                          f"ETA: {tiempo_restante/60:.1f}min")
+                    
+                    # Verificar si se completó alguna configuración
+                    configuraciones_completas = verificar_configuraciones_completas(todos_resultados, 30)
+                    if configuraciones_completas:
+                        # Verificar si hay configuraciones nuevas completadas
+                        configuraciones_nuevas = []
+                        for configuracion in configuraciones_completas:
+                            if configuracion not in configuraciones_ya_guardadas:
+                                configuraciones_nuevas.append(configuracion)
+                                configuraciones_ya_guardadas.add(configuracion)
+                        
+                        if configuraciones_nuevas:
+                            print(f"    Mejor config actual: {mejor_config}")
+                            print(f"    [OK] Configuraciones completadas: {len(configuraciones_nuevas)}")
+                            
+                            # Guardar resultados parciales
+                            guardar_resultados_parciales(todos_resultados, 30)
+                
+                except Exception as exc:
+                    print(f"  Generó una excepción: {exc}")
+        
+        reportar_memo(memo, todos_resultados)
+    finally:
+        # También ante una excepción o Ctrl-C: el segmento no sobrevive al script
+        if memo is not None:
+            memo.liberar()
     tiempo_total = time.time() - inicio_total
     print(f"\nComparación completada en {tiempo_total:.1f} segundos")
     
@@ -412,13 +436,13 @@ def main():
         rango_tiempo = max_tiempo - min_tiempo if max_tiempo != min_tiempo else 1.0
         
         # Calcular métrica balanceada para cada configuración
-        for config in configuraciones_analizadas:
+        for configuracion in configuraciones_analizadas:
             # Normalizar ambos valores a [0, 1] donde 0 = mejor, 1 = peor
-            score_norm = (config['prom_score'] - min_score) / rango_score
-            tiempo_norm = (config['prom_tiempo'] - min_tiempo) / rango_tiempo
+            score_norm = (configuracion['prom_score'] - min_score) / rango_score
+            tiempo_norm = (configuracion['prom_tiempo'] - min_tiempo) / rango_tiempo
             
             # Métrica balanceada: combinación lineal ponderada
-            config['score_balanceado'] = (
+            configuracion['score_balanceado'] = (
                 peso_score * score_norm + peso_tiempo * tiempo_norm
             )
     
@@ -0,0 +1,277 @@
+"""Archivo de Pareto incremental (ND-tree, Jaszkiewicz y Lust 2018)
+
+Conjunto de soluciones no dominadas entre sí (maximización) que admite
+inserciones y eliminaciones sin reclasificar todo el conjunto. Cada nodo del
+árbol guarda la caja [nadir, ideal] de los puntos que contiene:
+    - un punto nuevo solo puede estar dominado por puntos de nodos cuyo
+      ideal es >= que él en todos los objetivos;
+    - solo puede dominar puntos de nodos cuyo nadir es <= que él;
+    - si domina al ideal de un nodo, se descarta el nodo completo.
+El resto de los nodos se poda sin recorrer sus puntos.
+
+Con max_tamano el archivo queda acotado: al superarlo se descarta la solución
+de menor crowding distance (la más redundante del frente).
+
+Uso típico:
+    archivo = ArchivoPareto()
+    for ind, fit in zip(poblacion, fitness_poblacion):
+        archivo.insertar(ind, fit)
+    frente_pareto, fitness_pareto = archivo.soluciones(), archivo.fitness()
+"""
+import math
+
+from tesis3.src.algorithms.nsga2 import distancia_crowding
+
+# Puntos por hoja antes de dividirla y máximo de hijos por nodo interno
+MAX_PUNTOS_HOJA = 20
+MAX_HIJOS = 6
+
+
+def _domina(a, b):
+    """a domina a b (maximización)"""
+    mejor = False
+    for x, y in zip(a, b):
+        if x < y:
+            return False
+        if x > y:
+            mejor = True
+    return mejor
+
+
+def _no_peor(a, b):
+    """a >= b en todos los objetivos"""
+    return all(x >= y for x, y in zip(a, b))
+
+
+class _Nodo:
+    """Nodo del ND-tree: hoja con puntos o nodo interno con hijos"""
+    
+    __slots__ = ('padre', 'hijos', 'puntos', 'ideal', 'nadir')
+    
+    def __init__(self, padre=None):
+        self.padre = padre
+        self.hijos = []
+        # Entradas (fitness, clave, solución); solo en hojas
+        self.puntos = []
+        self.ideal = None
+        self.nadir = None
+    
+    @property
+    def es_hoja(self):
+        return not self.hijos
+    
+    def ampliar_caja(self, fitness):
+        """Extiende [nadir, ideal] para incluir el punto"""
+        if self.ideal is None:
+            self.ideal = tuple(fitness)
+            self.nadir = tuple(fitness)
+        else:
+            self.ideal = tuple(max(a, b) for a, b in zip(self.ideal, fitness))
+            self.nadir = tuple(min(a, b) for a, b in zip(self.nadir, fitness))
+    
+    def recalcular_caja(self):
+        """Recalcula la caja desde los puntos o las cajas de los hijos"""
+        self.ideal = self.nadir = None
+        if self.es_hoja:
+            for fitness, _, _ in self.puntos:
+                self.ampliar_caja(fitness)
+        else:
+            for hijo in self.hijos:
+                self.ampliar_caja(hijo.ideal)
+                self.ampliar_caja(hijo.nadir)
+    
+    def distancia_centro(self, fitness):
+        """Distancia euclídea del punto al centro de la caja"""
+        return math.sqrt(sum(
+            ((i + n) / 2 - f) ** 2 for i, n, f in zip(self.ideal, self.nadir, fitness)
+        ))
+
+
+class ArchivoPareto:
+    """
+    Archivo de soluciones no dominadas con actualización incremental
+    
+    Las soluciones se identifican por su clave (Chromosome.clave). Soluciones
+    distintas con el mismo fitness se conservan todas (no se dominan entre sí).
+    """
+    
+    def __init__(self, max_tamano=None):
+        """
+        Args:
+            max_tamano: Máximo de soluciones (None = sin límite)
+        """
+        if max_tamano is not None and max_tamano < 1:
+            raise ValueError("max_tamano debe ser >= 1")
+        self.max_tamano = max_tamano
+        self._raiz = _Nodo()
+        # clave -> hoja que contiene la entrada
+        self._hojas = {}
+    
+    def __len__(self):
+        return len(self._hojas)
+    
+    def __contains__(self, clave):
+        return clave in self._hojas
+    
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+    
+    def _entradas(self, nodo=None):
+        """Recorre las entradas (fitness, clave, solución) del subárbol"""
+        pendientes = [self._raiz if nodo is None else nodo]
+        while pendientes:
+            actual = pendientes.pop()
+            if actual.es_hoja:
+                yield from actual.puntos
+            else:
+                pendientes.extend(reversed(actual.hijos))
+    
+    def soluciones(self):
+        """Soluciones del archivo"""
+        return [solucion for _, _, solucion in self._entradas()]
+    
+    def fitness(self):
+        """Fitness de las soluciones del archivo (mismo orden que soluciones())"""
+        return [fitness for fitness, _, _ in self._entradas()]
+    
+    def esta_dominado(self, fitness):
+        """Indica si algún punto del archivo domina al fitness dado"""
+        fitness = tuple(fitness)
+        pendientes = [self._raiz]
+        while pendientes:
+            nodo = pendientes.pop()
+            if nodo.ideal is None or not _no_peor(nodo.ideal, fitness):
+                continue
+            if _domina(nodo.nadir, fitness):
+                # Todos los puntos del nodo son >= nadir, que domina al punto
+                return True
+            if nodo.es_hoja:
+                if any(_domina(f, fitness) for f, _, _ in nodo.puntos):
+                    return True
+            else:
+                pendientes.extend(nodo.hijos)
+        return False
+    
+    # ------------------------------------------------------------------
+    # Actualización
+    # ------------------------------------------------------------------
+    
+    def insertar(self, solucion, fitness, clave=None):
+        """
+        Inserta una solución si no está dominada y elimina las que domina
+        
+        Args:
+            solucion: Solución a guardar (p. ej. Chromosome)
+            fitness: Tupla de objetivos (maximización)
+            clave: Identificador; por defecto solucion.clave
+        
+        Returns:
+            bool: True si la solución quedó en el archivo (con max_tamano puede
+                descartarse por crowding aunque no esté dominada)
+        """
+        clave = solucion.clave if clave is None else clave
+        if clave in self._hojas:
+            return True
+        fitness = tuple(fitness)
+        if self.esta_dominado(fitness):
+            return False
+        
+        self._eliminar_dominados(self._raiz, fitness)
+        self._insertar_en(self._raiz, (fitness, clave, solucion))
+        if self.max_tamano is not None and len(self._hojas) > self.max_tamano:
+            self._recortar()
+        return clave in self._hojas
+    
+    def eliminar(self, clave):
+        """
+        Quita una solución del archivo
+        
+        Returns:
+            bool: True si la clave estaba en el archivo
+        """
+        hoja = self._hojas.pop(clave, None)
+        if hoja is None:
+            return False
+        hoja.puntos = [entrada for entrada in hoja.puntos if entrada[1] != clave]
+        self._podar_hacia_arriba(hoja)
+        return True
+    
+    def limpiar(self):
+        """Vacía el archivo"""
+        self._raiz = _Nodo()
+        self._hojas.clear()
+    
+    def _recortar(self):
+        """Quita la solución de menor crowding distance (a igual crowding, la última)"""
+        entradas = list(self._entradas())
+        distancias = distancia_crowding([fitness for fitness, _, _ in entradas])
+        posicion = min(range(len(entradas)), key=lambda i: (distancias[i], -i))
+        self.eliminar(entradas[posicion][1])
+    
+    def _eliminar_dominados(self, nodo, fitness):
+        """Quita del subárbol los puntos dominados por fitness"""
+        if nodo.ideal is None or not _no_peor(fitness, nodo.nadir):
+            return
+        if _domina(fitness, nodo.ideal):
+            # Todo el nodo está dominado
+            for _, clave, _ in self._entradas(nodo):
+                del self._hojas[clave]
+            nodo.hijos = []
+            nodo.puntos = []
+            self._podar_hacia_arriba(nodo)
+            return
+        if nodo.es_hoja:
+            quedan = [entrada for entrada in nodo.puntos if not _domina(fitness, entrada[0])]
+            if len(quedan) < len(nodo.puntos):
+                for entrada in nodo.puntos:
+                    if _domina(fitness, entrada[0]):
+                        del self._hojas[entrada[1]]
+                nodo.puntos = quedan
+                self._podar_hacia_arriba(nodo)
+            return
+        for hijo in list(nodo.hijos):
+            self._eliminar_dominados(hijo, fitness)
+    
+    def _podar_hacia_arriba(self, nodo):
+        """Quita nodos vacíos y recalcula las cajas desde nodo hasta la raíz"""
+        while nodo is not None:
+            padre = nodo.padre
+            vacio = not nodo.puntos if nodo.es_hoja else not nodo.hijos
+            if vacio and padre is not None:
+                padre.hijos.remove(nodo)
+                if not padre.hijos:
+                    # El padre queda como hoja vacía y se poda en la siguiente vuelta
+                    padre.puntos = []
+            else:
+                nodo.recalcular_caja()
+            nodo = padre
+    
+    def _insertar_en(self, nodo, entrada):
+        """Baja hasta la hoja más cercana, inserta y divide si se desborda"""
+        fitness = entrada[0]
+        while not nodo.es_hoja:
+            nodo.ampliar_caja(fitness)
+            nodo = min(nodo.hijos, key=lambda hijo: hijo.distancia_centro(fitness))
+        nodo.ampliar_caja(fitness)
+        nodo.puntos.append(entrada)
+        self._hojas[entrada[1]] = nodo
+        if len(nodo.puntos) > MAX_PUNTOS_HOJA:
+            self._dividir(nodo)
+    
+    def _dividir(self, hoja):
+        """Divide una hoja en hijos agrupando por el objetivo de mayor rango"""
+        rangos = [i - n for i, n in zip(hoja.ideal, hoja.nadir)]
+        objetivo = rangos.index(max(rangos))
+        puntos = sorted(hoja.puntos, key=lambda entrada: entrada[0][objetivo])
+        num_hijos = min(MAX_HIJOS, len(puntos))
+        tamano = math.ceil(len(puntos) / num_hijos)
+        
+        hoja.puntos = []
+        for inicio in range(0, len(puntos), tamano):
+            hijo = _Nodo(padre=hoja)
+            for entrada in puntos[inicio:inicio + tamano]:
+                hijo.puntos.append(entrada)
+                hijo.ampliar_caja(entrada[0])
+                self._hojas[entrada[1]] = hijo
+            hoja.hijos.append(hijo)
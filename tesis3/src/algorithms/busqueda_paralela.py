@@ -0,0 +1,144 @@
+"""Búsqueda local del NSGA-II memético repartida entre workers persistentes
+
+Cada miembro del frente a mejorar es una tarea independiente con su propia
+semilla (derivada con SeedSequence de la semilla de la aplicación) y su propio
+random.Random, así que el resultado de cada tarea no depende de qué worker la
+ejecuta ni de cuántos workers haya: con num_workers=1 (todo en el proceso
+principal) se obtiene exactamente lo mismo que con el pool.
+
+Los workers devuelven los genes mejorados y su fitness; el proceso principal
+solo los guarda en el cache. Así la búsqueda local, que hace crecer el tiempo
+de una generación varias veces cada cada_k_gen generaciones
+(ANALISIS_OVERHEAD_MEMETICO.md), se reparte entre los núcleos.
+
+Uso típico:
+    with BusquedaLocalParalela(config, num_workers=4) as busqueda_paralela:
+        nsga2_memetic(config, ..., busqueda_paralela=busqueda_paralela)
+"""
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from tesis3.src.algorithms.nsga2_memetic import busqueda_local
+from tesis3.src.core.chromosome import Chromosome
+from tesis3.src.fitness.multi_objective import evaluar_individuos
+
+
+# ---------------------------------------------------------------------------
+# Lado del worker
+# ---------------------------------------------------------------------------
+
+_config_worker = None
+
+
+def _inicializar_worker(config):
+    """initializer del pool: guarda y compila el problema"""
+    global _config_worker
+    _config_worker = config
+    config.compilar()
+
+
+def _mejorar_lote(tareas, modo, tamano_bloque, config=None):
+    """
+    Tarea de un worker: búsqueda local de un bloque de miembros
+    
+    Args:
+        tareas: Lista de (genes, max_iter, semilla)
+        modo: Modo de busqueda_local
+        tamano_bloque: Vecinos por lote en los modos de vecindario
+        config: ProblemConfig (None = el del worker)
+    
+    Returns:
+        List[tuple]: (genes mejorados, fitness) por tarea
+    """
+    config = config if config is not None else _config_worker
+    mejorados = [
+        busqueda_local(
+            Chromosome(genes, config), config, max_iter, modo=modo,
+            tamano_bloque=tamano_bloque, rng=random.Random(semilla),
+        )
+        for genes, max_iter, semilla in tareas
+    ]
+    fitness = evaluar_individuos(mejorados, config)
+    return [(ind.genes_lectura.copy(), fit) for ind, fit in zip(mejorados, fitness)]
+
+
+# ---------------------------------------------------------------------------
+# Lado del proceso principal
+# ---------------------------------------------------------------------------
+
+class BusquedaLocalParalela:
+    """Aplica busqueda_local a varios individuos en un pool de procesos persistente"""
+    
+    def __init__(self, config, num_workers=None):
+        """
+        Args:
+            config: ProblemConfig de la corrida
+            num_workers: Procesos del pool (por defecto os.cpu_count()); con 1
+                las tareas corren en el proceso principal
+        """
+        self.config = config
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.tareas = 0
+        self._pool = None
+        if self.num_workers > 1:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                initializer=_inicializar_worker,
+                initargs=(config,),
+            )
+    
+    def mejorar(self, individuos, max_iters, semillas, modo='aleatorio', tamano_bloque=None):
+        """
+        Args:
+            individuos: Lista de Chromosome a mejorar
+            max_iters: Iteraciones de busqueda_local por individuo
+            semillas: Semilla de la secuencia aleatoria de cada individuo
+            modo: Modo de busqueda_local
+            tamano_bloque: Vecinos por lote en los modos de vecindario
+        
+        Returns:
+            List[tuple]: (Chromosome mejorado, fitness) en el orden de individuos
+        """
+        tareas = [
+            (ind.genes_lectura.copy(), max_iter, semilla)
+            for ind, max_iter, semilla in zip(individuos, max_iters, semillas)
+        ]
+        self.tareas += len(tareas)
+        if self._pool is None or len(tareas) < 2:
+            resultados = _mejorar_lote(tareas, modo, tamano_bloque, self.config)
+        else:
+            # Un bloque contiguo por worker: un solo envío de genes por worker
+            cortes = np.linspace(0, len(tareas), min(self.num_workers, len(tareas)) + 1)
+            cortes = cortes.astype(int).tolist()
+            futuros = [
+                self._pool.submit(_mejorar_lote, tareas[inicio:fin], modo, tamano_bloque)
+                for inicio, fin in zip(cortes[:-1], cortes[1:])
+                if fin > inicio
+            ]
+            resultados = [resultado for futuro in futuros for resultado in futuro.result()]
+        return [(Chromosome(genes, self.config), fit) for genes, fit in resultados]
+    
+    def estadisticas(self):
+        """
+        Returns:
+            dict: busqueda_paralela_tareas y busqueda_paralela_workers
+        """
+        return {
+            'busqueda_paralela_tareas': self.tareas,
+            'busqueda_paralela_workers': self.num_workers,
+        }
+    
+    def cerrar(self):
+        """Detiene el pool"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.cerrar()
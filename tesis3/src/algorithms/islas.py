@@ -0,0 +1,226 @@
+"""Modelo de islas: NSGA-II (o memético) en varios procesos con migración en anillo
+
+Cada isla es una corrida de nsga2 / nsga2_memetic en su propio proceso, con su
+propia semilla. Cada cada_m_migracion generaciones la isla i envía a la isla
+(i + 1) % K hasta num_migrantes soluciones de su frente 0 (solo los genes, por
+una multiprocessing.Queue) y recibe las de la isla anterior, que reemplazan a
+sus peores individuos. El frente final es el conjunto no dominado de la unión
+de los frentes de todas las islas.
+
+Ninguna isla clasifica más que su propia subpoblación, así que la población
+efectiva crece con K sin que un proceso arme la matriz de dominancia completa.
+
+Uso típico:
+    frente, fitness, historiales = nsga2_islas(
+        config, cruce, mutacion, num_islas=8, tamano_poblacion=100,
+        num_generaciones=300, semilla=0,
+    )
+
+Con el método de inicio 'spawn' los operadores deben ser funciones de módulo
+(serializables); con 'fork' (Linux) sirven también lambdas y closures.
+"""
+import multiprocessing as mp
+import queue
+import random
+
+import numpy as np
+
+from tesis3.src.algorithms.archivo_pareto import ArchivoPareto
+from tesis3.src.algorithms.nsga2 import filtrar_soluciones_similares, nsga2
+from tesis3.src.algorithms.nsga2_memetic import nsga2_memetic
+from tesis3.src.core.chromosome import Chromosome
+from tesis3.src.utils.seeds import semillas_derivadas
+
+# Segundos máximos esperando los migrantes de la isla anterior
+TIEMPO_ESPERA_MIGRACION = 600
+# Segundos entre revisiones de islas muertas mientras se esperan los resultados
+INTERVALO_REVISION_RESULTADOS = 1.0
+
+ALGORITMOS = {
+    'nsga2': nsga2,
+    'memetico': nsga2_memetic,
+}
+
+
+class _Migracion:
+    """Callback de migración de una isla (ver el argumento migracion de nsga2)"""
+    
+    def __init__(self, config, entrada, salida, cada_m_migracion, num_migrantes):
+        self.config = config
+        self.entrada = entrada
+        self.salida = salida
+        self.cada_m_migracion = cada_m_migracion
+        self.num_migrantes = num_migrantes
+        self.enviados = 0
+        self.recibidos = 0
+    
+    def __call__(self, gen, poblacion, fitness_poblacion, frente):
+        if gen == 0 or gen % self.cada_m_migracion != 0:
+            return []
+        
+        elegidos = random.sample(frente, min(self.num_migrantes, len(frente)))
+        self.salida.put([poblacion[i].genes_lectura.copy() for i in elegidos])
+        self.enviados += len(elegidos)
+        
+        try:
+            genes_recibidos = self.entrada.get(timeout=TIEMPO_ESPERA_MIGRACION)
+        except queue.Empty:
+            raise RuntimeError(
+                f"Sin migrantes de la isla anterior tras {TIEMPO_ESPERA_MIGRACION}s"
+            ) from None
+        self.recibidos += len(genes_recibidos)
+        return [Chromosome(genes, self.config) for genes in genes_recibidos]
+
+
+def _ejecutar_isla(indice, semilla, algoritmo, config, metodo_cruce, metodo_mutacion,
+                   entrada, salida, resultados, cada_m_migracion, num_migrantes, kwargs):
+    """Proceso de una isla: corre el algoritmo y publica su frente final"""
+    try:
+        random.seed(semilla)
+        np.random.seed(semilla)
+        migracion = _Migracion(config, entrada, salida, cada_m_migracion, num_migrantes)
+        frente, fitness, historial = ALGORITMOS[algoritmo](
+            config, metodo_cruce, metodo_mutacion, migracion=migracion, **kwargs
+        )
+        resultados.put((
+            indice,
+            [ind.genes_lectura.copy() for ind in frente],
+            fitness,
+            historial,
+            {'migrantes_enviados': migracion.enviados,
+             'migrantes_recibidos': migracion.recibidos},
+            None,
+        ))
+    except Exception as error:  # el proceso principal relanza el error
+        resultados.put((indice, None, None, None, None, repr(error)))
+
+
+def semillas_islas(semilla, num_islas):
+    """
+    Semillas independientes para cada isla (SeedSequence.spawn)
+    
+    Args:
+        semilla: Semilla de la corrida; None = derivada del estado de `random`
+        num_islas: Número de islas
+    
+    Returns:
+        List[int]: Una semilla de 32 bits por isla
+    """
+    return semillas_derivadas(semilla, num_islas)
+
+
+def _esperar_resultado(resultados, procesos, por_isla):
+    """
+    Espera el próximo resultado de una isla, revisando que sigan vivas
+    
+    Args:
+        resultados: Queue de resultados de las islas
+        procesos: Procesos de las islas
+        por_isla: Resultados ya recibidos (None = pendiente)
+    
+    Returns:
+        tuple: (índice, genes, fitness, historial, contadores, error)
+    
+    Raises:
+        RuntimeError: si una isla terminó sin enviar su resultado (OOM, señal, ...)
+    """
+    while True:
+        # Una isla que terminó antes de la espera ya dejó su resultado en la cola
+        muertas = [
+            i for i, proceso in enumerate(procesos)
+            if por_isla[i] is None and not proceso.is_alive()
+        ]
+        try:
+            return resultados.get(timeout=INTERVALO_REVISION_RESULTADOS)
+        except queue.Empty:
+            if muertas:
+                i = muertas[0]
+                raise RuntimeError(
+                    f"La isla {i} terminó sin enviar su resultado "
+                    f"(exitcode {procesos[i].exitcode})"
+                )
+
+
+def nsga2_islas(config, metodo_cruce, metodo_mutacion, num_islas=4,
+                cada_m_migracion=10, num_migrantes=5, algoritmo='nsga2',
+                semilla=None, epsilon_filtro=0.01, verbose=False, estadisticas=None,
+                **kwargs):
+    """
+    NSGA-II con modelo de islas en procesos separados y migración en anillo
+    
+    Args:
+        config: ProblemConfig
+        metodo_cruce: función de cruce
+        metodo_mutacion: función de mutación
+        num_islas: número de islas (procesos)
+        cada_m_migracion: generaciones entre migraciones
+        num_migrantes: soluciones del frente 0 que envía cada isla por migración
+        algoritmo: 'nsga2' o 'memetico'
+        semilla: semilla de la corrida (cada isla recibe una derivada)
+        epsilon_filtro: umbral de similitud de cada isla y del frente combinado
+        verbose: imprimir progreso de las islas
+        estadisticas: dict opcional; recibe migrantes_enviados,
+            migrantes_recibidos y frente_por_isla
+        **kwargs: demás parámetros de nsga2 / nsga2_memetic (tamano_poblacion,
+            num_generaciones, prob_cruce, ...), iguales para todas las islas
+    
+    Returns:
+        tuple: (frente_pareto, fitness_pareto, historiales), con un historial
+            de tamaños de frente por isla
+    """
+    if algoritmo not in ALGORITMOS:
+        raise ValueError(f"Algoritmo desconocido: {algoritmo}")
+    if num_islas < 1:
+        raise ValueError("num_islas debe ser >= 1")
+    if cada_m_migracion < 1:
+        raise ValueError("cada_m_migracion debe ser >= 1")
+    
+    kwargs = dict(kwargs, epsilon_filtro=epsilon_filtro, verbose=verbose)
+    semillas = semillas_islas(semilla, num_islas)
+    bandejas = [mp.Queue() for _ in range(num_islas)]
+    resultados = mp.Queue()
+    procesos = []
+    for i in range(num_islas):
+        proceso = mp.Process(
+            target=_ejecutar_isla,
+            args=(i, semillas[i], algoritmo, config, metodo_cruce, metodo_mutacion,
+                  bandejas[i], bandejas[(i + 1) % num_islas], resultados,
+                  cada_m_migracion, num_migrantes, kwargs),
+        )
+        proceso.start()
+        procesos.append(proceso)
+    
+    por_isla = [None] * num_islas
+    try:
+        for _ in range(num_islas):
+            indice, genes, fitness, historial, contadores, error = _esperar_resultado(
+                resultados, procesos, por_isla
+            )
+            if error is not None:
+                raise RuntimeError(f"Falló la isla {indice}: {error}")
+            por_isla[indice] = (genes, fitness, historial, contadores)
+    finally:
+        # Si una isla falló, las demás pueden estar esperando sus migrantes
+        for i, proceso in enumerate(procesos):
+            if por_isla[i] is None:
+                proceso.terminate()
+            proceso.join()
+    
+    # Frente combinado: no dominados de la unión de los frentes de las islas
+    archivo = ArchivoPareto()
+    for genes, fitness, _, _ in por_isla:
+        for genes_ind, fit in zip(genes, fitness):
+            archivo.insertar(Chromosome(genes_ind, config), fit)
+    frente_pareto = archivo.soluciones()
+    fitness_pareto = archivo.fitness()
+    if epsilon_filtro > 0 and len(frente_pareto) > 1:
+        frente_pareto, fitness_pareto = filtrar_soluciones_similares(
+            frente_pareto, fitness_pareto, epsilon_filtro
+        )
+    
+    if estadisticas is not None:
+        estadisticas['migrantes_enviados'] = sum(c['migrantes_enviados'] for *_, c in por_isla)
+        estadisticas['migrantes_recibidos'] = sum(c['migrantes_recibidos'] for *_, c in por_isla)
+        estadisticas['frente_por_isla'] = [len(genes) for genes, *_ in por_isla]
+    
+    return frente_pareto, fitness_pareto, [historial for _, _, historial, _ in por_isla]
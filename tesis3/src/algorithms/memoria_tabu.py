@@ -0,0 +1,69 @@
+"""Memoria tabú de movimientos rechazados por la búsqueda local (LRU acotado)
+
+Cada entrada es (clave del cromosoma, pedido, etapa, máquina): el movimiento de
+un gen aplicado a ese cromosoma exacto ya se evaluó y fue rechazado (el vecino
+no domina ni iguala al cromosoma). El fitness depende solo de los genes, así que
+el rechazo se repetiría: busqueda_local lo salta sin re-evaluar. La memoria
+persiste entre aplicaciones de la búsqueda local dentro de una corrida.
+"""
+from collections import OrderedDict
+
+# ~200k movimientos (~40 MB) cubren varias aplicaciones sobre un frente de 100
+MAX_ENTRADAS_POR_DEFECTO = 200_000
+
+
+class MemoriaTabu:
+    """Conjunto acotado de movimientos rechazados con desalojo LRU"""
+    
+    def __init__(self, max_entradas=MAX_ENTRADAS_POR_DEFECTO):
+        """
+        Args:
+            max_entradas: Máximo de movimientos recordados
+        """
+        if max_entradas < 1:
+            raise ValueError("max_entradas debe ser >= 1")
+        self.max_entradas = max_entradas
+        self._movimientos = OrderedDict()
+        self.aciertos = 0
+        self.consultas = 0
+        self.registrados = 0
+        self.desalojos = 0
+    
+    def __len__(self):
+        return len(self._movimientos)
+    
+    def es_tabu(self, clave, pedido, etapa, maquina):
+        """Indica si el movimiento ya fue rechazado para ese cromosoma (cuenta acierto)"""
+        movimiento = (clave, pedido, etapa, maquina)
+        self.consultas += 1
+        if movimiento not in self._movimientos:
+            return False
+        self.aciertos += 1
+        self._movimientos.move_to_end(movimiento)
+        return True
+    
+    def registrar(self, clave, pedido, etapa, maquina):
+        """Recuerda un movimiento rechazado"""
+        movimiento = (clave, pedido, etapa, maquina)
+        if movimiento in self._movimientos:
+            self._movimientos.move_to_end(movimiento)
+            return
+        self._movimientos[movimiento] = None
+        self.registrados += 1
+        if len(self._movimientos) > self.max_entradas:
+            self._movimientos.popitem(last=False)
+            self.desalojos += 1
+    
+    def estadisticas(self):
+        """
+        Returns:
+            dict: tabu_aciertos (evaluaciones evitadas), tabu_consultas,
+                tabu_registrados, tabu_desalojos y tabu_entradas
+        """
+        return {
+            'tabu_aciertos': self.aciertos,
+            'tabu_consultas': self.consultas,
+            'tabu_registrados': self.registrados,
+            'tabu_desalojos': self.desalojos,
+            'tabu_entradas': len(self._movimientos),
+        }
@@ -0,0 +1,308 @@
+"""Clasificación no dominada por rangos (maximización)
+
+Rangos de frente como arrays de longitud n:
+    - rangos_no_dominados: pelado de frentes con la matriz de dominancia y
+      actualizaciones matriz-vector enmascaradas (sin listas por individuo).
+    - rangos_tres_objetivos: O(N log² N) para M = 3 y poblaciones grandes.
+Los frentes como listas (con el mismo orden interno que el pelado original de
+clasificacion_no_dominada, del que depende el desempate del crowding y la
+selección) se reconstruyen con frentes_desde_rangos_pelado.
+
+Algoritmo para tres objetivos (ordenamiento + búsqueda binaria de frentes, estilo ENS-BS):
+    1. Se ordenan los puntos lexicográficamente de mayor a menor; así todo
+       dominador de un punto aparece antes que él.
+    2. Cada frente guarda la "escalera" 2D de sus puntos en (f2, f3): los no
+       dominados en esas dos coordenadas, con f2 creciente y f3 decreciente.
+       Un punto tiene un dominador en el frente k si la escalera contiene un
+       punto con f2 >= a y f3 >= b (una búsqueda binaria).
+    3. Si el frente k contiene un dominador, también lo contiene el k - 1; el
+       rango de cada punto se obtiene con búsqueda binaria sobre los frentes.
+    4. El orden de cada frente se reconstruye como en el pelado original,
+       buscando el último dominador de cada punto en el frente anterior.
+"""
+from bisect import bisect_left
+
+import numpy as np
+
+from tesis3.src.utils import aceleracion
+
+# A partir de este tamaño clasificacion_no_dominada usa frentes_tres_objetivos
+# (punto de cruce medido con experiments/benchmark_clasificacion.py); la versión
+# cuadrática compilada con numba compensa hasta poblaciones mayores
+UMBRAL_TRES_OBJETIVOS = 100
+UMBRAL_TRES_OBJETIVOS_NUMBA = 600
+# Filas del primer bloque al buscar el último dominador (se duplica en cada paso)
+TAMANO_BLOQUE_PELADO = 32
+
+
+def umbral_tres_objetivos(numba_activo):
+    """Tamaño mínimo de población para usar frentes_tres_objetivos"""
+    return UMBRAL_TRES_OBJETIVOS_NUMBA if numba_activo else UMBRAL_TRES_OBJETIVOS
+
+
+class _Escalera:
+    """Puntos (f2, f3) no dominados entre sí de un frente, con f2 creciente"""
+    
+    __slots__ = ('f2', 'f3_negado')
+    
+    def __init__(self):
+        self.f2 = []
+        # -f3, creciente, para usar bisect
+        self.f3_negado = []
+    
+    def domina(self, a, b):
+        """Indica si algún punto tiene f2 >= a y f3 >= b"""
+        i = bisect_left(self.f2, a)
+        return i < len(self.f2) and -self.f3_negado[i] >= b
+    
+    def insertar(self, a, b):
+        """Agrega (a, b) y descarta los puntos que quedan dominados en 2D"""
+        f2, f3_negado = self.f2, self.f3_negado
+        i = bisect_left(f2, a)
+        if i < len(f2) and -f3_negado[i] >= b:
+            return
+        fin = i + 1 if i < len(f2) and f2[i] == a else i
+        inicio = bisect_left(f3_negado, -b)
+        del f2[inicio:fin]
+        del f3_negado[inicio:fin]
+        f2.insert(inicio, a)
+        f3_negado.insert(inicio, -b)
+
+
+def matriz_dominancia(fitness_array):
+    """
+    Matriz (n, n) con True donde el punto i domina al j
+    
+    Args:
+        fitness_array: Array (n, num_objetivos)
+    
+    Returns:
+        np.ndarray: Matriz booleana (n, n)
+    """
+    fitness_i = fitness_array[:, None, :]
+    fitness_j = fitness_array[None, :, :]
+    return (fitness_i >= fitness_j).all(axis=2) & (fitness_i > fitness_j).any(axis=2)
+
+
+def rangos_desde_matriz(domina):
+    """
+    Pela los frentes de una matriz de dominancia con operaciones de arrays
+    
+    El número de dominadores de cada punto es la suma de su columna; al asignar
+    un frente se descuentan sus dominados con un producto vector-matriz.
+    
+    Args:
+        domina: Matriz booleana (n, n), domina[i, j] = i domina a j
+    
+    Returns:
+        np.ndarray: Rangos (n,) de tipo int64, 0 = frente de Pareto
+    """
+    n = domina.shape[0]
+    rangos = np.full(n, -1, dtype=np.int64)
+    num_dominadores = domina.sum(axis=0, dtype=np.int64)
+    frente = num_dominadores == 0
+    rango = 0
+    while frente.any():
+        rangos[frente] = rango
+        num_dominadores -= frente.astype(np.int64) @ domina
+        # Los ya asignados quedan en -1 y no vuelven a entrar
+        num_dominadores[frente] = -1
+        frente = num_dominadores == 0
+        rango += 1
+    return rangos
+
+
+def rangos_no_dominados(fitness_array):
+    """
+    Rango (índice de frente) de cada punto, en una sola llamada
+    
+    Usa rangos_tres_objetivos para M = 3 sobre el umbral, el kernel compilado si
+    numba está activo, y si no la matriz de dominancia con rangos_desde_matriz.
+    
+    Args:
+        fitness_array: Array (n, num_objetivos)
+    
+    Returns:
+        np.ndarray: Rangos (n,) de tipo int64, 0 = frente de Pareto
+    """
+    fitness_array = np.asarray(fitness_array, dtype=float)
+    n = fitness_array.shape[0]
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    numba_activo = aceleracion.usar_numba()
+    if fitness_array.shape[1] == 3 and n >= umbral_tres_objetivos(numba_activo):
+        return rangos_tres_objetivos(fitness_array)
+    if numba_activo:
+        orden, inicios = aceleracion.frentes_no_dominados(fitness_array)
+        rangos = np.empty(n, dtype=np.int64)
+        rangos[orden] = np.repeat(np.arange(len(inicios) - 1), np.diff(inicios))
+        return rangos
+    return rangos_desde_matriz(matriz_dominancia(fitness_array))
+
+
+def frentes_desde_rangos(rangos):
+    """
+    Frentes como listas de índices en orden creciente
+    
+    El frente 0 coincide con el de clasificacion_no_dominada; en los demás el
+    orden interno puede diferir (usar frentes_desde_rangos_pelado si importa).
+    
+    Args:
+        rangos: Rango de cada punto (n,)
+    
+    Returns:
+        List[List[int]]: Frentes como listas de índices
+    """
+    rangos = np.asarray(rangos)
+    if len(rangos) == 0:
+        return []
+    miembros = np.argsort(rangos, kind='stable')
+    cortes = np.searchsorted(rangos[miembros], np.arange(int(rangos.max()) + 2))
+    return [miembros[cortes[k]:cortes[k + 1]].tolist() for k in range(len(cortes) - 1)]
+
+
+def rangos_desde_frentes(frentes, n):
+    """
+    Rango de cada índice según una lista de frentes
+    
+    Los índices que no aparecen en ningún frente (p. ej. eliminados del frente 0
+    por el filtro de similitud) reciben el rango del último frente.
+    
+    Args:
+        frentes: Lista de frentes (listas de índices)
+        n: Tamaño de la población
+    
+    Returns:
+        np.ndarray: Rangos (n,) de tipo int64
+    """
+    rangos = np.full(n, max(len(frentes) - 1, 0), dtype=np.int64)
+    for rango, frente in enumerate(frentes):
+        rangos[frente] = rango
+    return rangos
+
+
+def rangos_tres_objetivos(fitness_array):
+    """
+    Rango (índice de frente) de cada punto, para M = 3 y maximización
+    
+    Args:
+        fitness_array: Array (n, 3)
+    
+    Returns:
+        np.ndarray: Rangos (n,) de tipo int64, 0 = frente de Pareto
+    """
+    n = fitness_array.shape[0]
+    rangos = np.zeros(n, dtype=np.int64)
+    if n == 0:
+        return rangos
+    
+    orden = np.lexsort((-fitness_array[:, 2], -fitness_array[:, 1], -fitness_array[:, 0]))
+    ordenado = fitness_array[orden]
+    # Inicio de cada grupo de puntos idénticos (no se dominan entre sí)
+    nuevo_grupo = np.ones(n, dtype=bool)
+    nuevo_grupo[1:] = (ordenado[1:] != ordenado[:-1]).any(axis=1)
+    inicios = np.flatnonzero(nuevo_grupo).tolist()
+    inicios.append(n)
+    
+    f2 = ordenado[:, 1].tolist()
+    f3 = ordenado[:, 2].tolist()
+    escaleras = []
+    for g in range(len(inicios) - 1):
+        inicio = inicios[g]
+        a, b = f2[inicio], f3[inicio]
+        # Primer frente sin dominadores del punto
+        bajo, alto = 0, len(escaleras)
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            if escaleras[medio].domina(a, b):
+                bajo = medio + 1
+            else:
+                alto = medio
+        if bajo == len(escaleras):
+            escaleras.append(_Escalera())
+        escaleras[bajo].insertar(a, b)
+        rangos[orden[inicio:inicios[g + 1]]] = bajo
+    
+    return rangos
+
+
+def _ultimos_dominadores(fitness_anterior, fitness_actual):
+    """
+    Posición del último punto de fitness_anterior que domina a cada punto de
+    fitness_actual (frentes consecutivos: basta la dominancia débil)
+    
+    Se recorre fitness_anterior desde el final en bloques crecientes y cada
+    punto se resuelve en el primer bloque que contiene un dominador.
+    """
+    if aceleracion.usar_numba():
+        return aceleracion.ultimos_dominadores(fitness_anterior, fitness_actual)
+    
+    ultimos = np.full(len(fitness_actual), -1, dtype=np.int64)
+    pendientes = np.arange(len(fitness_actual))
+    fin = len(fitness_anterior)
+    tamano = TAMANO_BLOQUE_PELADO
+    while len(pendientes) and fin > 0:
+        inicio = max(0, fin - tamano)
+        domina = (
+            fitness_anterior[inicio:fin, None, :] >= fitness_actual[None, pendientes, :]
+        ).all(axis=2)
+        resueltos = domina.any(axis=0)
+        # Última fila con True de cada columna resuelta
+        ultimos[pendientes[resueltos]] = fin - 1 - np.argmax(domina[::-1, resueltos], axis=0)
+        pendientes = pendientes[~resueltos]
+        fin = inicio
+        tamano *= 2
+    return ultimos
+
+
+def frentes_desde_rangos_pelado(fitness_array, rangos, domina=None):
+    """
+    Frentes con el mismo orden interno que el pelado de clasificacion_no_dominada
+    
+    En el pelado original, j entra al frente k + 1 al procesar su último
+    dominador del frente k (en el orden de ese frente), y los dominados de cada
+    punto se recorren en orden creciente de índice.
+    
+    Args:
+        fitness_array: Array (n, num_objetivos)
+        rangos: Rango de cada punto (n,)
+        domina: Matriz de dominancia (n, n) ya calculada, o None
+    
+    Returns:
+        List[List[int]]: Frentes como listas de índices
+    """
+    if len(rangos) == 0:
+        return []
+    num_frentes = int(rangos.max()) + 1
+    # Índices de cada frente en orden creciente
+    miembros = np.argsort(rangos, kind='stable')
+    cortes = np.searchsorted(rangos[miembros], np.arange(num_frentes + 1))
+    
+    frentes = [miembros[cortes[0]:cortes[1]]]
+    for k in range(1, num_frentes):
+        anterior = frentes[-1]
+        actual = miembros[cortes[k]:cortes[k + 1]]
+        if domina is None:
+            ultimo = _ultimos_dominadores(fitness_array[anterior], fitness_array[actual])
+        else:
+            submatriz = domina[np.ix_(anterior, actual)]
+            ultimo = len(anterior) - 1 - np.argmax(submatriz[::-1], axis=0)
+        frentes.append(actual[np.argsort(ultimo, kind='stable')])
+    
+    return [frente.tolist() for frente in frentes]
+
+
+def frentes_tres_objetivos(fitness_array):
+    """
+    Clasificación no dominada para M = 3 (maximización), equivalente a
+    clasificacion_no_dominada (mismos frentes, mismo orden)
+    
+    Args:
+        fitness_array: Array (n, 3)
+    
+    Returns:
+        List[List[int]]: Lista de frentes (cada frente es lista de índices)
+    """
+    fitness_array = np.asarray(fitness_array, dtype=float)
+    rangos = rangos_tres_objetivos(fitness_array)
+    return frentes_desde_rangos_pelado(fitness_array, rangos)
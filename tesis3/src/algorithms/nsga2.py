@@ -1,9 +1,21 @@
 
 """Implementación de NSGA-II para optimización multiobjetivo"""
+import heapq
 import random
 import numpy as np
-from tesis3.src.fitness.multi_objective import fitness_multiobjetivo
+from tesis3.src.fitness.cache import CacheFitness
+from tesis3.src.fitness.multi_objective import evaluar_individuos
 from tesis3.src.utils.population import inicializar_poblacion
+from tesis3.src.utils.seeds import generador_numpy
+from tesis3.src.utils import aceleracion
+from tesis3.src.algorithms.no_dominados import (
+    frentes_desde_rangos_pelado,
+    frentes_tres_objetivos,
+    matriz_dominancia,
+    rangos_desde_frentes,
+    rangos_desde_matriz,
+    umbral_tres_objetivos,
+)
 
 """
 Analizar el cruding distance dentro del nsga2 memetico
@@ -27,167 +39,217 @@ def convertir_fitness_a_metricas(fitness):
     return makespan, balance, energia
 
 
-def filtrar_soluciones_similares(poblacion, fitness_poblacion, epsilon=0.01):
+def evaluar_con_cache(individuos, config, fitness_cache, evaluador=None):
+    """
+    Obtiene el fitness de una lista de individuos usando el cache
+    Los individuos que no están en cache se evalúan juntos en una sola llamada vectorizada
+    
+    Args:
+        individuos: Lista de Chromosome
+        config: ProblemConfig
+        fitness_cache: CacheFitness (o dict) clave -> fitness; se actualiza con
+            las nuevas evaluaciones
+        evaluador: EvaluadorParalelo para los individuos sin cache, o None
+            (evaluar_individuos en este proceso)
+    
+    Returns:
+        List[tuple]: Fitness de cada individuo (mismo orden que individuos)
     """
-    Filtra soluciones similares del frente de Pareto manteniendo solo soluciones únicas dominantes.
-    Versión ultra-optimizada usando grid espacial para reducir complejidad de O(n²) a ~O(n).
+    claves = [ind.clave for ind in individuos]
+    
+    # Resultados locales: un cache acotado puede desalojar claves de este mismo lote
+    resultados = {}
+    pendientes = {}
+    for ind, clave in zip(individuos, claves):
+        if clave in resultados or clave in pendientes:
+            continue
+        fitness = fitness_cache.get(clave)
+        if fitness is None:
+            pendientes[clave] = ind
+        else:
+            resultados[clave] = fitness
+    
+    # Segundo nivel (memo compartido / almacén persistente): consulta en lote
+    respaldo = getattr(fitness_cache, 'respaldo', None)
+    if pendientes and respaldo is not None:
+        encontrados = respaldo.buscar_lote(pendientes.keys())
+        for clave, fitness in encontrados.items():
+            del pendientes[clave]
+            fitness_cache[clave] = fitness
+            resultados[clave] = fitness
+        fitness_cache.aciertos_respaldo += len(encontrados)
+    
+    if pendientes:
+        if evaluador is not None:
+            nuevos = evaluador.evaluar(list(pendientes.values()))
+        else:
+            nuevos = evaluar_individuos(list(pendientes.values()), config)
+        for clave, fitness in zip(pendientes.keys(), nuevos):
+            fitness_cache[clave] = fitness
+            resultados[clave] = fitness
+        if respaldo is not None:
+            respaldo.guardar_lote(dict(zip(pendientes.keys(), nuevos)))
+    
+    return [resultados[clave] for clave in claves]
+
+
+# Desplazamientos de las 27 celdas vecinas (incluida la propia), en el orden de recorrido
+_VECINOS_GRID = [(dm, db, de) for dm in (-1, 0, 1) for db in (-1, 0, 1) for de in (-1, 0, 1)]
+
+
+def mascara_soluciones_similares(fitness_array, epsilon=0.01):
+    """
+    Máscara de soluciones a mantener al filtrar soluciones similares
+    Versión vectorizada con grid espacial: hashing de celdas con NumPy y
+    comparaciones solo entre pares de celdas vecinas.
     
     Si dos soluciones son muy similares (distancia normalizada < epsilon), se elimina:
     1. La dominada (si una domina a la otra)
     2. La peor en términos generales (si ninguna domina pero son muy similares)
+    Los pares se resuelven en orden (índice, celda vecina, índice del vecino).
     
     Args:
-        poblacion: Lista de Chromosome
-        fitness_poblacion: Lista de tuplas de fitness (objetivos a maximizar)
+        fitness_array: Array (n, 3) de objetivos a maximizar
         epsilon: Umbral de similitud (por defecto 0.01 = 1%)
     
     Returns:
-        tuple: (poblacion_filtrada, fitness_filtrado) con soluciones únicas dominantes
+        np.ndarray: Máscara booleana (n,), True = mantener
     """
-    if len(poblacion) <= 1:
-        return poblacion, fitness_poblacion
+    fitness_array = np.asarray(fitness_array, dtype=float)
+    n = len(fitness_array)
+    mantener = np.ones(n, dtype=bool)
     
     # Optimización: si el frente es pequeño, no filtrar (ahorro de tiempo)
-    if len(poblacion) <= 20:
-        return poblacion, fitness_poblacion
+    if n <= 20:
+        return mantener
     
     # Optimización: si el frente es muy grande, usar epsilon más estricto para reducir más
-    if len(poblacion) > 50:
+    if n > 50:
         epsilon_efectivo = epsilon * 0.8  # 20% más estricto para frentes grandes
     else:
         epsilon_efectivo = epsilon
     
-    # OPTIMIZACIÓN: Vectorizar conversión de fitness a métricas usando NumPy
-    fitness_array = np.array(fitness_poblacion)
-    
-    # Vectorizar conversión: makespan = 1/obj_mk, balance = 1/obj_bal - 1, energia = 1/obj_eng - 1
+    # Conversión a métricas: makespan = 1/obj_mk, balance = 1/obj_bal - 1, energia = 1/obj_eng - 1
     # Evitar división por cero
-    makespans = np.where(fitness_array[:, 0] > 0, 1.0 / fitness_array[:, 0], np.inf)
-    balances = np.where(fitness_array[:, 1] > 0, 1.0 / fitness_array[:, 1] - 1.0, np.inf)
-    energias = np.where(fitness_array[:, 2] > 0, 1.0 / fitness_array[:, 2] - 1.0, np.inf)
-    
-    # Calcular rangos de cada objetivo para normalización (vectorizado)
-    rango_mk = np.ptp(makespans) if np.ptp(makespans) > 0 else 1.0
-    rango_bal = np.ptp(balances) if np.ptp(balances) > 0 else 1.0
-    rango_eng = np.ptp(energias) if np.ptp(energias) > 0 else 1.0
-    
-    # OPTIMIZACIÓN: Usar grid espacial para agrupar soluciones similares
-    # Dividir el espacio en celdas de tamaño epsilon para comparar solo vecinos cercanos
+    with np.errstate(divide='ignore'):
+        metricas = np.column_stack([
+            np.where(fitness_array[:, 0] > 0, 1.0 / fitness_array[:, 0], np.inf),
+            np.where(fitness_array[:, 1] > 0, 1.0 / fitness_array[:, 1] - 1.0, np.inf),
+            np.where(fitness_array[:, 2] > 0, 1.0 / fitness_array[:, 2] - 1.0, np.inf),
+        ])
+    
+    # Rangos de cada objetivo para normalización
+    rangos = np.ptp(metricas, axis=0)
+    rangos = np.where(rangos > 0, rangos, 1.0)
+    
+    # Grid espacial: celdas de tamaño epsilon sobre las métricas normalizadas
     num_celdas = max(10, int(1.0 / epsilon_efectivo))  # Al menos 10 celdas
-    grid = {}
-    
-    # OPTIMIZACIÓN: Vectorizar cálculo de scores normalizados
-    # Normalizar cada objetivo y sumar
-    obj_norm = fitness_array / np.maximum(np.abs(fitness_array), 1e-10)
-    scores_normalizados = np.sum(obj_norm, axis=1)
-    
-    # OPTIMIZACIÓN: Vectorizar normalización y cálculo de celdas
-    # Normalizar métricas
-    mk_min, bal_min, eng_min = makespans.min(), balances.min(), energias.min()
-    mk_norm = np.where(rango_mk > 0, (makespans - mk_min) / rango_mk, 0)
-    bal_norm = np.where(rango_bal > 0, (balances - bal_min) / rango_bal, 0)
-    eng_norm = np.where(rango_eng > 0, (energias - eng_min) / rango_eng, 0)
-    
-    # Discretizar a celdas (vectorizado)
-    celdas_mk = (mk_norm * num_celdas).astype(int)
-    celdas_bal = (bal_norm * num_celdas).astype(int)
-    celdas_eng = (eng_norm * num_celdas).astype(int)
-    
-    # Asignar soluciones a celdas del grid
-    for i in range(len(poblacion)):
-        celda_key = (celdas_mk[i], celdas_bal[i], celdas_eng[i])
-        if celda_key not in grid:
-            grid[celda_key] = []
-        grid[celda_key].append(i)
-    
-    # Pre-calcular celdas para uso en el bucle de filtrado
-    celdas_soluciones = list(zip(celdas_mk, celdas_bal, celdas_eng))
-    
-    indices_eliminar = set()
-    indices_mantener = []
-    epsilon_sq = epsilon_efectivo ** 2
-    
-    for i in range(len(poblacion)):
-        if i in indices_eliminar:
+    celdas = ((metricas - metricas.min(axis=0)) / rangos * num_celdas).astype(np.int64)
+    
+    # Código entero de cada celda (desplazado en 1 para que los vecinos no sean negativos)
+    base = num_celdas + 3
+    codigos = ((celdas[:, 0] + 1) * base + (celdas[:, 1] + 1)) * base + (celdas[:, 2] + 1)
+    orden = np.argsort(codigos, kind='stable')
+    codigos_ordenados = codigos[orden]
+    
+    # Pares candidatos (i < j) en celdas vecinas
+    pares_i, pares_j, pares_vecino = [], [], []
+    indices = np.arange(n)
+    for num_vecino, (dm, db, de) in enumerate(_VECINOS_GRID):
+        vecinos = codigos + (dm * base + db) * base + de
+        inicio = np.searchsorted(codigos_ordenados, vecinos, side='left')
+        fin = np.searchsorted(codigos_ordenados, vecinos, side='right')
+        cantidad = fin - inicio
+        total = int(cantidad.sum())
+        if total == 0:
             continue
-        
-        # OPTIMIZACIÓN: Usar arrays NumPy para acceso más rápido
-        mk_i, bal_i, eng_i = makespans[i], balances[i], energias[i]
-        obj_i = fitness_poblacion[i]
-        i_eliminado = False
-        
-        celda_mk_i, celda_bal_i, celda_eng_i = celdas_soluciones[i]
-        
-        # Comparar solo con soluciones en celdas adyacentes (máximo 27 celdas: 3x3x3)
-        # OPTIMIZACIÓN: Usar set para evitar duplicados y comparaciones innecesarias
-        celdas_visitadas = set()
-        for dm in [-1, 0, 1]:
-            for db in [-1, 0, 1]:
-                for de in [-1, 0, 1]:
-                    celda_key = (celda_mk_i + dm, celda_bal_i + db, celda_eng_i + de)
-                    if celda_key in celdas_visitadas or celda_key not in grid:
-                        continue
-                    celdas_visitadas.add(celda_key)
-                    
-                    for j in grid[celda_key]:
-                        if j <= i or j in indices_eliminar or i_eliminado:
-                            continue
-                        
-                        # OPTIMIZACIÓN: Usar arrays NumPy para acceso más rápido
-                        mk_j, bal_j, eng_j = makespans[j], balances[j], energias[j]
-                        
-                        # OPTIMIZACIÓN: Vectorizar verificación rápida de similitud
-                        diff_mk_norm = abs(mk_i - mk_j) / rango_mk if rango_mk > 0 else 0
-                        if diff_mk_norm > epsilon_efectivo:  # Early exit si diferencia grande
-                            continue
-                        
-                        diff_bal_norm = abs(bal_i - bal_j) / rango_bal if rango_bal > 0 else 0
-                        if diff_bal_norm > epsilon_efectivo:  # Early exit
-                            continue
-                        
-                        diff_eng_norm = abs(eng_i - eng_j) / rango_eng if rango_eng > 0 else 0
-                        if diff_eng_norm > epsilon_efectivo:  # Early exit
-                            continue
-                        
-                        distancia_sq = diff_mk_norm**2 + diff_bal_norm**2 + diff_eng_norm**2
-                        
-                        if distancia_sq <= epsilon_sq:
-                            obj_j = fitness_poblacion[j]
-                            
-                            # Verificar dominancia
-                            i_domina_j = dominancia(obj_i, obj_j)
-                            if i_domina_j:
-                                indices_eliminar.add(j)
-                                continue
-                            
-                            j_domina_i = dominancia(obj_j, obj_i)
-                            if j_domina_i:
-                                indices_eliminar.add(i)
-                                i_eliminado = True
-                                break
-                            
-                            # Ninguna domina, usar scores pre-calculados
-                            if scores_normalizados[i] >= scores_normalizados[j]:
-                                indices_eliminar.add(j)
-                            else:
-                                indices_eliminar.add(i)
-                                i_eliminado = True
-                                break
-                    
-                    if i_eliminado:
-                        break
-                if i_eliminado:
-                    break
-            if i_eliminado:
-                break
-        
-        if not i_eliminado and i not in indices_eliminar:
-            indices_mantener.append(i)
+        i = np.repeat(indices, cantidad)
+        posicion = np.arange(total) - np.repeat(np.cumsum(cantidad) - cantidad, cantidad)
+        j = orden[np.repeat(inicio, cantidad) + posicion]
+        superiores = j > i
+        pares_i.append(i[superiores])
+        pares_j.append(j[superiores])
+        pares_vecino.append(np.full(np.count_nonzero(superiores), num_vecino))
+    
+    if not pares_i:
+        return mantener
+    i = np.concatenate(pares_i)
+    j = np.concatenate(pares_j)
+    vecino = np.concatenate(pares_vecino)
+    
+    # Similitud: cada diferencia normalizada <= epsilon y distancia euclídea <= epsilon
+    diferencias = np.abs(metricas[i] - metricas[j]) / rangos
+    distancia_sq = diferencias[:, 0]**2 + diferencias[:, 1]**2 + diferencias[:, 2]**2
+    similares = (diferencias <= epsilon_efectivo).all(axis=1) & (
+        distancia_sq <= epsilon_efectivo ** 2
+    )
+    i, j, vecino = i[similares], j[similares], vecino[similares]
+    if len(i) == 0:
+        return mantener
+    
+    # Orden de resolución del filtro: por i, luego celda vecina, luego j
+    orden_pares = np.lexsort((j, vecino, i))
+    i, j = i[orden_pares], j[orden_pares]
+    
+    fitness_i, fitness_j = fitness_array[i], fitness_array[j]
+    i_domina_j = (fitness_i >= fitness_j).all(axis=1) & (fitness_i > fitness_j).any(axis=1)
+    j_domina_i = (fitness_j >= fitness_i).all(axis=1) & (fitness_j > fitness_i).any(axis=1)
+    # Ninguna domina: se mantiene la de mayor score normalizado
+    scores = np.sum(fitness_array / np.maximum(np.abs(fitness_array), 1e-10), axis=1)
+    i_mejor_score = scores[i] >= scores[j]
+    
+    eliminado = [False] * n
+    for a, b, a_domina, b_domina, a_mejor in zip(
+        i.tolist(), j.tolist(), i_domina_j.tolist(), j_domina_i.tolist(), i_mejor_score.tolist()
+    ):
+        if eliminado[a] or eliminado[b]:
+            continue
+        if a_domina:
+            eliminado[b] = True
+        elif b_domina or not a_mejor:
+            eliminado[a] = True
+        else:
+            eliminado[b] = True
     
-    # Filtrar poblaciones
-    poblacion_filtrada = [poblacion[i] for i in indices_mantener]
-    fitness_filtrado = [fitness_poblacion[i] for i in indices_mantener]
+    mantener[np.array(eliminado)] = False
+    return mantener
+
+
+def filtrar_indices_similares(indices, fitness_poblacion, epsilon=0.01):
+    """
+    Índices que sobreviven al filtro de similitud (en el orden de indices)
+    
+    Args:
+        indices: Índices de la población a filtrar (p. ej. el frente 0)
+        fitness_poblacion: Fitness de toda la población
+        epsilon: Umbral de similitud
+    
+    Returns:
+        List[int]: Subconjunto de indices a mantener
+    """
+    mantener = mascara_soluciones_similares([fitness_poblacion[i] for i in indices], epsilon)
+    return [idx for idx, m in zip(indices, mantener.tolist()) if m]
+
+
+def filtrar_soluciones_similares(poblacion, fitness_poblacion, epsilon=0.01):
+    """
+    Filtra soluciones similares del frente de Pareto manteniendo solo soluciones únicas dominantes
+    (ver mascara_soluciones_similares)
+    
+    Args:
+        poblacion: Lista de Chromosome
+        fitness_poblacion: Lista de tuplas de fitness (objetivos a maximizar)
+        epsilon: Umbral de similitud (por defecto 0.01 = 1%)
+    
+    Returns:
+        tuple: (poblacion_filtrada, fitness_filtrado) con soluciones únicas dominantes
+    """
+    if len(poblacion) <= 20:
+        return poblacion, fitness_poblacion
     
+    mantener = mascara_soluciones_similares(fitness_poblacion, epsilon).tolist()
+    poblacion_filtrada = [ind for ind, m in zip(poblacion, mantener) if m]
+    fitness_filtrado = [fit for fit, m in zip(fitness_poblacion, mantener) if m]
     return poblacion_filtrada, fitness_filtrado
 
 
@@ -221,57 +283,32 @@ def clasificacion_no_dominada(poblacion, fitness_poblacion):
         return []
     
     # OPTIMIZACIÓN: Convertir a array NumPy para operaciones vectorizadas
-    fitness_array = np.array(fitness_poblacion)
-    
-    # OPTIMIZACIÓN: Calcular dominancia usando broadcasting de NumPy
-    # Comparar todos los pares simultáneamente
-    # fitness_array[i] >= fitness_array[j] para todos los objetivos
-    # fitness_array[i] > fitness_array[j] en al menos un objetivo
-    
-    # Crear matrices de comparación usando broadcasting
-    # Shape: (n, n, num_objetivos)
-    fitness_i = fitness_array[:, None, :]  # (n, 1, num_objetivos)
-    fitness_j = fitness_array[None, :, :]  # (1, n, num_objetivos)
-    
-    # i domina j si: i >= j en todos los objetivos Y i > j en al menos uno
-    no_peor_en_todos = (fitness_i >= fitness_j).all(axis=2)  # (n, n)
-    mejor_en_alguno = (fitness_i > fitness_j).any(axis=2)    # (n, n)
-    i_domina_j = no_peor_en_todos & mejor_en_alguno  # (n, n)
-    
-    # Construir estructuras de datos para clasificación
-    dominados_por = [[] for _ in range(n)]
-    num_dominados = [0] * n
-    
-    # OPTIMIZACIÓN: Usar índices de NumPy en lugar de bucles anidados
-    for i in range(n):
-        # Encontrar todos los j que i domina
-        dominados = np.where(i_domina_j[i, :])[0]
-        for j in dominados:
-            if i != j:  # Evitar auto-dominancia
-                dominados_por[i].append(j)
-                num_dominados[j] += 1
-    
-    # Construir frentes
-    frentes = [[]]
-    for i in range(n):
-        if num_dominados[i] == 0:
-            frentes[0].append(i)
-    
-    k = 0
-    while frentes[k]:
-        siguiente_frente = []
-        for i in frentes[k]:
-            for j in dominados_por[i]:
-                num_dominados[j] -= 1
-                if num_dominados[j] == 0:
-                    siguiente_frente.append(j)
-        k += 1
-        if siguiente_frente:
-            frentes.append(siguiente_frente)
-        else:
-            break
+    fitness_array = np.array(fitness_poblacion, dtype=float)
+    
+    # Poblaciones grandes con 3 objetivos: O(N log² N) en lugar de la matriz n x n
+    if fitness_array.shape[1] == 3 and n >= umbral_tres_objetivos(aceleracion.usar_numba()):
+        return frentes_tres_objetivos(fitness_array)
     
-    return frentes[:-1] if not frentes[-1] else frentes
+    return _clasificacion_cuadratica(fitness_array)
+
+
+def _clasificacion_cuadratica(fitness_array):
+    """
+    Clasificación con la matriz de dominancia n x n (numba o NumPy)
+    
+    Returns:
+        List[List[int]]: Lista de frentes (cada frente es lista de índices)
+    """
+    # Backend compilado (mismo resultado y mismo orden de índices en cada frente)
+    if aceleracion.usar_numba():
+        orden, inicios = aceleracion.frentes_no_dominados(fitness_array)
+        return [orden[inicios[k]:inicios[k + 1]].tolist() for k in range(len(inicios) - 1)]
+    
+    # OPTIMIZACIÓN: Matriz de dominancia por broadcasting y pelado de frentes
+    # con operaciones matriz-vector (sin listas de dominados por individuo)
+    i_domina_j = matriz_dominancia(fitness_array)
+    rangos = rangos_desde_matriz(i_domina_j)
+    return frentes_desde_rangos_pelado(fitness_array, rangos, i_domina_j)
 
 
 def distancia_crowding(fitness_frente):
@@ -287,7 +324,12 @@ def distancia_crowding(fitness_frente):
         return [float('inf')] * n
     
     # OPTIMIZACIÓN: Convertir a array NumPy para operaciones vectorizadas
-    fitness_array = np.array(fitness_frente)
+    fitness_array = np.array(fitness_frente, dtype=float)
+    
+    # Backend compilado (el ordenamiento se hace con NumPy para desempatar igual)
+    if aceleracion.usar_numba():
+        indices_ordenados = np.argsort(fitness_array, axis=0)
+        return aceleracion.distancias_crowding(fitness_array, indices_ordenados).tolist()
     num_objetivos = fitness_array.shape[1]
     distancias = np.zeros(n)
     
@@ -318,7 +360,119 @@ def distancia_crowding(fitness_frente):
     return distancias.tolist()
 
 
-def seleccion_nsga2(poblacion, fitness_poblacion, tamano_seleccion, epsilon_filtro=0.0):
+def indices_mayor_crowding(distancias, k):
+    """
+    Índices de las k mayores distancias, de mayor a menor
+    
+    Equivale a sorted(range(n), key=distancias, reverse=True)[:k] (los empates
+    quedan en orden de índice), pero con np.argpartition solo se ordenan los k
+    elegidos.
+    
+    Args:
+        distancias: Distancias de crowding (n,)
+        k: Número de índices a devolver
+    
+    Returns:
+        np.ndarray: Índices (k,)
+    """
+    distancias = np.asarray(distancias, dtype=float)
+    n = len(distancias)
+    k = min(k, n)
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if k < n:
+        # Valor de corte: la k-ésima mayor distancia
+        corte = distancias[np.argpartition(-distancias, k - 1)[k - 1]]
+        mayores = np.flatnonzero(distancias > corte)
+        # Entre los empatados en el corte entran los de menor índice
+        empatados = np.flatnonzero(distancias == corte)[:k - len(mayores)]
+        candidatos = np.concatenate([mayores, empatados])
+    else:
+        candidatos = np.arange(n)
+    return candidatos[np.lexsort((candidatos, -distancias[candidatos]))]
+
+
+def truncar_por_crowding_iterativo(fitness_frente, k):
+    """
+    Elige k soluciones de un frente quitando una a una la de menor crowding
+    y recalculando solo el crowding de sus vecinas (O(n log n) con un heap)
+    
+    Los vecinos de cada objetivo se mantienen como listas doblemente enlazadas
+    sobre el orden inicial; los rangos de normalización son los del frente
+    completo. A igual crowding se elimina primero el de mayor índice.
+    
+    Args:
+        fitness_frente: Lista de tuplas de fitness del frente
+        k: Número de soluciones a conservar
+    
+    Returns:
+        np.ndarray: Índices conservados (k,), de mayor a menor crowding final
+    """
+    fitness_array = np.array(fitness_frente, dtype=float)
+    n = len(fitness_array)
+    if k >= n or n <= 2:
+        return indices_mayor_crowding(distancia_crowding(fitness_frente), k)
+    
+    num_objetivos = fitness_array.shape[1]
+    orden = np.argsort(fitness_array, axis=0, kind='stable')
+    anterior = np.full((num_objetivos, n), -1, dtype=np.int64)
+    siguiente = np.full((num_objetivos, n), -1, dtype=np.int64)
+    for m in range(num_objetivos):
+        anterior[m, orden[1:, m]] = orden[:-1, m]
+        siguiente[m, orden[:-1, m]] = orden[1:, m]
+    rangos = fitness_array[orden[-1], np.arange(num_objetivos)] - fitness_array[
+        orden[0], np.arange(num_objetivos)
+    ]
+    fitness_lista = fitness_array.T.tolist()
+    rangos = rangos.tolist()
+    anterior_lista = anterior.tolist()
+    siguiente_lista = siguiente.tolist()
+    
+    def crowding(i):
+        total = 0.0
+        for m in range(num_objetivos):
+            a, s = anterior_lista[m][i], siguiente_lista[m][i]
+            if a < 0 or s < 0:
+                return float('inf')
+            if rangos[m] > 0:
+                total += (fitness_lista[m][s] - fitness_lista[m][a]) / rangos[m]
+        return total
+    
+    distancias = [crowding(i) for i in range(n)]
+    heap = [(d, -i) for i, d in enumerate(distancias)]
+    heapq.heapify(heap)
+    vivo = [True] * n
+    restantes = n
+    while restantes > k:
+        d, i = heapq.heappop(heap)
+        i = -i
+        # Entradas obsoletas (ya eliminadas o con crowding desactualizado)
+        if not vivo[i] or d != distancias[i]:
+            continue
+        vivo[i] = False
+        restantes -= 1
+        vecinos = set()
+        for m in range(num_objetivos):
+            a, s = anterior_lista[m][i], siguiente_lista[m][i]
+            if a >= 0:
+                siguiente_lista[m][a] = s
+                vecinos.add(a)
+            if s >= 0:
+                anterior_lista[m][s] = a
+                vecinos.add(s)
+        for j in vecinos:
+            nueva = crowding(j)
+            if nueva != distancias[j]:
+                distancias[j] = nueva
+                heapq.heappush(heap, (nueva, -j))
+    
+    conservados = np.flatnonzero(vivo)
+    distancias_finales = np.array(distancias)[conservados]
+    return conservados[np.lexsort((conservados, -distancias_finales))]
+
+
+def seleccion_nsga2(poblacion, fitness_poblacion, tamano_seleccion, epsilon_filtro=0.0,
+                    crowding_iterativo=False):
     """
     Selección basada en frentes y crowding distance
     
@@ -328,6 +482,9 @@ def seleccion_nsga2(poblacion, fitness_poblacion, tamano_seleccion, epsilon_filt
         tamano_seleccion: Tamaño de población a seleccionar
         epsilon_filtro: Si > 0, aplica filtro de similitud al frente de Pareto
             (por defecto 0.0 = desactivado)
+        crowding_iterativo: Si True, el último frente se trunca con
+            truncar_por_crowding_iterativo (mejor dispersión); si False, se
+            toman las k mayores distancias de crowding
     
     Returns:
         List[Chromosome]: Población seleccionada
@@ -339,67 +496,38 @@ def seleccion_nsga2(poblacion, fitness_poblacion, tamano_seleccion, epsilon_filt
         # Aplicar filtro al primer frente SIEMPRE si está activado (no condicional)
         # Esto previene que el frente se rellene con soluciones similares
         if len(frente_idx) > 0 and epsilon_filtro > 0 and len(seleccionados) == 0:
-            frente_original = [poblacion[i] for i in frente_idx]
-            fitness_frente = [fitness_poblacion[i] for i in frente_idx]
-            
-            # Filtrar soluciones similares del frente de Pareto (optimizado con grid espacial)
-            frente_filtrado, fitness_filtrado = filtrar_soluciones_similares(
-                frente_original, fitness_frente, epsilon_filtro
-            )
-            
-            # Crear mapeo de índices filtrados a índices originales (optimizado con dict)
-            genes_filtrados = {
-                tuple(tuple(row) for row in sol.genes) for sol in frente_filtrado
-            }
-            frente_idx_filtrado = [
-                idx
-                for idx in frente_idx
-                if tuple(tuple(row) for row in poblacion[idx].genes)
-                in genes_filtrados
-            ]
-            
-            frente_idx = frente_idx_filtrado
+            # Filtrar soluciones similares del frente de Pareto (máscara con grid espacial)
+            frente_idx = filtrar_indices_similares(frente_idx, fitness_poblacion, epsilon_filtro)
         
         if len(seleccionados) + len(frente_idx) <= tamano_seleccion:
             seleccionados.extend([poblacion[i] for i in frente_idx])
         else:
             fitness_frente = [fitness_poblacion[i] for i in frente_idx]
-            distancias = distancia_crowding(fitness_frente)
-            
-            indices_ordenados = sorted(range(len(frente_idx)), 
-                                      key=lambda i: distancias[i], 
-                                      reverse=True)
-            
             faltantes = tamano_seleccion - len(seleccionados)
-            for i in range(faltantes):
-                idx_original = frente_idx[indices_ordenados[i]]
-                seleccionados.append(poblacion[idx_original])
+            if crowding_iterativo:
+                elegidos = truncar_por_crowding_iterativo(fitness_frente, faltantes)
+            else:
+                elegidos = indices_mayor_crowding(distancia_crowding(fitness_frente), faltantes)
+            
+            frente_array = np.asarray(frente_idx)
+            seleccionados.extend(poblacion[i] for i in frente_array[elegidos].tolist())
             break
     
     return seleccionados
 
 
-def torneo_binario_nsga2(poblacion, fitness_poblacion, frentes):
+def torneo_binario_nsga2(poblacion, fitness_poblacion, rangos):
     """
     Selecciona un individuo mediante torneo binario
-    Criterio: mejor frente, luego mayor crowding distance
+    Criterio: mejor frente, luego dominancia (ver torneo_binario_lote para la
+    comparación por crowding distance)
+    
+    Args:
+        rangos: Rango de frente de cada individuo (ver rangos_desde_frentes)
     """
     idx1, idx2 = random.sample(range(len(poblacion)), 2)
-    
-    # Encontrar el frente de cada índice de forma segura
-    frente1 = None
-    frente2 = None
-    for i, f in enumerate(frentes):
-        if idx1 in f:
-            frente1 = i
-        if idx2 in f:
-            frente2 = i
-    
-    # Si algún índice no está en ningún frente, usar el último frente
-    if frente1 is None:
-        frente1 = len(frentes) - 1 if frentes else 0
-    if frente2 is None:
-        frente2 = len(frentes) - 1 if frentes else 0
+    frente1 = rangos[idx1]
+    frente2 = rangos[idx2]
     
     if frente1 != frente2:
         return poblacion[idx1] if frente1 < frente2 else poblacion[idx2]
@@ -410,11 +538,195 @@ def torneo_binario_nsga2(poblacion, fitness_poblacion, frentes):
         return poblacion[idx2]
 
 
+def frentes_vigentes(poblacion, claves_clasificadas):
+    """
+    Indica si los frentes calculados para claves_clasificadas siguen
+    correspondiendo a la población (mismos individuos en el mismo orden)
+    
+    Args:
+        poblacion: Lista de Chromosome
+        claves_clasificadas: Claves de la población al clasificar, o None si
+            los frentes se modificaron después (p. ej. por el filtro de similitud)
+    """
+    if claves_clasificadas is None or len(claves_clasificadas) != len(poblacion):
+        return False
+    return all(ind.clave == clave for ind, clave in zip(poblacion, claves_clasificadas))
+
+
+def actualizar_archivo(archivo, poblacion, fitness_poblacion):
+    """Inserta la población evaluada en el archivo de Pareto (si hay archivo)"""
+    if archivo is None:
+        return
+    for ind, fit in zip(poblacion, fitness_poblacion):
+        archivo.insertar(ind, fit)
+
+
+def crowding_por_frentes(fitness_poblacion, frentes, n):
+    """
+    Distancia de crowding de cada individuo, calculada dentro de su frente
+    
+    Args:
+        fitness_poblacion: Lista de tuplas de fitness
+        frentes: Lista de frentes (listas de índices)
+        n: Tamaño de la población
+    
+    Returns:
+        np.ndarray: Crowding (n,); 0 para los índices que no están en ningún frente
+    """
+    crowding = np.zeros(n)
+    for frente in frentes:
+        if frente:
+            crowding[frente] = distancia_crowding([fitness_poblacion[i] for i in frente])
+    return crowding
+
+
+def torneo_binario_lote(rangos, crowding, num_padres, rng):
+    """
+    Torneos binarios de toda una generación en una sola operación vectorizada
+    Comparación por crowding: gana el de menor rango; a igual rango, el de mayor
+    crowding distance; si también empatan, el primer competidor
+    
+    Args:
+        rangos: Rango de frente de cada individuo (n,)
+        crowding: Crowding distance de cada individuo (n,)
+        num_padres: Número de torneos (padres a seleccionar)
+        rng: np.random.Generator
+    
+    Returns:
+        np.ndarray: Índices de los padres seleccionados (num_padres,)
+    """
+    rangos = np.asarray(rangos)
+    crowding = np.asarray(crowding)
+    n = len(rangos)
+    # Parejas de competidores distintos, uniformes como random.sample(range(n), 2)
+    competidor1 = rng.integers(0, n, size=num_padres)
+    competidor2 = (competidor1 + rng.integers(1, n, size=num_padres)) % n
+    
+    rango1, rango2 = rangos[competidor1], rangos[competidor2]
+    gana_primero = (rango1 < rango2) | (
+        (rango1 == rango2) & (crowding[competidor1] >= crowding[competidor2])
+    )
+    return np.where(gana_primero, competidor1, competidor2)
+
+
+def generar_descendencia(poblacion, fitness_poblacion, frentes, rangos, tamano_poblacion,
+                         config, metodo_cruce, prob_cruce, rng=None):
+    """
+    Cruza padres elegidos por torneo binario hasta completar tamano_poblacion hijos
+    
+    Args:
+        frentes: Frentes de la población (para el crowding del torneo en lote)
+        rangos: Rango de frente de cada individuo
+        rng: np.random.Generator para torneo_binario_lote, o None para el
+            torneo clásico (dos torneo_binario_nsga2 por cruce)
+    
+    Returns:
+        List[Chromosome]: Descendencia (puede tener un hijo de más)
+    """
+    descendencia = []
+    if rng is None:
+        while len(descendencia) < tamano_poblacion:
+            padre1 = torneo_binario_nsga2(poblacion, fitness_poblacion, rangos)
+            padre2 = torneo_binario_nsga2(poblacion, fitness_poblacion, rangos)
+            
+            hijo1, hijo2 = metodo_cruce(padre1, padre2, config, prob_cruce)
+            descendencia.extend([hijo1, hijo2])
+        return descendencia
+    
+    crowding = crowding_por_frentes(fitness_poblacion, frentes, len(poblacion))
+    num_padres = 2 * ((tamano_poblacion + 1) // 2)
+    padres = torneo_binario_lote(rangos, crowding, num_padres, rng).tolist()
+    for i in range(0, num_padres, 2):
+        hijo1, hijo2 = metodo_cruce(
+            poblacion[padres[i]], poblacion[padres[i + 1]], config, prob_cruce
+        )
+        descendencia.extend([hijo1, hijo2])
+    return descendencia
+
+
+def reemplazar_peores(poblacion, frentes, inmigrantes):
+    """
+    Reemplaza los individuos de los últimos frentes por los inmigrantes
+    
+    Se reemplazan primero los del último frente (y dentro de un frente, los
+    últimos en su orden); los inmigrantes repetidos en la población se ignoran.
+    
+    Args:
+        poblacion: Lista de Chromosome
+        frentes: Frentes vigentes de la población
+        inmigrantes: Lista de Chromosome recibidos
+    
+    Returns:
+        List[Chromosome]: Nueva población (mismo tamaño)
+    """
+    claves = {ind.clave for ind in poblacion}
+    nuevos = []
+    for ind in inmigrantes:
+        if ind.clave not in claves:
+            claves.add(ind.clave)
+            nuevos.append(ind)
+    if not nuevos:
+        return poblacion
+    
+    peores = [idx for frente in reversed(frentes) for idx in reversed(frente)]
+    poblacion = list(poblacion)
+    for idx, ind in zip(peores, nuevos):
+        poblacion[idx] = ind
+    return poblacion
+
+
+def descartar_duplicados(descendencia, poblacion, config, metodo_mutacion, max_remutaciones):
+    """
+    Re-muta los hijos cuyo genotipo ya está en la población o en el lote
+    
+    Los duplicados se detectan por Chromosome.clave. Cada duplicado se vuelve a
+    mutar (con probabilidad 1) hasta max_remutaciones veces; si sigue repetido
+    se conserva igual para no reducir el tamaño de la descendencia.
+    
+    Args:
+        descendencia: Hijos ya mutados
+        poblacion: Población actual (padres)
+        config: ProblemConfig
+        metodo_mutacion: función de mutación (poblacion, config, prob) -> lista
+        max_remutaciones: Re-mutaciones permitidas por hijo duplicado
+    
+    Returns:
+        tuple: (descendencia, duplicados_evitados, duplicados_restantes)
+    """
+    vistos = {ind.clave for ind in poblacion}
+    resultado = []
+    evitados = 0
+    restantes = 0
+    for hijo in descendencia:
+        intentos = 0
+        while hijo.clave in vistos and intentos < max_remutaciones:
+            hijo = metodo_mutacion([hijo], config, 1.0)[0]
+            intentos += 1
+        if hijo.clave in vistos:
+            restantes += 1
+        elif intentos > 0:
+            evitados += 1
+        vistos.add(hijo.clave)
+        resultado.append(hijo)
+    return resultado, evitados, restantes
+
+
+def registrar_duplicados(estadisticas, evitados, restantes):
+    """Acumula en estadisticas los duplicados de una generación"""
+    if estadisticas is None:
+        return
+    estadisticas['duplicados_evitados'] = estadisticas.get('duplicados_evitados', 0) + evitados
+    estadisticas['duplicados_restantes'] = estadisticas.get('duplicados_restantes', 0) + restantes
+    estadisticas.setdefault('duplicados_por_generacion', []).append(evitados)
+
+
 def nsga2(config, metodo_cruce, metodo_mutacion, 
           tamano_poblacion=100, num_generaciones=500,
           prob_cruce=0.95, prob_mutacion=0.3,
           epsilon_filtro=0.01, cada_k_filtro=30,
-          verbose=True):
+          verbose=True, cache=None, estadisticas=None, torneo_lote=False,
+          archivo=None, crowding_iterativo=False, max_remutaciones=0,
+          evaluador=None, migracion=None):
     """
     Algoritmo NSGA-II principal
     
@@ -429,6 +741,25 @@ def nsga2(config, metodo_cruce, metodo_mutacion,
         epsilon_filtro: umbral de similitud para filtrado (por defecto 0.01 = 1%)
         cada_k_filtro: aplicar filtro cada k generaciones (por defecto 30)
         verbose: imprimir progreso
+        cache: CacheFitness a usar (por defecto uno nuevo con MAX_ENTRADAS_POR_DEFECTO)
+        estadisticas: dict opcional; al terminar se actualiza con los contadores
+            del cache (aciertos, fallos, desalojos, bytes)
+        torneo_lote: si True, los padres de cada generación se eligen con
+            torneo_binario_lote (rango y crowding) en una sola llamada
+        archivo: ArchivoPareto opcional; recibe cada población evaluada y el
+            frente final se toma de él (no dominados de toda la corrida)
+        crowding_iterativo: si True, la selección trunca el último frente
+            quitando de a una la solución de menor crowding (ver seleccion_nsga2)
+        max_remutaciones: si > 0, los hijos repetidos (en la población o en la
+            descendencia) se re-mutan hasta este número de veces; estadisticas
+            recibe duplicados_evitados, duplicados_restantes y
+            duplicados_por_generacion
+        evaluador: EvaluadorParalelo opcional; las evaluaciones sin cache de cada
+            generación se reparten en su pool (mismos resultados que sin él)
+        migracion: callable opcional (gen, poblacion, fitness_poblacion, frente)
+            -> lista de inmigrantes, llamado al inicio de cada generación con el
+            frente 0 vigente; los inmigrantes reemplazan a los peores (modelo de
+            islas, ver islas.nsga2_islas)
     
     Returns:
         tuple: (frente_pareto, fitness_pareto, historial)
@@ -443,17 +774,18 @@ def nsga2(config, metodo_cruce, metodo_mutacion,
     
     poblacion = inicializar_poblacion(config, tamano_poblacion)
     historial_frentes = []
+    rng = generador_numpy() if torneo_lote else None
     
-    # OPTIMIZACIÓN: Cache de fitness para evitar recálculos
-    fitness_cache = {}
+    # OPTIMIZACIÓN: Cache de fitness (LRU acotado) para evitar recálculos
+    fitness_cache = cache if cache is not None else CacheFitness()
     
     # Inicializar frentes en la primera generación
-    fitness_inicial = [fitness_multiobjetivo(ind, config) for ind in poblacion]
-    for ind, fit in zip(poblacion, fitness_inicial):
-        genes_key = tuple(tuple(row) for row in ind.genes)
-        fitness_cache[genes_key] = fit
+    fitness_inicial = evaluar_con_cache(poblacion, config, fitness_cache, evaluador)
+    actualizar_archivo(archivo, poblacion, fitness_inicial)
     frentes = clasificacion_no_dominada(poblacion, fitness_inicial)
     frente_size = len(frentes[0])
+    # Claves de la población con la que se calcularon los frentes (None = desactualizados)
+    claves_clasificadas = [ind.clave for ind in poblacion]
     
     for gen in range(num_generaciones):
         # OPTIMIZACIÓN: En generaciones avanzadas, reducir operaciones costosas
@@ -462,33 +794,27 @@ def nsga2(config, metodo_cruce, metodo_mutacion,
         # Después de 75% de generaciones
         es_generacion_muy_avanzada = gen >= num_generaciones * 0.75
         
-        # OPTIMIZACIÓN: Solo evaluar fitness completo si no hay cache previo
-        # En generaciones avanzadas, asumir que la mayoría de individuos no cambiaron
-        fitness_poblacion = []
-        poblacion_cambio = False
-        for ind in poblacion:
-            genes_key = tuple(tuple(row) for row in ind.genes)
-            if genes_key in fitness_cache:
-                fitness_poblacion.append(fitness_cache[genes_key])
-            else:
-                fit = fitness_multiobjetivo(ind, config)
-                fitness_cache[genes_key] = fit
-                fitness_poblacion.append(fit)
-                poblacion_cambio = True
+        # OPTIMIZACIÓN: La población seleccionada ya está en cache
+        fitness_poblacion = evaluar_con_cache(poblacion, config, fitness_cache, evaluador)
         
-        # OPTIMIZACIÓN: Solo reclasificar si hubo cambios significativos o cada N generaciones
-        # En generaciones muy avanzadas, reducir frecuencia de clasificación
-        reclasificar = True
-        if es_generacion_muy_avanzada:
-            # Solo reclasificar cada 5 generaciones o si hubo cambios significativos
-            reclasificar = (gen % 5 == 0) or poblacion_cambio or (gen == num_generaciones - 1)
-        elif es_generacion_avanzada:
-            # Solo reclasificar cada 3 generaciones o si hubo cambios
-            reclasificar = (gen % 3 == 0) or poblacion_cambio or (gen == num_generaciones - 1)
-        
-        if reclasificar:
+        # Reclasificar solo si los frentes no corresponden a la población actual
+        # (cambió algún individuo o el filtro modificó el frente 0)
+        if not frentes_vigentes(poblacion, claves_clasificadas):
             frentes = clasificacion_no_dominada(poblacion, fitness_poblacion)
             frente_size = len(frentes[0])
+            claves_clasificadas = [ind.clave for ind in poblacion]
+        
+        if migracion is not None:
+            inmigrantes = migracion(gen, poblacion, fitness_poblacion, frentes[0])
+            if inmigrantes:
+                poblacion = reemplazar_peores(poblacion, frentes, inmigrantes)
+                fitness_poblacion = evaluar_con_cache(
+                    poblacion, config, fitness_cache, evaluador
+                )
+                actualizar_archivo(archivo, poblacion, fitness_poblacion)
+                frentes = clasificacion_no_dominada(poblacion, fitness_poblacion)
+                frente_size = len(frentes[0])
+                claves_clasificadas = [ind.clave for ind in poblacion]
         
         # Aplicar filtro de similitud cada k generaciones al frente de Pareto
         # OPTIMIZACIÓN: En generaciones avanzadas, aplicar filtro menos frecuentemente
@@ -500,39 +826,20 @@ def nsga2(config, metodo_cruce, metodo_mutacion,
             frecuencia_filtro = cada_k_filtro
         
         if epsilon_filtro > 0 and (gen + 1) % frecuencia_filtro == 0 and len(frentes[0]) > 1:
-            frente_original = [poblacion[i] for i in frentes[0]]
-            fitness_frente = [fitness_poblacion[i] for i in frentes[0]]
-            
-            frente_filtrado, fitness_filtrado = filtrar_soluciones_similares(
-                frente_original, fitness_frente, epsilon_filtro
-            )
+            mantener = mascara_soluciones_similares(
+                [fitness_poblacion[i] for i in frentes[0]], epsilon_filtro
+            ).tolist()
+            indices_mantener = [idx for idx, m in zip(frentes[0], mantener) if m]
+            indices_eliminar = [idx for idx, m in zip(frentes[0], mantener) if not m]
             
-            if len(frente_filtrado) < len(frente_original):
+            if indices_eliminar:
                 if verbose:
-                    eliminadas = len(frente_original) - len(frente_filtrado)
                     print(
-                        f"Gen {gen+1:3d} | Filtro aplicado: {eliminadas} "
+                        f"Gen {gen+1:3d} | Filtro aplicado: {len(indices_eliminar)} "
                         f"soluciones similares eliminadas "
-                        f"({len(frente_original)} -> {len(frente_filtrado)})"
-                    )
-                
-                # Crear conjunto de genes del frente filtrado para identificación rápida
-                genes_filtrados = {
-                    tuple(tuple(row) for row in sol.genes)
-                    for sol in frente_filtrado
-                }
-                
-                # Identificar índices del frente original que se mantienen
-                indices_mantener = []
-                indices_eliminar = []
-                for idx in frentes[0]:
-                    genes_sol = tuple(
-                        tuple(row) for row in poblacion[idx].genes
+                        f"({len(frentes[0])} -> {len(indices_mantener)})"
                     )
-                    if genes_sol in genes_filtrados:
-                        indices_mantener.append(idx)
-                    else:
-                        indices_eliminar.append(idx)
+                frente_filtrado = [poblacion[i] for i in indices_mantener]
                 
                 # Reemplazar soluciones eliminadas con mutaciones de las mejores del frente filtrado
                 # o con soluciones del siguiente frente si existe
@@ -551,20 +858,11 @@ def nsga2(config, metodo_cruce, metodo_mutacion,
                         metodo_mutacion([nueva_sol], config, prob_mutacion)
                         poblacion[idx_eliminar] = nueva_sol
                 
-                # Actualizar cache para nuevas soluciones
-                for ind in poblacion:
-                    genes_key = tuple(tuple(row) for row in ind.genes)
-                    if genes_key not in fitness_cache:
-                        fit = fitness_multiobjetivo(ind, config)
-                        fitness_cache[genes_key] = fit
-                
-                # Recalcular fitness y frentes después del filtrado
-                fitness_poblacion = []
-                for ind in poblacion:
-                    genes_key = tuple(tuple(row) for row in ind.genes)
-                    fitness_poblacion.append(fitness_cache[genes_key])
+                # Recalcular fitness (nuevas soluciones en lote) y frentes después del filtrado
+                fitness_poblacion = evaluar_con_cache(poblacion, config, fitness_cache, evaluador)
                 frentes = clasificacion_no_dominada(poblacion, fitness_poblacion)
                 frente_size = len(frentes[0])
+                claves_clasificadas = [ind.clave for ind in poblacion]
         
         # NO guardar historial aquí - se guardará al final después de todos los filtros
         
@@ -573,113 +871,62 @@ def nsga2(config, metodo_cruce, metodo_mutacion,
                 f"Gen {gen:3d} | Frente Pareto: {frente_size:3d} individuos"
             )
         
-        descendencia = []
-        while len(descendencia) < tamano_poblacion:
-            padre1 = torneo_binario_nsga2(poblacion, fitness_poblacion, frentes)
-            padre2 = torneo_binario_nsga2(poblacion, fitness_poblacion, frentes)
-            
-            hijo1, hijo2 = metodo_cruce(padre1, padre2, config, prob_cruce)
-            descendencia.extend([hijo1, hijo2])
+        # Rango de cada individuo (los eliminados del frente 0 por el filtro
+        # cuentan como del último frente)
+        rangos = rangos_desde_frentes(frentes, len(poblacion))
+        descendencia = generar_descendencia(
+            poblacion, fitness_poblacion, frentes, rangos, tamano_poblacion,
+            config, metodo_cruce, prob_cruce, rng,
+        )
         
         descendencia = descendencia[:tamano_poblacion]
         descendencia = metodo_mutacion(descendencia, config, prob_mutacion)
+        if max_remutaciones > 0:
+            descendencia, evitados, restantes = descartar_duplicados(
+                descendencia, poblacion, config, metodo_mutacion, max_remutaciones
+            )
+            registrar_duplicados(estadisticas, evitados, restantes)
         
         poblacion_combinada = poblacion + descendencia
         
-        # OPTIMIZACIÓN: Usar cache para fitness de descendencia
-        fitness_combinada = []
-        for ind in poblacion_combinada:
-            genes_key = tuple(tuple(row) for row in ind.genes)
-            if genes_key in fitness_cache:
-                fitness_combinada.append(fitness_cache[genes_key])
-            else:
-                fit = fitness_multiobjetivo(ind, config)
-                fitness_cache[genes_key] = fit
-                fitness_combinada.append(fit)
+        # OPTIMIZACIÓN: Usar cache y evaluar la descendencia nueva en un solo lote
+        fitness_combinada = evaluar_con_cache(poblacion_combinada, config, fitness_cache, evaluador)
+        actualizar_archivo(archivo, poblacion_combinada, fitness_combinada)
         
         # Aplicar filtro durante la selección para mantener solo soluciones únicas dominantes
         poblacion = seleccion_nsga2(poblacion_combinada, fitness_combinada, tamano_poblacion, 
-                                    epsilon_filtro=epsilon_filtro)
+                                    epsilon_filtro=epsilon_filtro,
+                                    crowding_iterativo=crowding_iterativo)
         
         # Recalcular frentes después de la selección para obtener tamaño real
-        fitness_poblacion_actual = []
-        for ind in poblacion:
-            genes_key = tuple(tuple(row) for row in ind.genes)
-            if genes_key in fitness_cache:
-                fitness_poblacion_actual.append(fitness_cache[genes_key])
-            else:
-                fit = fitness_multiobjetivo(ind, config)
-                fitness_cache[genes_key] = fit
-                fitness_poblacion_actual.append(fit)
+        fitness_poblacion_actual = evaluar_con_cache(poblacion, config, fitness_cache, evaluador)
         frentes = clasificacion_no_dominada(poblacion, fitness_poblacion_actual)
         frente_size = len(frentes[0])
+        claves_clasificadas = [ind.clave for ind in poblacion]
         
         # Aplicar filtro adicional al frente después de selección SIEMPRE
         # Esto previene que el frente se rellene con soluciones similares
         # CRÍTICO: Aplicar siempre después de cada selección para mantener frente limpio
         if epsilon_filtro > 0 and frente_size > 1:
-            frente_actual = [poblacion[i] for i in frentes[0]]
-            fitness_frente_actual = [fitness_poblacion_actual[i] for i in frentes[0]]
-            
-            frente_filtrado, fitness_filtrado = filtrar_soluciones_similares(
-                frente_actual, fitness_frente_actual, epsilon_filtro
+            # La máscara conserva los índices del frente: frentes[0] y frente_size
+            # quedan consistentes sin reconstruir el mapeo por genes
+            indices_frente_filtrado = filtrar_indices_similares(
+                frentes[0], fitness_poblacion_actual, epsilon_filtro
             )
             
-            # CRÍTICO: Actualizar frente_size SIEMPRE con el tamaño del frente filtrado
-            # incluso si no se eliminaron soluciones (para asegurar consistencia)
-            frente_size_nuevo = len(frente_filtrado)
-            
-            if frente_size_nuevo < frente_size:
-                # Actualizar el frente con las soluciones filtradas
-                genes_filtrados = {
-                    tuple(tuple(row) for row in sol.genes)
-                    for sol in frente_filtrado
-                }
-                indices_frente_filtrado = []
-                for idx in frentes[0]:
-                    genes_sol = tuple(
-                        tuple(row) for row in poblacion[idx].genes
-                    )
-                    if genes_sol in genes_filtrados:
-                        indices_frente_filtrado.append(idx)
-                
-                # CRÍTICO: Actualizar frentes y frente_size con el tamaño REAL del frente filtrado
+            if len(indices_frente_filtrado) < frente_size:
+                eliminadas_post = frente_size - len(indices_frente_filtrado)
                 frentes[0] = indices_frente_filtrado
-                
-                # Verificar que el tamaño sea correcto
-                if len(frentes[0]) != frente_size_nuevo:
-                    # Si no coincide, usar el tamaño del frente filtrado directamente
-                    frente_size_nuevo = len(frente_filtrado)
-                    # Reconstruir indices_frente_filtrado para que coincida
-                    genes_a_indices = {}
-                    for idx in frentes[0]:
-                        genes_sol = tuple(
-                            tuple(row) for row in poblacion[idx].genes
-                        )
-                        genes_a_indices[genes_sol] = idx
-                    
-                    indices_frente_filtrado = []
-                    for sol in frente_filtrado:
-                        genes_sol = tuple(tuple(row) for row in sol.genes)
-                        if genes_sol in genes_a_indices:
-                            indices_frente_filtrado.append(genes_a_indices[genes_sol])
-                    
-                    frentes[0] = indices_frente_filtrado
-                
+                claves_clasificadas = None
                 frente_size = len(frentes[0])
                 
                 if verbose and (gen % 50 == 0 or gen < 10):
-                    eliminadas_post = len(frente_actual) - len(frente_filtrado)
-                    if eliminadas_post > 0:
-                        print(
-                            f"Gen {gen+1:3d} | Filtro post-selección: "
-                            f"{eliminadas_post} soluciones eliminadas "
-                            f"({len(frente_actual)} -> {len(frente_filtrado)}), "
-                            f"frente_size={frente_size}"
-                        )
-            else:
-                # Aunque no se eliminaron soluciones, asegurar que frente_size sea correcto
-                frente_size = frente_size_nuevo
+                    print(
+                        f"Gen {gen+1:3d} | Filtro post-selección: "
+                        f"{eliminadas_post} soluciones eliminadas "
+                        f"({frente_size + eliminadas_post} -> {frente_size}), "
+                        f"frente_size={frente_size}"
+                    )
         
         # CRÍTICO: Guardar historial AL FINAL de cada generación, después de TODOS los filtros
         # Esto asegura que el historial refleje el tamaño REAL del frente filtrado
@@ -694,37 +941,22 @@ def nsga2(config, metodo_cruce, metodo_mutacion,
                               )  # Solo si hay más de 80 soluciones
         
         if aplicar_filtro_post:
-            # Mapear población seleccionada a fitness ya calculado (evitar recálculo)
-            # Usar diccionario para búsqueda O(1) en lugar de O(n)
-            genes_a_fitness = {}
-            for ind, fit in zip(poblacion_combinada, fitness_combinada):
-                genes_key = tuple(tuple(row) for row in ind.genes)
-                genes_a_fitness[genes_key] = fit
-            
-            fitness_poblacion_actual = []
-            for ind in poblacion:
-                genes_key = tuple(tuple(row) for row in ind.genes)
-                if genes_key in genes_a_fitness:
-                    fitness_poblacion_actual.append(genes_a_fitness[genes_key])
-                else:
-                    # Solo recalcular si no está en el diccionario (caso raro)
-                    fitness_poblacion_actual.append(fitness_multiobjetivo(ind, config))
-            
-            poblacion_filtrada, fitness_filtrado = filtrar_soluciones_similares(
-                poblacion, fitness_poblacion_actual, epsilon_filtro
+            # La población seleccionada ya está en cache (evitar recálculo)
+            fitness_poblacion_actual = evaluar_con_cache(
+                poblacion, config, fitness_cache, evaluador
             )
             
+            mantener = mascara_soluciones_similares(fitness_poblacion_actual, epsilon_filtro)
+            poblacion_filtrada = [ind for ind, m in zip(poblacion, mantener.tolist()) if m]
+            
             # Si el filtro eliminó soluciones, rellenar solo con soluciones realmente distintas
             if len(poblacion_filtrada) < tamano_poblacion:
                 # Usar fitness ya calculado de población_combinada (no recalcular)
                 candidatos = []
-                genes_filtrados = {
-                    tuple(tuple(row) for row in ind.genes)
-                    for ind in poblacion_filtrada
-                }
+                genes_filtrados = {ind.clave for ind in poblacion_filtrada}
                 
                 for ind, fit in zip(poblacion_combinada, fitness_combinada):
-                    genes_sol = tuple(tuple(row) for row in ind.genes)
+                    genes_sol = ind.clave
                     if genes_sol not in genes_filtrados:
                         candidatos.append((ind, fit))
                 
@@ -738,41 +970,30 @@ def nsga2(config, metodo_cruce, metodo_mutacion,
             else:
                 poblacion = poblacion_filtrada[:tamano_poblacion]
                 # Recalcular frentes después del filtro post-selección de población
-                fitness_actual = []
-                for ind in poblacion:
-                    genes_key = tuple(tuple(row) for row in ind.genes)
-                    fitness_actual.append(fitness_cache[genes_key])
+                fitness_actual = evaluar_con_cache(poblacion, config, fitness_cache, evaluador)
                 frentes = clasificacion_no_dominada(poblacion, fitness_actual)
                 frente_size = len(frentes[0])
+                claves_clasificadas = [ind.clave for ind in poblacion]
                 
                 # Aplicar filtro al frente nuevamente después del filtro de población
                 if epsilon_filtro > 0 and frente_size > 1:
-                    frente_actual = [poblacion[i] for i in frentes[0]]
-                    fitness_frente_actual = [fitness_actual[i] for i in frentes[0]]
-                    frente_filtrado, _ = filtrar_soluciones_similares(
-                        frente_actual, fitness_frente_actual, epsilon_filtro
+                    frentes[0] = filtrar_indices_similares(
+                        frentes[0], fitness_actual, epsilon_filtro
                     )
-                    genes_filtrados = {
-                        tuple(tuple(row) for row in sol.genes)
-                        for sol in frente_filtrado
-                    }
-                    indices_frente_filtrado = []
-                    for idx in frentes[0]:
-                        genes_sol = tuple(tuple(row) for row in poblacion[idx].genes)
-                        if genes_sol in genes_filtrados:
-                            indices_frente_filtrado.append(idx)
-                    frentes[0] = indices_frente_filtrado
                     frente_size = len(frentes[0])
+                    claves_clasificadas = None
     
-    # Calcular fitness final usando cache
-    fitness_final = []
-    for ind in poblacion:
-        genes_key = tuple(tuple(row) for row in ind.genes)
-        fitness_final.append(fitness_cache[genes_key])
-    frentes_final = clasificacion_no_dominada(poblacion, fitness_final)
-    
-    frente_pareto = [poblacion[i] for i in frentes_final[0]]
-    fitness_pareto = [fitness_final[i] for i in frentes_final[0]]
+    if archivo is not None:
+        # El archivo ya contiene el frente actualizado (sin reclasificar)
+        frente_pareto = archivo.soluciones()
+        fitness_pareto = archivo.fitness()
+    else:
+        # Calcular fitness final usando cache
+        fitness_final = evaluar_con_cache(poblacion, config, fitness_cache, evaluador)
+        frentes_final = clasificacion_no_dominada(poblacion, fitness_final)
+        
+        frente_pareto = [poblacion[i] for i in frentes_final[0]]
+        fitness_pareto = [fitness_final[i] for i in frentes_final[0]]
     
     # Aplicar filtro final al frente de Pareto
     if epsilon_filtro > 0 and len(frente_pareto) > 1:
@@ -785,4 +1006,11 @@ def nsga2(config, metodo_cruce, metodo_mutacion,
     if verbose:
         print(f"Optimización completada. Frente final: {len(frente_pareto)} soluciones")
     
+    if estadisticas is not None:
+        estadisticas.update(fitness_cache.estadisticas())
+        if archivo is not None:
+            estadisticas['archivo_tamano'] = len(archivo)
+        if evaluador is not None:
+            estadisticas.update(evaluador.estadisticas())
+    
     return frente_pareto, fitness_pareto, historial_frentes
@@ -0,0 +1,359 @@
+"""NSGA-II de estado estacionario y asíncrono (μ + 1)
+
+En lugar de generaciones completas, cada hijo se inserta en la población en
+cuanto termina su evaluación y se elimina el peor individuo (último frente,
+menor crowding). Los hijos se evalúan en un pool de procesos: cuando un worker
+queda libre recibe el siguiente hijo, así que una búsqueda local larga no deja
+a los demás workers esperando el fin de la generación.
+
+La población mantiene los frentes de forma incremental (actualización de
+niveles de no dominancia, Li et al. 2015):
+    - un punto nuevo entra al primer frente sin dominadores (búsqueda binaria);
+    - los puntos de ese frente que domina bajan al siguiente, y así en cascada;
+    - el peor individuo está en el último frente, que no domina a nadie, por lo
+      que quitarlo no cambia los demás rangos.
+El crowding solo se recalcula en los frentes modificados.
+
+Con num_workers <= 1 todo corre en el proceso principal y el resultado es
+reproducible con la semilla; con varios workers el orden de inserción depende
+de qué evaluación termina primero.
+"""
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from tesis3.src.algorithms.nsga2 import (
+    actualizar_archivo,
+    clasificacion_no_dominada,
+    distancia_crowding,
+    evaluar_con_cache,
+    filtrar_soluciones_similares,
+)
+from tesis3.src.algorithms.nsga2_memetic import busqueda_local
+from tesis3.src.core.chromosome import Chromosome
+from tesis3.src.fitness.cache import CacheFitness
+from tesis3.src.fitness.multi_objective import evaluar_individuos
+from tesis3.src.utils.population import inicializar_poblacion
+
+
+def _domina_a(fitness_a, fitness_b):
+    """Matriz (len(a), len(b)) con True donde a[i] domina a b[j]"""
+    mayor_igual = (fitness_a[:, None, :] >= fitness_b[None, :, :]).all(axis=2)
+    mayor = (fitness_a[:, None, :] > fitness_b[None, :, :]).any(axis=2)
+    return mayor_igual & mayor
+
+
+class PoblacionEstable:
+    """
+    Población de tamaño fijo con frentes y crowding actualizados por inserción
+    
+    Los individuos ocupan posiciones 0..n-1; frentes[k] lista las posiciones del
+    frente k y rangos[i] es el frente de la posición i.
+    """
+    
+    def __init__(self, poblacion, fitness_poblacion):
+        """
+        Args:
+            poblacion: Lista de Chromosome (sin genotipos repetidos)
+            fitness_poblacion: Lista de tuplas de fitness
+        """
+        self.individuos = list(poblacion)
+        n = len(self.individuos)
+        # Una fila extra para el individuo recién insertado
+        self.fitness = np.empty((n + 1, len(fitness_poblacion[0])))
+        self.fitness[:n] = fitness_poblacion
+        self.frentes = [list(f) for f in clasificacion_no_dominada(poblacion, fitness_poblacion)]
+        self.rangos = [0] * n
+        for rango, frente in enumerate(self.frentes):
+            for i in frente:
+                self.rangos[i] = rango
+        self.claves = {ind.clave for ind in self.individuos}
+        # Crowding por frente (en el orden de la lista del frente), calculado al usarlo
+        self._crowding = {}
+    
+    def __len__(self):
+        return len(self.individuos)
+    
+    def fitness_de(self, i):
+        """Fitness de la posición i como tupla"""
+        return tuple(self.fitness[i].tolist())
+    
+    def crowding(self, rango):
+        """Crowding de los miembros del frente (mismo orden que frentes[rango])"""
+        if rango not in self._crowding:
+            frente = self.frentes[rango]
+            self._crowding[rango] = np.array(
+                distancia_crowding([self.fitness_de(i) for i in frente])
+            )
+        return self._crowding[rango]
+    
+    def crowding_de(self, i):
+        """Crowding de la posición i dentro de su frente"""
+        rango = self.rangos[i]
+        return self.crowding(rango)[self.frentes[rango].index(i)]
+    
+    def _primer_frente_sin_dominadores(self, fitness):
+        """Si el frente k domina al punto, también lo domina el k - 1"""
+        punto = fitness[None, :]
+        bajo, alto = 0, len(self.frentes)
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            if _domina_a(self.fitness[self.frentes[medio]], punto).any():
+                bajo = medio + 1
+            else:
+                alto = medio
+        return bajo
+    
+    def insertar(self, individuo, fitness):
+        """
+        Inserta un individuo y elimina el peor (último frente, menor crowding)
+        
+        Args:
+            individuo: Chromosome
+            fitness: Tupla de fitness
+        
+        Returns:
+            Chromosome eliminado (puede ser el mismo individuo), o None si el
+            genotipo ya estaba en la población (no se inserta)
+        """
+        if individuo.clave in self.claves:
+            return None
+        
+        nuevo = len(self.individuos)
+        self.individuos.append(individuo)
+        self.rangos.append(0)
+        self.fitness[nuevo] = fitness
+        self.claves.add(individuo.clave)
+        
+        # Cascada: los dominados por los que entran al frente bajan al siguiente
+        entrantes = [nuevo]
+        rango = self._primer_frente_sin_dominadores(self.fitness[nuevo])
+        while entrantes:
+            for i in entrantes:
+                self.rangos[i] = rango
+            self._crowding.pop(rango, None)
+            if rango == len(self.frentes):
+                self.frentes.append(entrantes)
+                break
+            frente = self.frentes[rango]
+            dominados = _domina_a(self.fitness[entrantes], self.fitness[frente]).any(axis=0)
+            self.frentes[rango] = [
+                i for i, d in zip(frente, dominados.tolist()) if not d
+            ] + entrantes
+            entrantes = [i for i, d in zip(frente, dominados.tolist()) if d]
+            rango += 1
+        
+        # El peor: menor crowding del último frente (a igual crowding, el último)
+        ultimo = len(self.frentes) - 1
+        crowding = self.crowding(ultimo)
+        posicion = len(crowding) - 1 - int(np.argmin(crowding[::-1]))
+        return self._eliminar(ultimo, posicion)
+    
+    def _eliminar(self, rango, posicion):
+        """Quita un miembro del último frente y compacta las posiciones"""
+        frente = self.frentes[rango]
+        i = frente.pop(posicion)
+        self._crowding.pop(rango, None)
+        if not frente:
+            self.frentes.pop()
+        eliminado = self.individuos[i]
+        self.claves.discard(eliminado.clave)
+        
+        # Mover el último individuo a la posición liberada
+        ultimo = len(self.individuos) - 1
+        if i != ultimo:
+            self.individuos[i] = self.individuos[ultimo]
+            self.fitness[i] = self.fitness[ultimo]
+            rango_ultimo = self.rangos[ultimo]
+            frente_ultimo = self.frentes[rango_ultimo]
+            frente_ultimo[frente_ultimo.index(ultimo)] = i
+            self.rangos[i] = rango_ultimo
+        self.individuos.pop()
+        self.rangos.pop()
+        return eliminado
+    
+    def torneo(self):
+        """Torneo binario: menor rango; a igual rango, mayor crowding"""
+        i, j = random.sample(range(len(self.individuos)), 2)
+        if self.rangos[i] != self.rangos[j]:
+            return self.individuos[i if self.rangos[i] < self.rangos[j] else j]
+        return self.individuos[i if self.crowding_de(i) >= self.crowding_de(j) else j]
+
+
+# ---------------------------------------------------------------------------
+# Evaluación en workers
+# ---------------------------------------------------------------------------
+
+_config_worker = None
+
+
+def _inicializar_worker(config):
+    """initializer del pool: guarda y compila el problema"""
+    global _config_worker
+    _config_worker = config
+    config.compilar()
+
+
+def _evaluar_hijo(genes, max_iter_local, semilla, config=None):
+    """
+    Tarea de un worker: búsqueda local opcional y evaluación de un hijo
+    
+    Returns:
+        tuple: (genes finales, fitness)
+    """
+    config = config if config is not None else _config_worker
+    individuo = Chromosome(genes, config)
+    if max_iter_local > 0:
+        # Secuencia propia de la tarea; en el proceso principal no altera `random`
+        individuo = busqueda_local(individuo, config, max_iter_local,
+                                   rng=random.Random(semilla))
+    return individuo.genes_lectura.copy(), evaluar_individuos([individuo], config)[0]
+
+
+def nsga2_asincrono(config, metodo_cruce, metodo_mutacion,
+                    tamano_poblacion=100, num_generaciones=500,
+                    prob_cruce=0.95, prob_mutacion=0.3,
+                    cada_k_local=0, max_iter_local=5,
+                    num_workers=1, epsilon_filtro=0.01,
+                    verbose=True, cache=None, estadisticas=None, archivo=None):
+    """
+    NSGA-II de estado estacionario con evaluación asíncrona
+    
+    Args:
+        config: ProblemConfig
+        metodo_cruce: función de cruce
+        metodo_mutacion: función de mutación
+        tamano_poblacion: tamaño de población
+        num_generaciones: generaciones equivalentes (se insertan
+            num_generaciones * tamano_poblacion hijos)
+        prob_cruce: probabilidad de cruce
+        prob_mutacion: probabilidad de mutación
+        cada_k_local: si > 0, uno de cada k hijos recibe búsqueda local en el
+            worker antes de evaluarse (variante memética)
+        max_iter_local: iteraciones de la búsqueda local
+        num_workers: procesos del pool (<= 1: todo en el proceso principal)
+        epsilon_filtro: umbral de similitud del filtro final del frente
+        verbose: imprimir progreso
+        cache: CacheFitness a usar (por defecto uno nuevo)
+        estadisticas: dict opcional; recibe nacimientos, duplicados_rechazados,
+            busquedas_locales y los contadores del cache
+        archivo: ArchivoPareto opcional; recibe cada hijo evaluado y el frente
+            final se toma de él
+    
+    Returns:
+        tuple: (frente_pareto, fitness_pareto, historial), con el tamaño del
+            frente cada tamano_poblacion inserciones
+    """
+    if verbose:
+        print(
+            f"Iniciando NSGA-II asíncrono: {tamano_poblacion} ind, "
+            f"{num_generaciones} gen equivalentes, {max(num_workers, 1)} workers"
+        )
+    
+    fitness_cache = cache if cache is not None else CacheFitness()
+    poblacion = inicializar_poblacion(config, tamano_poblacion)
+    fitness_inicial = evaluar_con_cache(poblacion, config, fitness_cache)
+    actualizar_archivo(archivo, poblacion, fitness_inicial)
+    # Sin genotipos repetidos (la población estable los rechaza)
+    unicos = {}
+    for ind, fit in zip(poblacion, fitness_inicial):
+        unicos.setdefault(ind.clave, (ind, fit))
+    poblacion_estable = PoblacionEstable(
+        [ind for ind, _ in unicos.values()], [fit for _, fit in unicos.values()]
+    )
+    
+    total = num_generaciones * tamano_poblacion
+    historial_frentes = []
+    por_enviar = []
+    enviados = 0
+    nacimientos = 0
+    duplicados = 0
+    busquedas_locales = 0
+    
+    def siguiente_hijo():
+        """Hijo (mutado) y semilla de su búsqueda local, o None si no la lleva"""
+        nonlocal enviados, busquedas_locales
+        if not por_enviar:
+            padre1 = poblacion_estable.torneo()
+            padre2 = poblacion_estable.torneo()
+            hijos = metodo_cruce(padre1, padre2, config, prob_cruce)
+            por_enviar.extend(metodo_mutacion(list(hijos), config, prob_mutacion))
+        hijo = por_enviar.pop(0)
+        enviados += 1
+        if cada_k_local > 0 and enviados % cada_k_local == 0:
+            busquedas_locales += 1
+            return hijo, random.getrandbits(32)
+        return hijo, None
+    
+    def recibir(genes, fitness):
+        nonlocal nacimientos, duplicados
+        hijo = Chromosome(genes, config)
+        fitness_cache[hijo.clave] = fitness
+        actualizar_archivo(archivo, [hijo], [fitness])
+        if poblacion_estable.insertar(hijo, fitness) is None:
+            duplicados += 1
+        nacimientos += 1
+        if nacimientos % tamano_poblacion == 0:
+            historial_frentes.append(len(poblacion_estable.frentes[0]))
+            if verbose and (nacimientos // tamano_poblacion) % 50 == 0:
+                print(
+                    f"Gen {nacimientos // tamano_poblacion:3d} | Frente Pareto: "
+                    f"{len(poblacion_estable.frentes[0]):3d} individuos"
+                )
+    
+    if num_workers <= 1:
+        while nacimientos < total:
+            hijo, semilla = siguiente_hijo()
+            fitness = fitness_cache.get(hijo.clave) if semilla is None else None
+            if fitness is not None:
+                recibir(hijo.genes_lectura, fitness)
+            else:
+                recibir(*_evaluar_hijo(
+                    hijo.genes_lectura, max_iter_local if semilla is not None else 0,
+                    semilla, config,
+                ))
+    else:
+        with ProcessPoolExecutor(max_workers=num_workers, initializer=_inicializar_worker,
+                                 initargs=(config,)) as pool:
+            pendientes = set()
+            while nacimientos < total:
+                # Mantener a todos los workers ocupados (con un hijo de reserva cada uno)
+                while len(pendientes) < 2 * num_workers and enviados < total:
+                    hijo, semilla = siguiente_hijo()
+                    fitness = fitness_cache.get(hijo.clave) if semilla is None else None
+                    if fitness is not None:
+                        recibir(hijo.genes_lectura, fitness)
+                        continue
+                    pendientes.add(pool.submit(
+                        _evaluar_hijo, hijo.genes_lectura.copy(),
+                        max_iter_local if semilla is not None else 0, semilla,
+                    ))
+                if not pendientes:
+                    break
+                terminados, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+                for futuro in terminados:
+                    recibir(*futuro.result())
+    
+    if archivo is not None:
+        frente_pareto = archivo.soluciones()
+        fitness_pareto = archivo.fitness()
+    else:
+        frente_pareto = [poblacion_estable.individuos[i] for i in poblacion_estable.frentes[0]]
+        fitness_pareto = [poblacion_estable.fitness_de(i) for i in poblacion_estable.frentes[0]]
+    
+    if epsilon_filtro > 0 and len(frente_pareto) > 1:
+        frente_pareto, fitness_pareto = filtrar_soluciones_similares(
+            frente_pareto, fitness_pareto, epsilon_filtro
+        )
+    
+    if verbose:
+        print(f"Optimización completada. Frente final: {len(frente_pareto)} soluciones")
+    
+    if estadisticas is not None:
+        estadisticas.update(fitness_cache.estadisticas())
+        estadisticas['nacimientos'] = nacimientos
+        estadisticas['duplicados_rechazados'] = duplicados
+        estadisticas['busquedas_locales'] = busquedas_locales
+    
+    return frente_pareto, fitness_pareto, historial_frentes
@@ -1,31 +1,192 @@
 """NSGA-II con búsqueda local (memética)"""
 import random
-from tesis3.src.fitness.multi_objective import fitness_multiobjetivo
+import numpy as np
+from tesis3.src.fitness.cache import CacheFitness
+from tesis3.src.fitness.incremental import EvaluadorIncremental
+from tesis3.src.fitness.multi_objective import evaluar_poblacion
 from tesis3.src.utils.population import inicializar_poblacion
+from tesis3.src.utils.seeds import generador_numpy, semillas_derivadas
+from tesis3.src.algorithms.archivo_pareto import ArchivoPareto
+from tesis3.src.algorithms.presupuesto_local import AsignadorPresupuestoLocal
+from tesis3.src.algorithms.memoria_tabu import MemoriaTabu
+from tesis3.src.algorithms.no_dominados import rangos_desde_frentes
 from tesis3.src.algorithms.nsga2 import (
     dominancia,
     clasificacion_no_dominada,
     seleccion_nsga2,
-    torneo_binario_nsga2,
+    actualizar_archivo,
+    frentes_vigentes,
+    generar_descendencia,
+    reemplazar_peores,
+    descartar_duplicados,
+    registrar_duplicados,
+    filtrar_indices_similares,
     filtrar_soluciones_similares,
+    evaluar_con_cache,
 )
 
 
-def busqueda_local(individuo, config, max_iter=5):
+# Modos de busqueda_local: un vecino aleatorio por iteración, o el vecindario
+# completo (o un bloque) evaluado en lote tomando el mejor movimiento o el primero
+MODOS_BUSQUEDA_LOCAL = ('aleatorio', 'mejor', 'primera')
+
+
+def movimientos_un_gen(genes, config):
+    """
+    Todos los movimientos de un solo gen (cambiar la máquina de un pedido en una etapa)
+    
+    Args:
+        genes: Array (num_pedidos, num_etapas)
+        config: ProblemConfig
+    
+    Returns:
+        tuple: Arrays (pedidos, etapas, maquinas) de igual longitud
+    """
+    pedidos, etapas, maquinas = [], [], []
+    for etapa in range(config.num_etapas):
+        opciones = np.asarray(config.get_maquinas_etapa(etapa + 1))
+        # Cada pedido con cada máquina de la etapa distinta de la actual
+        distinta = opciones[None, :] != np.asarray(genes)[:, etapa][:, None]
+        pedido, opcion = np.nonzero(distinta)
+        pedidos.append(pedido)
+        etapas.append(np.full(len(pedido), etapa))
+        maquinas.append(opciones[opcion])
+    if not pedidos:
+        vacio = np.zeros(0, dtype=np.int64)
+        return vacio, vacio, vacio
+    return np.concatenate(pedidos), np.concatenate(etapas), np.concatenate(maquinas)
+
+
+def busqueda_local_vecindario(individuo, config, max_iter=5, modo='mejor',
+                              tamano_bloque=None, evaluador=None, memoria_tabu=None, rng=None):
+    """
+    Ascenso de colina evaluando el vecindario de un gen en una sola llamada vectorizada
+    
+    En cada iteración se arma el lote de vecinos (todos o un bloque aleatorio de
+    tamano_bloque) y se evalúa con evaluar_poblacion. Se acepta un vecino que
+    domina al actual: el de mayor mejora relativa total ('mejor') o el primero
+    del bloque en orden aleatorio ('primera'). Si ninguno domina, se acepta un
+    vecino de fitness igual (exploración, como busqueda_local) y cuenta como
+    iteración sin mejora.
+    
+    Con memoria_tabu, los movimientos ya rechazados desde los mismos genes se
+    quitan del lote (ya ordenado y recortado) antes de evaluarlo y los vecinos
+    peores se registran; el resultado es el mismo que sin memoria.
+    
+    Args:
+        individuo: Chromosome a mejorar
+        config: ProblemConfig
+        max_iter: Número máximo de iteraciones (lotes evaluados)
+        modo: 'mejor' o 'primera'
+        tamano_bloque: Vecinos por iteración (None = vecindario completo)
+        evaluador: EvaluadorParalelo opcional para evaluar los lotes
+        memoria_tabu: MemoriaTabu opcional (persistente entre aplicaciones)
+        rng: random.Random propio de la tarea (None = módulo random)
+    
+    Returns:
+        Chromosome mejorado
+    """
+    azar = rng if rng is not None else random
+    mejor = individuo.copy()
+    genes = np.array(mejor.genes_lectura)
+    mejor_fitness = np.array(evaluar_poblacion(genes[None], config)[0])
+    
+    sin_mejora = 0
+    max_sin_mejora = max(1, max_iter // 3)
+    
+    for iteracion in range(max_iter):
+        pedidos, etapas, maquinas = movimientos_un_gen(genes, config)
+        if len(pedidos) == 0:
+            break
+        if modo == 'primera' or (tamano_bloque is not None and tamano_bloque < len(pedidos)):
+            orden = np.array(azar.sample(range(len(pedidos)), len(pedidos)))
+            if tamano_bloque is not None:
+                orden = orden[:tamano_bloque]
+            pedidos, etapas, maquinas = pedidos[orden], etapas[orden], maquinas[orden]
+        if memoria_tabu is not None:
+            # Después del orden y del bloque: se salta solo la evaluación, el
+            # sorteo consume el mismo azar que sin memoria
+            clave = mejor.clave
+            libres = np.array([
+                not memoria_tabu.es_tabu(clave, p, e, m)
+                for p, e, m in zip(pedidos.tolist(), etapas.tolist(), maquinas.tolist())
+            ], dtype=bool)
+            pedidos, etapas, maquinas = pedidos[libres], etapas[libres], maquinas[libres]
+            if len(pedidos) == 0:
+                # Todo el lote ya fue rechazado: ningún vecino domina ni empata
+                break
+        
+        vecinos = np.repeat(genes[None], len(pedidos), axis=0)
+        vecinos[np.arange(len(pedidos)), pedidos, etapas] = maquinas
+        if evaluador is not None:
+            fitness_vecinos = evaluador.evaluar_genes(vecinos)
+        else:
+            fitness_vecinos = evaluar_poblacion(vecinos, config)
+        
+        no_peores = (fitness_vecinos >= mejor_fitness).all(axis=1)
+        dominan = no_peores & (fitness_vecinos > mejor_fitness).any(axis=1)
+        if memoria_tabu is not None:
+            # Peores en algún objetivo: nunca se aceptan desde estos genes
+            for k in np.flatnonzero(~no_peores).tolist():
+                memoria_tabu.registrar(clave, int(pedidos[k]), int(etapas[k]), int(maquinas[k]))
+        if dominan.any():
+            candidatos = np.flatnonzero(dominan)
+            if modo == 'mejor':
+                mejora = (fitness_vecinos[candidatos] / mejor_fitness).sum(axis=1)
+                elegido = candidatos[int(np.argmax(mejora))]
+            else:
+                elegido = candidatos[0]
+            sin_mejora = 0
+        else:
+            iguales = np.flatnonzero(no_peores)
+            sin_mejora += 1
+            if len(iguales) == 0 or sin_mejora >= max_sin_mejora:
+                break
+            elegido = iguales[azar.randrange(len(iguales))]
+        
+        genes[pedidos[elegido], etapas[elegido]] = maquinas[elegido]
+        mejor.asignar_gen(int(pedidos[elegido]), int(etapas[elegido]), int(maquinas[elegido]))
+        mejor_fitness = fitness_vecinos[elegido]
+    
+    return mejor
+
+
+def busqueda_local(individuo, config, max_iter=5, modo='aleatorio', tamano_bloque=None,
+                   evaluador=None, memoria_tabu=None, rng=None):
     """
     Mejora local por ascenso de colina en espacio multiobjetivo
     OPTIMIZADO: Early exit si no hay mejora después de varias iteraciones
+    OPTIMIZADO: Evaluación incremental (solo re-simula desde el pedido modificado)
     
     Args:
         individuo: Chromosome a mejorar
         config: ProblemConfig
         max_iter: Número máximo de iteraciones
+        modo: 'aleatorio' (un vecino por iteración), o 'mejor' / 'primera'
+            (vecindario en lote, ver busqueda_local_vecindario)
+        tamano_bloque: Vecinos por lote en los modos 'mejor' / 'primera'
+        evaluador: EvaluadorParalelo opcional para los lotes de vecinos; el modo
+            'aleatorio' no lo usa (evalúa cada vecino con EvaluadorIncremental)
+        memoria_tabu: MemoriaTabu opcional; los movimientos ya rechazados desde
+            los mismos genes se saltan sin re-evaluar (mismo resultado)
+        rng: random.Random propio de la tarea (None = módulo random); con una
+            secuencia por tarea el resultado no depende del orden de ejecución
     
     Returns:
         Chromosome mejorado
     """
+    if modo != 'aleatorio':
+        if modo not in MODOS_BUSQUEDA_LOCAL:
+            raise ValueError(f"Modo de búsqueda local desconocido: {modo}")
+        return busqueda_local_vecindario(
+            individuo, config, max_iter, modo, tamano_bloque, evaluador, memoria_tabu, rng
+        )
+    
+    azar = rng if rng is not None else random
     mejor = individuo.copy()
-    mejor_fitness = fitness_multiobjetivo(mejor, config)
+    # Evaluador con checkpoints por pedido: cada vecino solo re-simula desde el pedido cambiado
+    incremental = EvaluadorIncremental(mejor, config)
+    mejor_fitness = incremental.fitness
     
     sin_mejora = 0
     # Early exit más agresivo: si no mejora en 1/3 de iteraciones
@@ -33,27 +194,36 @@ def busqueda_local(individuo, config, max_iter=5):
     
     for iteracion in range(max_iter):
         # Generar vecino modificando una asignación aleatoria
-        vecino = mejor.copy()
-        pedido_idx = random.randint(0, len(vecino.genes) - 1)
-        etapa = random.randint(0, config.num_etapas - 1)
+        pedido_idx = azar.randint(0, len(mejor.genes_lectura) - 1)
+        etapa = azar.randint(0, config.num_etapas - 1)
         
         # Cambiar máquina en esa etapa
-        maquina_actual = vecino.genes[pedido_idx][etapa]
+        maquina_actual = mejor.genes_lectura[pedido_idx, etapa]
         opciones = [m for m in config.get_maquinas_etapa(etapa + 1) 
                    if m != maquina_actual]
         
         if not opciones:
             continue
         
-        vecino.genes[pedido_idx][etapa] = random.choice(opciones)
-        vecino_fitness = fitness_multiobjetivo(vecino, config)
+        nueva_maquina = azar.choice(opciones)
+        movimiento = (pedido_idx, etapa, int(nueva_maquina))
+        if memoria_tabu is not None and memoria_tabu.es_tabu(mejor.clave, *movimiento):
+            # Ya rechazado desde estos mismos genes: se rechaza sin re-evaluar
+            sin_mejora += 1
+            if sin_mejora >= max_sin_mejora:
+                break
+            continue
+        vecino_fitness = incremental.evaluar_movimiento(pedido_idx, etapa, nueva_maquina)
         
         # Aceptar si domina o es igual (exploración)
         if dominancia(vecino_fitness, mejor_fitness) or vecino_fitness == mejor_fitness:
-            mejor = vecino
+            incremental.aplicar_movimiento(pedido_idx, etapa, nueva_maquina)
+            mejor.asignar_gen(pedido_idx, etapa, nueva_maquina)
             mejor_fitness = vecino_fitness
             sin_mejora = 0  # Resetear contador
         else:
+            if memoria_tabu is not None:
+                memoria_tabu.registrar(mejor.clave, *movimiento)
             sin_mejora += 1
             # Early exit si no hay mejora después de varias iteraciones
             if sin_mejora >= max_sin_mejora:
@@ -62,12 +232,99 @@ def busqueda_local(individuo, config, max_iter=5):
     return mejor
 
 
+class BusquedaLocalPareto:
+    """
+    Pareto Local Search sobre un archivo acotado de no dominados
+    
+    Cada paso toma una solución del archivo que todavía no se exploró, evalúa en
+    lote su vecindario de un gen (o un bloque aleatorio de tamano_bloque) y
+    ofrece cada vecino al archivo. A diferencia de busqueda_local, ningún vecino
+    no dominado se pierde aunque no domine a la solución de partida.
+    
+    El archivo y el registro de explorados persisten entre llamadas a ejecutar,
+    así que cada aplicación continúa la búsqueda donde quedó la anterior.
+    """
+    
+    def __init__(self, config, max_archivo=100, tamano_bloque=None, evaluador=None):
+        """
+        Args:
+            config: ProblemConfig
+            max_archivo: Máximo de soluciones del archivo (se recorta por crowding)
+            tamano_bloque: Vecinos evaluados por solución (None = vecindario completo)
+            evaluador: EvaluadorParalelo opcional para los lotes de vecinos
+        """
+        self.config = config
+        self.tamano_bloque = tamano_bloque
+        self.evaluador = evaluador
+        self.archivo = ArchivoPareto(max_tamano=max_archivo)
+        self.explorados = set()
+        self.evaluaciones = 0
+    
+    def ejecutar(self, semillas, fitness_semillas, presupuesto):
+        """
+        Args:
+            semillas: Lista de Chromosome que se ofrecen al archivo antes de explorar
+            fitness_semillas: Fitness de cada semilla
+            presupuesto: Máximo de evaluaciones de vecinos de esta llamada
+        
+        Returns:
+            int: Evaluaciones usadas (<= presupuesto)
+        """
+        for semilla, fitness in zip(semillas, fitness_semillas):
+            self.archivo.insertar(semilla, fitness)
+        
+        usadas = 0
+        while usadas < presupuesto:
+            actual = next(
+                (sol for sol in self.archivo.soluciones() if sol.clave not in self.explorados),
+                None,
+            )
+            if actual is None:
+                break
+            self.explorados.add(actual.clave)
+            
+            genes = np.array(actual.genes_lectura)
+            pedidos, etapas, maquinas = movimientos_un_gen(genes, self.config)
+            cantidad = min(len(pedidos), presupuesto - usadas)
+            if self.tamano_bloque is not None:
+                cantidad = min(cantidad, self.tamano_bloque)
+            if cantidad == 0:
+                continue
+            if cantidad < len(pedidos):
+                orden = np.array(random.sample(range(len(pedidos)), cantidad))
+                pedidos, etapas, maquinas = pedidos[orden], etapas[orden], maquinas[orden]
+            
+            vecinos = np.repeat(genes[None], cantidad, axis=0)
+            vecinos[np.arange(cantidad), pedidos, etapas] = maquinas
+            if self.evaluador is not None:
+                fitness_vecinos = self.evaluador.evaluar_genes(vecinos)
+            else:
+                fitness_vecinos = evaluar_poblacion(vecinos, self.config)
+            usadas += cantidad
+            
+            for k, fila in enumerate(fitness_vecinos.tolist()):
+                fitness = tuple(fila)
+                # Filtro barato antes de construir el Chromosome del vecino
+                if self.archivo.esta_dominado(fitness):
+                    continue
+                vecino = actual.copy()
+                vecino.asignar_gen(int(pedidos[k]), int(etapas[k]), int(maquinas[k]))
+                self.archivo.insertar(vecino, fitness)
+        
+        self.evaluaciones += usadas
+        return usadas
+
+
 def nsga2_memetic(config, metodo_cruce, metodo_mutacion,
                   tamano_poblacion=100, num_generaciones=300,
                   prob_cruce=0.95, prob_mutacion=0.3,
                   cada_k_gen=10, max_iter_local=5,
                   epsilon_filtro=0.01, cada_k_filtro=30,
-                  verbose=True):
+                  verbose=True, cache=None, estadisticas=None, torneo_lote=False,
+                  archivo=None, crowding_iterativo=False, max_remutaciones=0,
+                  evaluador=None, migracion=None, modo_local='aleatorio',
+                  tamano_bloque_local=None, presupuesto_pls=0, max_archivo_pls=100,
+                  presupuesto_local=None, max_tabu=0, busqueda_paralela=None):
     """
     NSGA-II con búsqueda local aplicada cada k generaciones
     
@@ -84,6 +341,48 @@ def nsga2_memetic(config, metodo_cruce, metodo_mutacion,
         epsilon_filtro: umbral de similitud para filtrado (por defecto 0.01 = 1%)
         cada_k_filtro: aplicar filtro cada k generaciones (por defecto 30)
         verbose: imprimir progreso
+        cache: CacheFitness a usar (por defecto uno nuevo con MAX_ENTRADAS_POR_DEFECTO)
+        estadisticas: dict opcional; al terminar se actualiza con los contadores
+            del cache (aciertos, fallos, desalojos, bytes)
+        torneo_lote: si True, los padres de cada generación se eligen con
+            torneo_binario_lote (rango y crowding) en una sola llamada
+        archivo: ArchivoPareto opcional; recibe cada población evaluada y el
+            frente final se toma de él (no dominados de toda la corrida)
+        crowding_iterativo: si True, la selección trunca el último frente
+            quitando de a una la solución de menor crowding (ver seleccion_nsga2)
+        max_remutaciones: si > 0, los hijos repetidos (en la población o en la
+            descendencia) se re-mutan hasta este número de veces; estadisticas
+            recibe duplicados_evitados, duplicados_restantes y
+            duplicados_por_generacion
+        evaluador: EvaluadorParalelo opcional; las evaluaciones sin cache de cada
+            generación se reparten en su pool (mismos resultados que sin él)
+        migracion: callable opcional (gen, poblacion, fitness_poblacion, frente)
+            -> lista de inmigrantes, llamado al inicio de cada generación con el
+            frente 0 vigente; los inmigrantes reemplazan a los peores (modelo de
+            islas, ver islas.nsga2_islas)
+        modo_local: modo de busqueda_local ('aleatorio', 'mejor' o 'primera')
+        tamano_bloque_local: vecinos por lote en los modos 'mejor' / 'primera'
+            (None = vecindario completo)
+        presupuesto_pls: si > 0, la búsqueda local de cada aplicación es una
+            Pareto Local Search (BusquedaLocalPareto) con este máximo de
+            evaluaciones; las soluciones de su archivo compiten con la población
+            en seleccion_nsga2. estadisticas recibe evaluaciones_pls y
+            archivo_pls_tamano
+        max_archivo_pls: tamaño máximo del archivo de la Pareto Local Search
+        presupuesto_local: si se indica, cada aplicación reparte este número de
+            evaluaciones entre los miembros del frente según su tasa de mejora,
+            crowding y estancamiento (AsignadorPresupuestoLocal, hasta
+            max_iter_local iteraciones por miembro) en lugar de mejorar los
+            primeros 60 / 80; estadisticas recibe los contadores local_*. En los
+            modos 'mejor' / 'primera' una iteración cuesta el lote de vecinos, así
+            que debe alcanzar al menos para uno (si no, ValueError)
+        max_tabu: si > 0, busqueda_local comparte una MemoriaTabu de hasta este
+            número de movimientos rechazados durante toda la corrida;
+            estadisticas recibe los contadores tabu_*
+        busqueda_paralela: BusquedaLocalParalela opcional; los miembros a mejorar
+            se reparten en su pool, cada uno con su propia secuencia aleatoria
+            derivada de la semilla de la corrida (mismo resultado con cualquier
+            número de workers). No usa memoria_tabu ni evaluador
     
     Returns:
         tuple: (frente_pareto, fitness_pareto, historial)
@@ -100,17 +399,42 @@ def nsga2_memetic(config, metodo_cruce, metodo_mutacion,
     poblacion = inicializar_poblacion(config, tamano_poblacion)
     historial_frentes = []
     aplicaciones_local = 0
+    rng = generador_numpy() if torneo_lote else None
+    pls = None
+    if presupuesto_pls > 0:
+        pls = BusquedaLocalPareto(config, max_archivo_pls, tamano_bloque_local, evaluador)
+    memoria_tabu = MemoriaTabu(max_tabu) if max_tabu > 0 else None
+    asignador = None
+    if presupuesto_local is not None:
+        if pls is not None:
+            raise ValueError("presupuesto_local y presupuesto_pls son excluyentes")
+        asignador = AsignadorPresupuestoLocal(
+            presupuesto_local, max_por_individuo=max(1, max_iter_local)
+        )
+        # Evaluaciones por iteración de busqueda_local
+        if modo_local == 'aleatorio':
+            costo_iteracion = 1
+        else:
+            costo_iteracion = len(movimientos_un_gen(poblacion[0].genes_lectura, config)[0])
+            if tamano_bloque_local is not None:
+                costo_iteracion = min(costo_iteracion, tamano_bloque_local)
+        if presupuesto_local < costo_iteracion:
+            # Ningún miembro recibiría iteraciones: la búsqueda local quedaría apagada
+            raise ValueError(
+                f"presupuesto_local ({presupuesto_local}) menor que el costo de una "
+                f"iteración en modo '{modo_local}' ({costo_iteracion} evaluaciones)"
+            )
     
-    # OPTIMIZACIÓN: Cache de fitness para evitar recálculos
-    fitness_cache = {}
+    # OPTIMIZACIÓN: Cache de fitness (LRU acotado) para evitar recálculos
+    fitness_cache = cache if cache is not None else CacheFitness()
     
     # Inicializar frentes en la primera generación
-    fitness_inicial = [fitness_multiobjetivo(ind, config) for ind in poblacion]
-    for ind, fit in zip(poblacion, fitness_inicial):
-        genes_key = tuple(tuple(row) for row in ind.genes)
-        fitness_cache[genes_key] = fit
+    fitness_inicial = evaluar_con_cache(poblacion, config, fitness_cache, evaluador)
+    actualizar_archivo(archivo, poblacion, fitness_inicial)
     frentes = clasificacion_no_dominada(poblacion, fitness_inicial)
     frente_size = len(frentes[0])
+    # Claves de la población con la que se calcularon los frentes (None = desactualizados)
+    claves_clasificadas = [ind.clave for ind in poblacion]
     
     for gen in range(num_generaciones):
         # OPTIMIZACIÓN: En generaciones avanzadas, reducir operaciones costosas
@@ -119,33 +443,27 @@ def nsga2_memetic(config, metodo_cruce, metodo_mutacion,
         # Después de 75% de generaciones
         es_generacion_muy_avanzada = gen >= num_generaciones * 0.75
         
-        # OPTIMIZACIÓN: Solo evaluar fitness completo si no hay cache previo
-        # En generaciones avanzadas, asumir que la mayoría de individuos no cambiaron
-        fitness_poblacion = []
-        poblacion_cambio = False
-        for ind in poblacion:
-            genes_key = tuple(tuple(row) for row in ind.genes)
-            if genes_key in fitness_cache:
-                fitness_poblacion.append(fitness_cache[genes_key])
-            else:
-                fit = fitness_multiobjetivo(ind, config)
-                fitness_cache[genes_key] = fit
-                fitness_poblacion.append(fit)
-                poblacion_cambio = True
+        # OPTIMIZACIÓN: La población seleccionada ya está en cache
+        fitness_poblacion = evaluar_con_cache(poblacion, config, fitness_cache, evaluador)
         
-        # OPTIMIZACIÓN: Solo reclasificar si hubo cambios significativos o cada N generaciones
-        # En generaciones muy avanzadas, reducir frecuencia de clasificación
-        reclasificar = True
-        if es_generacion_muy_avanzada:
-            # Solo reclasificar cada 5 generaciones o si hubo cambios significativos
-            reclasificar = (gen % 5 == 0) or poblacion_cambio or (gen == num_generaciones - 1)
-        elif es_generacion_avanzada:
-            # Solo reclasificar cada 3 generaciones o si hubo cambios
-            reclasificar = (gen % 3 == 0) or poblacion_cambio or (gen == num_generaciones - 1)
-        
-        if reclasificar:
+        # Reclasificar solo si los frentes no corresponden a la población actual
+        # (cambió algún individuo o el filtro modificó el frente 0)
+        if not frentes_vigentes(poblacion, claves_clasificadas):
             frentes = clasificacion_no_dominada(poblacion, fitness_poblacion)
             frente_size = len(frentes[0])
+            claves_clasificadas = [ind.clave for ind in poblacion]
+        
+        if migracion is not None:
+            inmigrantes = migracion(gen, poblacion, fitness_poblacion, frentes[0])
+            if inmigrantes:
+                poblacion = reemplazar_peores(poblacion, frentes, inmigrantes)
+                fitness_poblacion = evaluar_con_cache(
+                    poblacion, config, fitness_cache, evaluador
+                )
+                actualizar_archivo(archivo, poblacion, fitness_poblacion)
+                frentes = clasificacion_no_dominada(poblacion, fitness_poblacion)
+                frente_size = len(frentes[0])
+                claves_clasificadas = [ind.clave for ind in poblacion]
         
         # NO guardar historial aquí - se guardará al final después de todos los filtros
         
@@ -159,7 +477,14 @@ def nsga2_memetic(config, metodo_cruce, metodo_mutacion,
             # OPTIMIZACIÓN CRÍTICA: En generaciones avanzadas, limitar búsqueda local
             # Esto reduce significativamente el tiempo de ejecución
             indices_a_mejorar = frentes[0]
-            if es_generacion_muy_avanzada and frente_size > 60:
+            iteraciones_por_indice = {}
+            if asignador is not None:
+                # Reparto por promesa en lugar de truncar por posición
+                iteraciones_por_indice = dict(asignador.asignar(
+                    poblacion, fitness_poblacion, frentes[0], costo_iteracion
+                ))
+                indices_a_mejorar = list(iteraciones_por_indice)
+            elif es_generacion_muy_avanzada and frente_size > 60:
                 # En generaciones muy avanzadas, solo mejorar 60 individuos
                 indices_a_mejorar = indices_a_mejorar[:60]
             elif es_generacion_avanzada and frente_size > 80:
@@ -174,43 +499,86 @@ def nsga2_memetic(config, metodo_cruce, metodo_mutacion,
                     f"iteraciones: {max_iter_local}"
                 )
             
-            # Mejorar subconjunto del frente usando hiperparámetros optimizados
-            for idx in indices_a_mejorar:
-                individuo_original = poblacion[idx]
-                poblacion[idx] = busqueda_local(
-                    individuo_original,
-                    config,
-                    max_iter_local,  # Usar valor optimizado del config
+            if pls is not None:
+                # Pareto Local Search con presupuesto de evaluaciones: el archivo
+                # acotado compite con la población por los lugares de la selección
+                pls.ejecutar(
+                    [poblacion[idx] for idx in indices_a_mejorar],
+                    [fitness_poblacion[idx] for idx in indices_a_mejorar],
+                    presupuesto_pls,
                 )
-                # Actualizar cache
-                genes_key_nuevo = tuple(tuple(row) for row in poblacion[idx].genes)
-                if genes_key_nuevo not in fitness_cache:
-                    fitness_cache[genes_key_nuevo] = fitness_multiobjetivo(poblacion[idx], config)
-            
-            # Recalcular fitness solo para los individuos mejorados
-            fitness_actualizado = {}
-            for idx in indices_a_mejorar:
-                genes_key = tuple(tuple(row) for row in poblacion[idx].genes)
-                if genes_key in fitness_cache:
-                    fitness_actualizado[idx] = fitness_cache[genes_key]
+                claves_poblacion = set(ind.clave for ind in poblacion)
+                entradas = [(sol, fit) for sol, fit
+                            in zip(pls.archivo.soluciones(), pls.archivo.fitness())
+                            if sol.clave not in claves_poblacion]
+                if entradas:
+                    nuevos = [sol for sol, _ in entradas]
+                    fitness_nuevos = [fit for _, fit in entradas]
+                    for sol, fit in entradas:
+                        fitness_cache[sol.clave] = fit
+                    actualizar_archivo(archivo, nuevos, fitness_nuevos)
+                    poblacion = seleccion_nsga2(
+                        poblacion + nuevos,
+                        fitness_poblacion + fitness_nuevos,
+                        tamano_poblacion,
+                        epsilon_filtro=epsilon_filtro,
+                        crowding_iterativo=crowding_iterativo,
+                    )
+                    fitness_poblacion = evaluar_con_cache(
+                        poblacion, config, fitness_cache, evaluador
+                    )
+            else:
+                # Mejorar subconjunto del frente usando hiperparámetros optimizados
+                originales = {}
+                if busqueda_paralela is not None:
+                    resultados_locales = busqueda_paralela.mejorar(
+                        [poblacion[idx] for idx in indices_a_mejorar],
+                        [iteraciones_por_indice.get(idx, max_iter_local)
+                         for idx in indices_a_mejorar],
+                        semillas_derivadas(random.getrandbits(64), len(indices_a_mejorar)),
+                        modo=modo_local,
+                        tamano_bloque=tamano_bloque_local,
+                    )
+                    for idx, (mejorado, fit) in zip(indices_a_mejorar, resultados_locales):
+                        originales[idx] = poblacion[idx]
+                        poblacion[idx] = mejorado
+                        # Los workers ya evaluaron el resultado
+                        fitness_cache[mejorado.clave] = fit
                 else:
-                    fit = fitness_multiobjetivo(poblacion[idx], config)
-                    fitness_cache[genes_key] = fit
-                    fitness_actualizado[idx] = fit
-            
-            # Actualizar fitness_poblacion solo para los mejorados
-            for idx, fit in fitness_actualizado.items():
-                fitness_poblacion[idx] = fit
+                    for idx in indices_a_mejorar:
+                        individuo_original = poblacion[idx]
+                        originales[idx] = individuo_original
+                        poblacion[idx] = busqueda_local(
+                            individuo_original,
+                            config,
+                            # Usar valor optimizado del config (o el asignado al miembro)
+                            iteraciones_por_indice.get(idx, max_iter_local),
+                            modo=modo_local,
+                            tamano_bloque=tamano_bloque_local,
+                            evaluador=evaluador,
+                            memoria_tabu=memoria_tabu,
+                        )
+                
+                # Recalcular fitness solo para los individuos mejorados (en un solo lote)
+                mejorados = [poblacion[idx] for idx in indices_a_mejorar]
+                fitness_mejorados = evaluar_con_cache(mejorados, config, fitness_cache, evaluador)
+                
+                if asignador is not None:
+                    for idx, fit in zip(indices_a_mejorar, fitness_mejorados):
+                        asignador.registrar(
+                            originales[idx], poblacion[idx], fitness_poblacion[idx], fit,
+                            iteraciones_por_indice[idx],
+                        )
+                
+                # Actualizar fitness_poblacion solo para los mejorados
+                for idx, fit in zip(indices_a_mejorar, fitness_mejorados):
+                    fitness_poblacion[idx] = fit
             
-            # OPTIMIZACIÓN: Solo reclasificar si hubo mejoras significativas
-            # En generaciones avanzadas, evitar reclasificación frecuente
-            debe_reclasificar = (
-                not es_generacion_avanzada
-                or len(indices_a_mejorar) >= frente_size * 0.6
-            )
-            if debe_reclasificar:
+            # Reclasificar si la búsqueda local cambió algún individuo
+            if not frentes_vigentes(poblacion, claves_clasificadas):
                 frentes = clasificacion_no_dominada(poblacion, fitness_poblacion)
                 frente_size = len(frentes[0])
+                claves_clasificadas = [ind.clave for ind in poblacion]
         
         # Aplicar filtro de similitud cada k_filtro generaciones al frente de Pareto
         # OPTIMIZACIÓN: En generaciones avanzadas, aplicar filtro menos frecuentemente
@@ -221,20 +589,17 @@ def nsga2_memetic(config, metodo_cruce, metodo_mutacion,
         else:
             frecuencia_filtro = cada_k_filtro
         if epsilon_filtro > 0 and (gen + 1) % frecuencia_filtro == 0 and len(frentes[0]) > 1:
-            frente_original = [poblacion[i] for i in frentes[0]]
-            fitness_frente = [fitness_poblacion[i] for i in frentes[0]]
-            
-            frente_filtrado, fitness_filtrado = filtrar_soluciones_similares(
-                frente_original, fitness_frente, epsilon_filtro
+            indices_frente_filtrado = filtrar_indices_similares(
+                frentes[0], fitness_poblacion, epsilon_filtro
             )
             
-            if len(frente_filtrado) < len(frente_original):
+            if len(indices_frente_filtrado) < len(frentes[0]):
                 if verbose:
-                    eliminadas = len(frente_original) - len(frente_filtrado)
+                    eliminadas = len(frentes[0]) - len(indices_frente_filtrado)
                     print(
                         f"Gen {gen+1:3d} | Filtro aplicado: {eliminadas} "
                         f"soluciones similares eliminadas "
-                        f"({len(frente_original)} -> {len(frente_filtrado)})"
+                        f"({len(frentes[0])} -> {len(indices_frente_filtrado)})"
                     )
                 
                 # CORRECCIÓN: NO rellenar la población después del filtro
@@ -244,24 +609,11 @@ def nsga2_memetic(config, metodo_cruce, metodo_mutacion,
                 # Esto permite que el algoritmo evolucione naturalmente
                 # sin forzar rellenado
                 
-                # Actualizar el frente con las soluciones filtradas
-                # Crear conjunto de genes del frente filtrado para identificación rápida
-                genes_filtrados = {
-                    tuple(tuple(row) for row in sol.genes)
-                    for sol in frente_filtrado
-                }
-                
-                # Reconstruir el primer frente con solo las soluciones filtradas
-                # Las soluciones eliminadas permanecen en la población pero no en el frente
-                indices_frente_filtrado = []
-                for idx in frentes[0]:
-                    genes_sol = tuple(tuple(row) for row in poblacion[idx].genes)
-                    if genes_sol in genes_filtrados:
-                        indices_frente_filtrado.append(idx)
-                
                 # Actualizar frentes con el frente filtrado
+                # Las soluciones eliminadas permanecen en la población pero no en el frente
                 frentes[0] = indices_frente_filtrado
                 frente_size = len(frentes[0])
+                claves_clasificadas = None
                 
                 # El historial se actualizará al final de la generación
                 # después de todos los filtros
@@ -269,123 +621,72 @@ def nsga2_memetic(config, metodo_cruce, metodo_mutacion,
         # Generar descendencia (igual que NSGA-II estándar)
         # CRÍTICO: Recalcular frentes antes de generar descendencia
         # para asegurar que los índices sean válidos después del filtro
-        if not reclasificar or aplicar_busqueda_local:
-            # Si no se reclasificó o se aplicó búsqueda local, recalcular frentes
+        if aplicar_busqueda_local:
+            # Si se aplicó búsqueda local, recalcular frentes
             frentes = clasificacion_no_dominada(poblacion, fitness_poblacion)
             frente_size = len(frentes[0])
+            claves_clasificadas = [ind.clave for ind in poblacion]
         
-        descendencia = []
-        while len(descendencia) < tamano_poblacion:
-            padre1 = torneo_binario_nsga2(
-                poblacion, fitness_poblacion, frentes
-            )
-            padre2 = torneo_binario_nsga2(
-                poblacion, fitness_poblacion, frentes
-            )
-            
-            hijo1, hijo2 = metodo_cruce(padre1, padre2, config, prob_cruce)
-            descendencia.extend([hijo1, hijo2])
+        rangos = rangos_desde_frentes(frentes, len(poblacion))
+        descendencia = generar_descendencia(
+            poblacion, fitness_poblacion, frentes, rangos, tamano_poblacion,
+            config, metodo_cruce, prob_cruce, rng,
+        )
         
         descendencia = descendencia[:tamano_poblacion]
         descendencia = metodo_mutacion(descendencia, config, prob_mutacion)
+        if max_remutaciones > 0:
+            descendencia, evitados, restantes = descartar_duplicados(
+                descendencia, poblacion, config, metodo_mutacion, max_remutaciones
+            )
+            registrar_duplicados(estadisticas, evitados, restantes)
         
         # Combinar y seleccionar
         poblacion_combinada = poblacion + descendencia
         
-        # OPTIMIZACIÓN: Usar cache para fitness de descendencia
-        fitness_combinada = []
-        for ind in poblacion_combinada:
-            genes_key = tuple(tuple(row) for row in ind.genes)
-            if genes_key in fitness_cache:
-                fitness_combinada.append(fitness_cache[genes_key])
-            else:
-                fit = fitness_multiobjetivo(ind, config)
-                fitness_cache[genes_key] = fit
-                fitness_combinada.append(fit)
+        # OPTIMIZACIÓN: Usar cache y evaluar la descendencia nueva en un solo lote
+        fitness_combinada = evaluar_con_cache(poblacion_combinada, config, fitness_cache, evaluador)
+        actualizar_archivo(archivo, poblacion_combinada, fitness_combinada)
         # Aplicar filtro durante la selección para mantener solo soluciones únicas dominantes
         poblacion = seleccion_nsga2(
             poblacion_combinada,
             fitness_combinada,
             tamano_poblacion,
             epsilon_filtro=epsilon_filtro,
+            crowding_iterativo=crowding_iterativo,
         )
         
         # Recalcular frentes después de la selección para obtener tamaño real
-        fitness_poblacion_actual = []
-        for ind in poblacion:
-            genes_key = tuple(tuple(row) for row in ind.genes)
-            if genes_key in fitness_cache:
-                fitness_poblacion_actual.append(fitness_cache[genes_key])
-            else:
-                fit = fitness_multiobjetivo(ind, config)
-                fitness_cache[genes_key] = fit
-                fitness_poblacion_actual.append(fit)
+        fitness_poblacion_actual = evaluar_con_cache(poblacion, config, fitness_cache, evaluador)
         frentes = clasificacion_no_dominada(poblacion, fitness_poblacion_actual)
         frente_size = len(frentes[0])
+        claves_clasificadas = [ind.clave for ind in poblacion]
         
         # Aplicar filtro adicional al frente después de selección SIEMPRE
         # Esto previene que el frente se rellene con soluciones similares
         # CRÍTICO: Aplicar siempre después de cada selección para mantener frente limpio
         frente_size_antes_filtro = frente_size
         if epsilon_filtro > 0 and frente_size > 1:
-            frente_actual = [poblacion[i] for i in frentes[0]]
-            fitness_frente_actual = [fitness_poblacion_actual[i] for i in frentes[0]]
-            
-            frente_filtrado, fitness_filtrado = filtrar_soluciones_similares(
-                frente_actual, fitness_frente_actual, epsilon_filtro
+            # La máscara conserva los índices del frente: frentes[0] y frente_size
+            # quedan consistentes sin reconstruir el mapeo por genes
+            indices_frente_filtrado = filtrar_indices_similares(
+                frentes[0], fitness_poblacion_actual, epsilon_filtro
             )
             
-            if len(frente_filtrado) < frente_size:
-                # Actualizar el frente con las soluciones filtradas
-                genes_filtrados = {
-                    tuple(tuple(row) for row in sol.genes)
-                    for sol in frente_filtrado
-                }
-                indices_frente_filtrado = []
-                for idx in frentes[0]:
-                    genes_sol = tuple(
-                        tuple(row) for row in poblacion[idx].genes
-                    )
-                    if genes_sol in genes_filtrados:
-                        indices_frente_filtrado.append(idx)
-    
-                # CRÍTICO: Actualizar frentes y frente_size con el tamaño REAL del frente filtrado
+            if len(indices_frente_filtrado) < frente_size:
+                eliminadas_post = frente_size - len(indices_frente_filtrado)
                 frentes[0] = indices_frente_filtrado
-                frente_size_nuevo = len(frentes[0])
-                
-                # Verificar que el tamaño sea correcto
-                if frente_size_nuevo != len(frente_filtrado):
-                    # Si no coincide, usar el tamaño del frente filtrado directamente
-                    frente_size_nuevo = len(frente_filtrado)
-                    # Reconstruir indices_frente_filtrado para que coincida
-                    # Mapear soluciones filtradas a índices originales
-                    genes_a_indices = {}
-                    for idx in frentes[0]:
-                        genes_sol = tuple(
-                            tuple(row) for row in poblacion[idx].genes
-                        )
-                        genes_a_indices[genes_sol] = idx
-                    
-                    indices_frente_filtrado = []
-                    for sol in frente_filtrado:
-                        genes_sol = tuple(tuple(row) for row in sol.genes)
-                        if genes_sol in genes_a_indices:
-                            indices_frente_filtrado.append(genes_a_indices[genes_sol])
-                    
-                    frentes[0] = indices_frente_filtrado
-                
+                claves_clasificadas = None
                 frente_size = len(frentes[0])
                 
                 # Log de depuración (solo en generaciones clave)
                 if verbose and (gen % 50 == 0 or gen < 10):
-                    eliminadas_post = len(frente_actual) - len(frente_filtrado)
-                    if eliminadas_post > 0:
-                        print(
-                            f"Gen {gen+1:3d} | Filtro post-selección: "
-                            f"{eliminadas_post} soluciones eliminadas "
-                            f"({len(frente_actual)} -> {len(frente_filtrado)}), "
-                            f"frente_size={frente_size}"
-                        )
+                    print(
+                        f"Gen {gen+1:3d} | Filtro post-selección: "
+                        f"{eliminadas_post} soluciones eliminadas "
+                        f"({frente_size + eliminadas_post} -> {frente_size}), "
+                        f"frente_size={frente_size}"
+                    )
             else:
                 # Debug: si el filtro no eliminó nada, puede ser que realmente sean distintas
                 if verbose and gen % 100 == 0:
@@ -424,20 +725,17 @@ def nsga2_memetic(config, metodo_cruce, metodo_mutacion,
                         f"Gen {gen:3d} | Frente Pareto: {frente_size:3d} individuos"
                     )
     
-    # Frente final (usar cache)
-    fitness_final = []
-    for ind in poblacion:
-        genes_key = tuple(tuple(row) for row in ind.genes)
-        if genes_key in fitness_cache:
-            fitness_final.append(fitness_cache[genes_key])
-        else:
-            fit = fitness_multiobjetivo(ind, config)
-            fitness_cache[genes_key] = fit
-            fitness_final.append(fit)
-    frentes_final = clasificacion_no_dominada(poblacion, fitness_final)
-    
-    frente_pareto = [poblacion[i] for i in frentes_final[0]]
-    fitness_pareto = [fitness_final[i] for i in frentes_final[0]]
+    if archivo is not None:
+        # El archivo ya contiene el frente actualizado (sin reclasificar)
+        frente_pareto = archivo.soluciones()
+        fitness_pareto = archivo.fitness()
+    else:
+        # Frente final (usar cache)
+        fitness_final = evaluar_con_cache(poblacion, config, fitness_cache, evaluador)
+        frentes_final = clasificacion_no_dominada(poblacion, fitness_final)
+        
+        frente_pareto = [poblacion[i] for i in frentes_final[0]]
+        fitness_pareto = [fitness_final[i] for i in frentes_final[0]]
     
     # Aplicar filtro final al frente de Pareto
     if epsilon_filtro > 0 and len(frente_pareto) > 1:
@@ -460,4 +758,20 @@ def nsga2_memetic(config, metodo_cruce, metodo_mutacion,
                 f"max={max(historial_frentes)}, promedio={prom_hist:.1f}"
             )
     
+    if estadisticas is not None:
+        estadisticas.update(fitness_cache.estadisticas())
+        if archivo is not None:
+            estadisticas['archivo_tamano'] = len(archivo)
+        if evaluador is not None:
+            estadisticas.update(evaluador.estadisticas())
+        if pls is not None:
+            estadisticas['evaluaciones_pls'] = pls.evaluaciones
+            estadisticas['archivo_pls_tamano'] = len(pls.archivo)
+        if asignador is not None:
+            estadisticas.update(asignador.estadisticas())
+        if memoria_tabu is not None:
+            estadisticas.update(memoria_tabu.estadisticas())
+        if busqueda_paralela is not None:
+            estadisticas.update(busqueda_paralela.estadisticas())
+    
     return frente_pareto, fitness_pareto, historial_frentes
@@ -0,0 +1,177 @@
+"""Reparto adaptativo del presupuesto de búsqueda local entre los miembros del frente
+
+En lugar de mejorar los primeros N índices del frente 0 (orden de posición),
+cada aplicación de la búsqueda local reparte un presupuesto fijo de
+evaluaciones según lo prometedor de cada miembro:
+    - tasa de mejora observada: éxitos / intentos de su linaje (con prior de
+      Laplace, los miembros nuevos parten de 1/2);
+    - crowding distance dentro del frente (rango normalizado: los extremos y
+      las zonas poco pobladas primero);
+    - aplicaciones transcurridas desde su última mejora (los estancados bajan).
+
+Las estadísticas se guardan por clave y pasan al individuo mejorado, así que
+un linaje conserva su historial aunque cambien sus genes.
+
+Uso típico:
+    asignador = AsignadorPresupuestoLocal(presupuesto=300, max_por_individuo=5)
+    for idx, iteraciones in asignador.asignar(poblacion, fitness, frentes[0]):
+        mejorado = busqueda_local(poblacion[idx], config, iteraciones)
+        asignador.registrar(poblacion[idx], mejorado, fitness[idx], fitness_mejorado, iteraciones)
+"""
+import numpy as np
+
+from tesis3.src.algorithms.nsga2 import dominancia, distancia_crowding
+
+
+class AsignadorPresupuestoLocal:
+    """Reparte iteraciones de busqueda_local según la promesa de cada miembro del frente"""
+    
+    def __init__(self, presupuesto, min_por_individuo=1, max_por_individuo=5,
+                 peso_mejora=1.0, peso_crowding=1.0, peso_estancamiento=1.0):
+        """
+        Args:
+            presupuesto: Evaluaciones por aplicación de la búsqueda local
+            min_por_individuo: Iteraciones mínimas de un miembro elegido
+            max_por_individuo: Iteraciones máximas por miembro (max_iter_local)
+            peso_mejora: Peso de la tasa de mejora observada
+            peso_crowding: Peso del crowding distance en el frente
+            peso_estancamiento: Peso de 1 / (1 + aplicaciones sin mejorar)
+        """
+        if presupuesto < 1:
+            raise ValueError("presupuesto debe ser >= 1")
+        if not 1 <= min_por_individuo <= max_por_individuo:
+            raise ValueError("Se requiere 1 <= min_por_individuo <= max_por_individuo")
+        self.presupuesto = presupuesto
+        self.min_por_individuo = min_por_individuo
+        self.max_por_individuo = max_por_individuo
+        self.pesos = (peso_mejora, peso_crowding, peso_estancamiento)
+        # clave -> {'intentos', 'exitos', 'iteraciones', 'ultima_mejora'}
+        self.miembros = {}
+        self.aplicaciones = 0
+        self.iteraciones_asignadas = 0
+        self.mejoras = 0
+    
+    def _estadistica(self, clave):
+        estadistica = self.miembros.get(clave)
+        if estadistica is None:
+            estadistica = {
+                'intentos': 0, 'exitos': 0, 'iteraciones': 0,
+                'ultima_mejora': self.aplicaciones,
+            }
+            self.miembros[clave] = estadistica
+        return estadistica
+    
+    def puntajes(self, fitness_frente, claves):
+        """
+        Args:
+            fitness_frente: Fitness de los miembros del frente
+            claves: Clave de cada miembro
+        
+        Returns:
+            np.ndarray: Puntaje de cada miembro (mayor = más prometedor)
+        """
+        n = len(claves)
+        crowding = np.asarray(distancia_crowding(fitness_frente), dtype=float)
+        # Rango normalizado en [0, 1]: independiente de la escala y de los infinitos
+        rango_crowding = np.empty(n)
+        rango_crowding[np.argsort(crowding, kind='stable')] = np.arange(n)
+        rango_crowding /= max(n - 1, 1)
+        
+        tasa = np.empty(n)
+        estancamiento = np.empty(n)
+        for i, clave in enumerate(claves):
+            estadistica = self._estadistica(clave)
+            tasa[i] = (estadistica['exitos'] + 1) / (estadistica['intentos'] + 2)
+            estancamiento[i] = 1 / (1 + self.aplicaciones - estadistica['ultima_mejora'])
+        
+        peso_mejora, peso_crowding, peso_estancamiento = self.pesos
+        return (peso_mejora * tasa + peso_crowding * rango_crowding
+                + peso_estancamiento * estancamiento)
+    
+    def asignar(self, poblacion, fitness_poblacion, frente, costo_iteracion=1):
+        """
+        Reparte el presupuesto de esta aplicación entre los miembros del frente
+        
+        Args:
+            poblacion: Lista de Chromosome
+            fitness_poblacion: Fitness de cada individuo
+            frente: Índices del frente 0
+            costo_iteracion: Evaluaciones por iteración de busqueda_local (1 en
+                modo 'aleatorio', el tamaño del lote en los modos de vecindario)
+        
+        Returns:
+            List[tuple]: (índice, iteraciones) de los miembros elegidos, de
+                mayor a menor puntaje
+        """
+        self.aplicaciones += 1
+        # Solo se conserva el historial de los individuos vigentes
+        claves_poblacion = set(ind.clave for ind in poblacion)
+        self.miembros = {
+            clave: estadistica for clave, estadistica in self.miembros.items()
+            if clave in claves_poblacion
+        }
+        if not frente:
+            return []
+        
+        claves = [poblacion[idx].clave for idx in frente]
+        puntajes = self.puntajes([fitness_poblacion[idx] for idx in frente], claves)
+        orden = np.argsort(-puntajes, kind='stable')
+        
+        restantes = self.presupuesto // max(1, costo_iteracion)
+        total = restantes
+        suma = float(puntajes.sum()) or 1.0
+        asignaciones = []
+        for posicion in orden.tolist():
+            if restantes < self.min_por_individuo:
+                break
+            proporcional = int(round(total * puntajes[posicion] / suma))
+            iteraciones = min(
+                self.max_por_individuo, restantes,
+                max(self.min_por_individuo, proporcional),
+            )
+            asignaciones.append((frente[posicion], iteraciones))
+            restantes -= iteraciones
+        self.iteraciones_asignadas += sum(it for _, it in asignaciones)
+        return asignaciones
+    
+    def registrar(self, original, resultado, fitness_original, fitness_resultado, iteraciones):
+        """
+        Registra el resultado de mejorar a un miembro
+        
+        Args:
+            original: Chromosome antes de la búsqueda local
+            resultado: Chromosome devuelto por busqueda_local
+            fitness_original: Fitness del original
+            fitness_resultado: Fitness del resultado
+            iteraciones: Iteraciones asignadas al miembro
+        
+        Returns:
+            bool: True si el resultado domina al original
+        """
+        estadistica = self._estadistica(original.clave)
+        estadistica['intentos'] += 1
+        estadistica['iteraciones'] += iteraciones
+        mejoro = dominancia(fitness_resultado, fitness_original)
+        if mejoro:
+            estadistica['exitos'] += 1
+            estadistica['ultima_mejora'] = self.aplicaciones
+            self.mejoras += 1
+        # El historial sigue al linaje (el resultado reemplaza al original)
+        if resultado.clave != original.clave:
+            self.miembros[resultado.clave] = dict(estadistica)
+        return mejoro
+    
+    def estadisticas(self):
+        """
+        Returns:
+            dict: aplicaciones, iteraciones asignadas, mejoras y tasa de mejora
+                por iteración de la búsqueda local
+        """
+        return {
+            'local_aplicaciones': self.aplicaciones,
+            'local_iteraciones_asignadas': self.iteraciones_asignadas,
+            'local_mejoras': self.mejoras,
+            'local_mejoras_por_iteracion': (
+                self.mejoras / self.iteraciones_asignadas if self.iteraciones_asignadas else 0.0
+            ),
+        }
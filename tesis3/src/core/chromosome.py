@@ -1,18 +1,70 @@
 """Representación del cromosoma"""
+import hashlib
 import random
 from typing import List
-from copy import deepcopy
+
+import numpy as np
+
+# Tipo de los genes: máquinas 1-indexed en un array compacto (num_pedidos, num_etapas)
+DTYPE_GENES = np.int16
+
+# Bytes del digest usado como clave (cache de fitness, conjuntos de únicos)
+TAMANO_CLAVE = 16
 
 
 class Chromosome:
     """Representa una solución al problema HFS"""
-    
+
+    __slots__ = ('_genes', '_clave', 'config', '_fitness', '_objectives')
+
     def __init__(self, genes: List[List[int]], config):
-        self.genes = genes
+        self._genes = np.array(genes, dtype=DTYPE_GENES)
+        self._clave = None
         self.config = config
         self._fitness = None
         self._objectives = None
-    
+
+    @property
+    def genes(self) -> np.ndarray:
+        """
+        Genes como array (num_pedidos, num_etapas)
+        Se puede indexar como lista de listas: genes[pedido][etapa]
+        
+        El array es modificable, por lo que acceder a él invalida la clave;
+        para solo leer usar genes_lectura
+        """
+        self._clave = None
+        return self._genes
+
+    @genes.setter
+    def genes(self, genes):
+        self._genes = np.array(genes, dtype=DTYPE_GENES)
+        self._clave = None
+
+    @property
+    def genes_lectura(self) -> np.ndarray:
+        """Vista de solo lectura de los genes (no invalida la clave)"""
+        vista = self._genes.view()
+        vista.flags.writeable = False
+        return vista
+
+    @property
+    def clave(self) -> bytes:
+        """
+        Digest de los genes, usado como clave en caches y conjuntos
+        Se calcula una vez y se recalcula solo si los genes cambian
+        """
+        if self._clave is None:
+            self._clave = hashlib.blake2b(
+                self._genes.tobytes(), digest_size=TAMANO_CLAVE
+            ).digest()
+        return self._clave
+
+    def asignar_gen(self, pedido_idx, etapa, maquina):
+        """Asigna la máquina de un pedido en una etapa (0-indexed) e invalida la clave"""
+        self._genes[pedido_idx, etapa] = maquina
+        self._clave = None
+
     @classmethod
     def random(cls, config):
         """Genera cromosoma aleatorio válido"""
@@ -24,26 +76,48 @@ class Chromosome:
             ]
             genes.append(pedido)
         return cls(genes, config)
-    
+
     def is_valid(self) -> bool:
         """Verifica si el cromosoma es factible"""
-        if len(self.genes) != self.config.num_pedidos:
+        genes = self._genes
+        if genes.ndim != 2 or len(genes) != self.config.num_pedidos:
             return False
-        
-        for pedido in self.genes:
-            if len(pedido) != self.config.num_etapas:
+
+        if genes.shape[1] != self.config.num_etapas:
+            return False
+
+        for etapa_idx in range(self.config.num_etapas):
+            maquinas_validas = self.config.get_maquinas_etapa(etapa_idx + 1)
+            if not np.isin(genes[:, etapa_idx], maquinas_validas).all():
                 return False
-            
-            for etapa_idx, maquina in enumerate(pedido):
-                maquinas_validas = self.config.get_maquinas_etapa(etapa_idx + 1)
-                if maquina not in maquinas_validas:
-                    return False
-        
+
         return True
-    
+
     def copy(self):
-        """Crea una copia profunda del cromosoma"""
-        return Chromosome(deepcopy(self.genes), self.config)
-    
+        """Crea una copia independiente del cromosoma (copia del buffer de genes)"""
+        nuevo = Chromosome.__new__(Chromosome)
+        nuevo._genes = self._genes.copy()
+        nuevo._clave = self._clave
+        nuevo.config = self.config
+        nuevo._fitness = None
+        nuevo._objectives = None
+        return nuevo
+
+    def __getstate__(self):
+        return {
+            'genes': self._genes,
+            'config': self.config,
+            '_fitness': self._fitness,
+            '_objectives': self._objectives,
+        }
+
+    def __setstate__(self, state):
+        # Compatible con pickles anteriores (genes como lista de listas en __dict__)
+        self._genes = np.array(state['genes'], dtype=DTYPE_GENES)
+        self._clave = None
+        self.config = state['config']
+        self._fitness = state.get('_fitness')
+        self._objectives = state.get('_objectives')
+
     def __repr__(self):
-        return f"Chromosome({len(self.genes)} pedidos, valid={self.is_valid()})"
+        return f"Chromosome({len(self._genes)} pedidos, valid={self.is_valid()})"
@@ -1,10 +1,14 @@
 """Configuración del problema HFS"""
+import hashlib
+import json
 import yaml
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict
 from pathlib import Path
 
+import numpy as np
+
 
 @dataclass
 class ProblemConfig:
@@ -17,6 +21,7 @@ class ProblemConfig:
     maquinas_por_etapa: Dict[str, List[int]]
     enfriamiento: Dict[str, float]
     energia: Dict[str, any]
+    _compilado: "CompiledProblem" = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_yaml(cls, path: str = "config/config.yaml"):
@@ -44,4 +49,85 @@ class ProblemConfig:
     
     def get_maquinas_etapa(self, etapa: int) -> List[int]:
         """Obtiene máquinas disponibles para una etapa (1-indexed)"""
-        return self.maquinas_por_etapa[f'etapa_{etapa}']
\ No newline at end of file
+        return self.maquinas_por_etapa[f'etapa_{etapa}']
+    
+    def compilar(self) -> "CompiledProblem":
+        """
+        Devuelve el modelo compilado del problema (se construye una sola vez)
+        
+        Nota: si se modifican los parámetros después de compilar, llamar
+        CompiledProblem(config) para obtener tablas actualizadas.
+        """
+        if self._compilado is None:
+            self._compilado = CompiledProblem(self)
+        return self._compilado
+    
+    def huella(self) -> bytes:
+        """
+        Huella de la instancia (16 bytes): identifica los parámetros que afectan
+        al fitness, para compartir o persistir evaluaciones entre procesos
+        """
+        parametros = {
+            'num_pedidos': self.num_pedidos,
+            'num_maquinas': self.num_maquinas,
+            'num_etapas': self.num_etapas,
+            'tiempos_iniciales': self.tiempos_iniciales,
+            'incrementos': self.incrementos,
+            'maquinas_por_etapa': self.maquinas_por_etapa,
+            'enfriamiento': self.enfriamiento,
+            'energia': self.energia,
+        }
+        texto = json.dumps(parametros, sort_keys=True, default=str)
+        return hashlib.blake2b(texto.encode(), digest_size=16).digest()
+
+
+class CompiledProblem:
+    """
+    Modelo compilado del problema para los kernels de fitness
+    
+    Precalcula, para cada máquina y cada índice de uso k (número de trabajos que
+    la máquina ya procesó), el tiempo efectivo de trabajo con el incremento
+    compuesto y el enfriamiento ya aplicados. El kernel de fitness solo necesita
+    buscar tiempos_trabajo[maquina, k] en lugar de multiplicar en cada llamada.
+    """
+    
+    def __init__(self, config: ProblemConfig):
+        self.num_pedidos = config.num_pedidos
+        self.num_maquinas = config.num_maquinas
+        self.num_etapas = config.num_etapas
+        
+        limite_enfriamiento = config.enfriamiento['limite']
+        factor_enfriamiento = config.enfriamiento['factor']
+        tiempo_enfriamiento = config.enfriamiento['tiempo']
+        
+        # Una máquina válida se usa como máximo num_pedidos veces; se reserva una fila
+        # por gen para que un cromosoma inválido tampoco salga de la tabla
+        self.max_usos = config.num_pedidos * config.num_etapas
+        
+        tabla = []
+        for maquina in range(config.num_maquinas):
+            tiempo_inicial = config.tiempos_iniciales[maquina]
+            incremento = config.incrementos[maquina]
+            tiempo_actual = tiempo_inicial
+            fila = []
+            for _ in range(self.max_usos):
+                tiempo_trabajo = tiempo_actual
+                # Mismo orden de operaciones que la simulación original
+                if tiempo_trabajo >= tiempo_inicial * limite_enfriamiento:
+                    tiempo_trabajo += tiempo_enfriamiento
+                    tiempo_trabajo *= factor_enfriamiento
+                fila.append(tiempo_trabajo)
+                tiempo_actual *= 1 + incremento
+            tabla.append(fila)
+        
+        # (num_maquinas, max_usos): tiempo efectivo del k-ésimo trabajo de cada máquina
+        self.tiempos_trabajo = np.ascontiguousarray(tabla, dtype=np.float64)
+        # Copia en listas para el kernel escalar (indexar listas es más rápido que arrays)
+        self.tiempos_trabajo_lista = tabla
+        
+        self.potencias_activas = np.ascontiguousarray(
+            config.energia['potencias_activas'], dtype=np.float64
+        )
+        self.potencias_inactivas = np.ascontiguousarray(
+            config.energia['potencias_inactivas'], dtype=np.float64
+        )
@@ -0,0 +1,114 @@
+"""Almacén persistente de evaluaciones (SQLite)
+
+Guarda fitness_multiobjetivo por (huella de la instancia, clave del cromosoma),
+de modo que las evaluaciones sobreviven entre procesos y sesiones (p. ej. al
+reanudar un experimento interrumpido). Se usa como respaldo de CacheFitness:
+    cache = CacheFitness(respaldo=AlmacenEvaluaciones('evaluaciones.sqlite', config))
+
+Costo aproximado por entrada en lote: ~1.5 us por consulta fallida y ~3.5 us por
+inserción, frente a ~40 us de simulación con el backend Python (con numba la
+simulación cuesta ~4 us y el almacén apenas compensa).
+"""
+import os
+import sqlite3
+
+# Límite de parámetros por consulta (SQLITE_MAX_VARIABLE_NUMBER es 999 en versiones antiguas)
+TAMANO_BLOQUE = 500
+# Activa el almacén en los scripts de experimentos (valor = ruta del archivo SQLite)
+VARIABLE_ENTORNO = 'TESIS3_ALMACEN_EVALUACIONES'
+
+
+class AlmacenEvaluaciones:
+    """Evaluaciones persistentes clave -> fitness de una instancia del problema"""
+    
+    def __init__(self, ruta, config):
+        """
+        Args:
+            ruta: Archivo SQLite (se crea si no existe)
+            config: ProblemConfig; solo se leen/escriben evaluaciones de su huella
+        """
+        self.ruta = str(ruta)
+        self.huella = config.huella()
+        self.aciertos = 0
+        self.fallos = 0
+        self.escrituras = 0
+        
+        self._conexion = sqlite3.connect(self.ruta, timeout=60)
+        # WAL: lectores y escritores de varios procesos no se bloquean entre sí
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        self._conexion.execute("PRAGMA synchronous=NORMAL")
+        self._conexion.execute(
+            """
+            CREATE TABLE IF NOT EXISTS evaluaciones (
+                huella BLOB NOT NULL,
+                clave BLOB NOT NULL,
+                obj_makespan REAL NOT NULL,
+                obj_balance REAL NOT NULL,
+                obj_energia REAL NOT NULL,
+                PRIMARY KEY (huella, clave)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conexion.commit()
+    
+    def __len__(self):
+        fila = self._conexion.execute(
+            "SELECT COUNT(*) FROM evaluaciones WHERE huella = ?", (self.huella,)
+        ).fetchone()
+        return fila[0]
+    
+    def buscar_lote(self, claves):
+        """
+        Args:
+            claves: Iterable de claves (bytes)
+        
+        Returns:
+            dict: clave -> fitness para las claves encontradas
+        """
+        claves = list(claves)
+        encontrados = {}
+        for inicio in range(0, len(claves), TAMANO_BLOQUE):
+            bloque = claves[inicio:inicio + TAMANO_BLOQUE]
+            marcadores = ",".join("?" * len(bloque))
+            filas = self._conexion.execute(
+                "SELECT clave, obj_makespan, obj_balance, obj_energia FROM evaluaciones "
+                f"WHERE huella = ? AND clave IN ({marcadores})",
+                (self.huella, *bloque),
+            )
+            for clave, obj_makespan, obj_balance, obj_energia in filas:
+                encontrados[bytes(clave)] = (obj_makespan, obj_balance, obj_energia)
+        self.aciertos += len(encontrados)
+        self.fallos += len(claves) - len(encontrados)
+        return encontrados
+    
+    def guardar_lote(self, entradas):
+        """
+        Guarda un lote de evaluaciones en una sola transacción
+        
+        Args:
+            entradas: dict (o iterable de pares) clave -> fitness
+        """
+        items = entradas.items() if isinstance(entradas, dict) else entradas
+        filas = [(self.huella, clave, *fitness) for clave, fitness in items]
+        if not filas:
+            return
+        with self._conexion:
+            self._conexion.executemany(
+                "INSERT OR IGNORE INTO evaluaciones VALUES (?, ?, ?, ?, ?)", filas
+            )
+        self.escrituras += len(filas)
+    
+    def cerrar(self):
+        """Cierra la conexión"""
+        self._conexion.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def ruta_almacen_desde_entorno():
+    """Ruta del almacén si TESIS3_ALMACEN_EVALUACIONES está definida, o None"""
+    return os.environ.get(VARIABLE_ENTORNO, '').strip() or None
@@ -0,0 +1,156 @@
+"""Cache de fitness acotado (LRU) con contadores de uso y memoria"""
+import sys
+from collections import OrderedDict
+
+# Tamaño por defecto: ~100k entradas (~30 MB) cubre corridas de 200 ind x 600 gen
+# con la mayor parte de los individuos recientes en cache
+MAX_ENTRADAS_POR_DEFECTO = 100_000
+
+# Overhead aproximado de una entrada del OrderedDict (slot del dict + nodo de la lista)
+_BYTES_NODO = 100
+
+
+def _bytes_entrada(clave, fitness):
+    """Estimación de los bytes que ocupa una entrada clave -> fitness"""
+    return (
+        _BYTES_NODO
+        + sys.getsizeof(clave)
+        + sys.getsizeof(fitness)
+        + sum(sys.getsizeof(valor) for valor in fitness)
+    )
+
+
+class CacheFitness:
+    """
+    Cache clave -> fitness con desalojo LRU
+    
+    Se usa como un dict (get, [], in, len) desde evaluar_con_cache.
+    Se acota por número de entradas y/o por bytes estimados; al superar el límite
+    se desaloja la entrada usada hace más tiempo.
+    
+    Opcionalmente tiene un respaldo (p. ej. MemoCompartido) con buscar_lote/guardar_lote
+    que evaluar_con_cache consulta antes de evaluar los fallos.
+    """
+    
+    def __init__(self, max_entradas=MAX_ENTRADAS_POR_DEFECTO, max_bytes=None, respaldo=None):
+        """
+        Args:
+            max_entradas: Máximo de entradas (None = sin límite)
+            max_bytes: Máximo de bytes estimados (None = sin límite)
+            respaldo: Almacén de segundo nivel con buscar_lote(claves) -> dict
+                y guardar_lote(dict), o None
+        """
+        if max_entradas is not None and max_entradas < 1:
+            raise ValueError("max_entradas debe ser >= 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes debe ser >= 1")
+        
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self.respaldo = respaldo
+        self._datos = OrderedDict()
+        self.bytes_estimados = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        # Fallos locales resueltos por el respaldo (evaluaciones ahorradas)
+        self.aciertos_respaldo = 0
+    
+    def __len__(self):
+        return len(self._datos)
+    
+    def __contains__(self, clave):
+        return clave in self._datos
+    
+    def get(self, clave, default=None):
+        """Busca una clave; cuenta acierto/fallo y la marca como usada recientemente"""
+        fitness = self._datos.get(clave)
+        if fitness is None:
+            self.fallos += 1
+            return default
+        self.aciertos += 1
+        self._datos.move_to_end(clave)
+        return fitness
+    
+    def __getitem__(self, clave):
+        fitness = self.get(clave)
+        if fitness is None:
+            raise KeyError(clave)
+        return fitness
+    
+    def __setitem__(self, clave, fitness):
+        anterior = self._datos.pop(clave, None)
+        if anterior is not None:
+            self.bytes_estimados -= _bytes_entrada(clave, anterior)
+        self._datos[clave] = fitness
+        self.bytes_estimados += _bytes_entrada(clave, fitness)
+        self._desalojar()
+    
+    def _desalojar(self):
+        """Desaloja las entradas menos usadas hasta cumplir los límites"""
+        while len(self._datos) > 1 and (
+            (self.max_entradas is not None and len(self._datos) > self.max_entradas)
+            or (self.max_bytes is not None and self.bytes_estimados > self.max_bytes)
+        ):
+            clave, fitness = self._datos.popitem(last=False)
+            self.bytes_estimados -= _bytes_entrada(clave, fitness)
+            self.desalojos += 1
+    
+    def limpiar(self):
+        """Vacía el cache (los contadores se mantienen)"""
+        self._datos.clear()
+        self.bytes_estimados = 0
+    
+    def estadisticas(self):
+        """
+        Contadores de uso del cache
+        
+        Returns:
+            dict: cache_aciertos, cache_fallos, cache_desalojos, cache_entradas,
+                cache_bytes, cache_tasa_aciertos y cache_aciertos_respaldo
+        """
+        consultas = self.aciertos + self.fallos
+        return {
+            'cache_aciertos': self.aciertos,
+            'cache_fallos': self.fallos,
+            'cache_desalojos': self.desalojos,
+            'cache_entradas': len(self._datos),
+            'cache_bytes': self.bytes_estimados,
+            'cache_tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+            'cache_aciertos_respaldo': self.aciertos_respaldo,
+        }
+
+
+class RespaldoEncadenado:
+    """
+    Varios respaldos en cascada (p. ej. memo compartido -> almacén persistente)
+    
+    Se busca en orden; lo encontrado en un nivel inferior se copia a los superiores.
+    Las nuevas evaluaciones se guardan en todos los niveles.
+    """
+    
+    def __init__(self, niveles):
+        """
+        Args:
+            niveles: Lista de respaldos con buscar_lote/guardar_lote, del más rápido al más lento
+        """
+        self.niveles = list(niveles)
+    
+    def buscar_lote(self, claves):
+        pendientes = list(claves)
+        encontrados = {}
+        for posicion, nivel in enumerate(self.niveles):
+            if not pendientes:
+                break
+            nuevos = nivel.buscar_lote(pendientes)
+            if nuevos:
+                for superior in self.niveles[:posicion]:
+                    superior.guardar_lote(nuevos)
+                encontrados.update(nuevos)
+                pendientes = [clave for clave in pendientes if clave not in nuevos]
+        return encontrados
+    
+    def guardar_lote(self, entradas):
+        entradas = dict(entradas)
+        for nivel in self.niveles:
+            nivel.guardar_lote(entradas)
@@ -0,0 +1,116 @@
+"""Re-evaluación incremental (delta) de movimientos de un solo gen"""
+from tesis3.src.fitness.multi_objective import objetivos_desde_tiempos
+
+
+class EvaluadorIncremental:
+    """
+    Evalúa vecinos que difieren en un solo gen (pedido, etapa) de un cromosoma base
+    
+    Guarda un checkpoint del estado de la simulación antes de cada pedido
+    (disponibilidad, usos y tiempo acumulado por máquina, makespan parcial).
+    Evaluar un cambio en el pedido i solo re-simula los pedidos i..N-1, con
+    resultados idénticos a fitness_multiobjetivo.
+    """
+    
+    def __init__(self, chromosome, config):
+        """
+        Args:
+            chromosome: Chromosome base
+            config: ProblemConfig
+        """
+        self.config = config
+        self._tiempos_trabajo = config.compilar().tiempos_trabajo_lista
+        self.genes = [[int(maquina) for maquina in pedido] for pedido in chromosome.genes_lectura]
+        
+        num_pedidos = len(self.genes)
+        num_maquinas = config.num_maquinas
+        # Checkpoint k = estado antes de procesar el pedido k (k = num_pedidos: estado final)
+        self._disponibilidad = [None] * (num_pedidos + 1)
+        self._usos = [None] * (num_pedidos + 1)
+        self._tiempo_uso = [None] * (num_pedidos + 1)
+        self._tiempo_total = [0] * (num_pedidos + 1)
+        self._disponibilidad[0] = [0] * num_maquinas
+        self._usos[0] = [0] * num_maquinas
+        self._tiempo_uso[0] = [0] * num_maquinas
+        
+        self._simular(self.genes, 0, guardar=True)
+        self.fitness = self._objetivos_finales()
+    
+    def _simular(self, genes, desde, guardar=False, pedido_modificado=None):
+        """
+        Re-simula los pedidos desde..N-1 partiendo del checkpoint 'desde'
+        
+        Args:
+            genes: Genes a simular (lista de listas)
+            desde: Índice del primer pedido a simular
+            guardar: Si True, actualiza los checkpoints posteriores
+            pedido_modificado: Pedido que reemplaza a genes[desde] (sin modificar genes)
+        
+        Returns:
+            tuple: (tiempo_total, tiempo_uso_maquinas) al final de la simulación
+        """
+        tiempos_trabajo = self._tiempos_trabajo
+        disponibilidad_maquinas = self._disponibilidad[desde][:]
+        usos_maquinas = self._usos[desde][:]
+        tiempo_uso_maquinas = self._tiempo_uso[desde][:]
+        tiempo_total = self._tiempo_total[desde]
+        
+        for i in range(desde, len(genes)):
+            pedido = genes[i]
+            if i == desde and pedido_modificado is not None:
+                pedido = pedido_modificado
+            tiempo_pedido = 0
+            
+            for maquina in pedido:
+                m = maquina - 1
+                tiempo_inicio = max(disponibilidad_maquinas[m], tiempo_pedido)
+                tiempo_trabajo = tiempos_trabajo[m][usos_maquinas[m]]
+                
+                usos_maquinas[m] += 1
+                tiempo_pedido = tiempo_inicio + tiempo_trabajo
+                disponibilidad_maquinas[m] = tiempo_pedido
+                tiempo_uso_maquinas[m] += tiempo_trabajo
+            
+            tiempo_total = max(tiempo_total, tiempo_pedido)
+            
+            if guardar:
+                self._disponibilidad[i + 1] = disponibilidad_maquinas[:]
+                self._usos[i + 1] = usos_maquinas[:]
+                self._tiempo_uso[i + 1] = tiempo_uso_maquinas[:]
+                self._tiempo_total[i + 1] = tiempo_total
+        
+        return tiempo_total, tiempo_uso_maquinas
+    
+    def _objetivos_finales(self):
+        """Objetivos del cromosoma base a partir del último checkpoint"""
+        return objetivos_desde_tiempos(
+            self._tiempo_total[-1], self._tiempo_uso[-1], self.config
+        )
+    
+    def evaluar_movimiento(self, pedido_idx, etapa, maquina):
+        """
+        Evalúa el vecino que asigna 'maquina' al gen (pedido_idx, etapa)
+        sin modificar el cromosoma base
+        
+        Returns:
+            tuple: (obj_makespan, obj_balance, obj_energia) del vecino
+        """
+        pedido = self.genes[pedido_idx][:]
+        pedido[etapa] = maquina
+        tiempo_total, tiempo_uso = self._simular(
+            self.genes, pedido_idx, pedido_modificado=pedido
+        )
+        return objetivos_desde_tiempos(tiempo_total, tiempo_uso, self.config)
+    
+    def aplicar_movimiento(self, pedido_idx, etapa, maquina):
+        """
+        Aplica el movimiento al cromosoma base y actualiza los checkpoints
+        desde pedido_idx en adelante
+        
+        Returns:
+            tuple: Nuevo fitness del cromosoma base
+        """
+        self.genes[pedido_idx][etapa] = maquina
+        self._simular(self.genes, pedido_idx, guardar=True)
+        self.fitness = self._objetivos_finales()
+        return self.fitness
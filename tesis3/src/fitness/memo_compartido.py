@@ -0,0 +1,279 @@
+"""Memo de fitness compartido entre procesos (multiprocessing.shared_memory)
+
+Tabla hash de direccionamiento abierto en memoria compartida, clave = digest del
+cromosoma (Chromosome.clave). Todos los workers de un experimento leen y escriben
+sin locks: cada entrada lleva un checksum, y una entrada a medio escribir (o
+pisada por otro worker) no valida y se trata como fallo. Al ser un cache, las
+colisiones simplemente sobrescriben.
+
+Uso típico:
+    memo = MemoCompartido.crear(config)                  # proceso principal
+    ProcessPoolExecutor(initializer=inicializar_worker,
+                        initargs=(memo.nombre, config))
+    cache = cache_del_worker()                           # dentro de cada tarea
+    memo.liberar()                                       # al terminar
+"""
+import hashlib
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from tesis3.src.core.chromosome import TAMANO_CLAVE
+from tesis3.src.fitness.almacen import AlmacenEvaluaciones
+from tesis3.src.fitness.cache import CacheFitness, RespaldoEncadenado
+
+MAGIA = b'HFSMEMO1'
+TAMANO_CABECERA = 64
+# Por entrada: clave (16) + 3 objetivos float64 (24) + checksum uint64 (8)
+BYTES_POR_ENTRADA = TAMANO_CLAVE + 3 * 8 + 8
+NUM_ENTRADAS_POR_DEFECTO = 1 << 20
+MAX_SONDEOS = 8
+# Activa el memo en los scripts de experimentos: "1" (tamaño por defecto) o num_entradas
+VARIABLE_ENTORNO = 'TESIS3_MEMO_COMPARTIDO'
+
+
+def _checksum(clave, valores):
+    """Checksum no nulo de una entrada (0 marca entrada vacía o en escritura)"""
+    digest = hashlib.blake2b(clave + valores, digest_size=8).digest()
+    return int.from_bytes(digest, 'little') | 1
+
+
+class MemoCompartido:
+    """Tabla clave -> fitness en memoria compartida, sin locks"""
+    
+    def __init__(self, memoria, propietario):
+        """Usar MemoCompartido.crear o MemoCompartido.conectar"""
+        self._memoria = memoria
+        self._propietario = propietario
+        
+        cabecera = memoria.buf[:TAMANO_CABECERA]
+        if bytes(cabecera[:8]) != MAGIA:
+            raise ValueError(f"{memoria.name} no es un memo de fitness")
+        self.num_entradas = int.from_bytes(cabecera[8:16], 'little')
+        self.huella = bytes(cabecera[16:16 + 16])
+        
+        n = self.num_entradas
+        desplazamiento = TAMANO_CABECERA
+        self._claves = np.ndarray(
+            (n, TAMANO_CLAVE), dtype=np.uint8, buffer=memoria.buf, offset=desplazamiento
+        )
+        desplazamiento += n * TAMANO_CLAVE
+        self._valores = np.ndarray(
+            (n, 3), dtype=np.float64, buffer=memoria.buf, offset=desplazamiento
+        )
+        desplazamiento += n * 3 * 8
+        self._control = np.ndarray(
+            (n,), dtype=np.uint64, buffer=memoria.buf, offset=desplazamiento
+        )
+        
+        # Contadores locales del proceso
+        self.aciertos = 0
+        self.fallos = 0
+        self.escrituras = 0
+    
+    @classmethod
+    def crear(cls, config, num_entradas=NUM_ENTRADAS_POR_DEFECTO):
+        """
+        Crea el memo en memoria compartida (proceso principal)
+        
+        Args:
+            config: ProblemConfig de la instancia (se guarda su huella)
+            num_entradas: Capacidad, se redondea a potencia de 2
+        
+        Returns:
+            MemoCompartido (propietario: debe llamar liberar() al terminar)
+        """
+        num_entradas = 1 << max(0, int(num_entradas) - 1).bit_length()
+        tamano = TAMANO_CABECERA + num_entradas * BYTES_POR_ENTRADA
+        memoria = shared_memory.SharedMemory(create=True, size=tamano)
+        memoria.buf[:tamano] = bytes(tamano)
+        memoria.buf[:8] = MAGIA
+        memoria.buf[8:16] = num_entradas.to_bytes(8, 'little')
+        memoria.buf[16:32] = config.huella()
+        return cls(memoria, propietario=True)
+    
+    @classmethod
+    def conectar(cls, nombre, config):
+        """
+        Se conecta a un memo existente (workers)
+        
+        Raises:
+            ValueError: Si el memo pertenece a otra instancia del problema
+        """
+        memoria = shared_memory.SharedMemory(name=nombre)
+        memo = cls(memoria, propietario=False)
+        if memo.huella != config.huella():
+            memo.cerrar()
+            raise ValueError("El memo compartido corresponde a otra instancia del problema")
+        return memo
+    
+    @property
+    def nombre(self):
+        return self._memoria.name
+    
+    def _posicion(self, clave):
+        return int.from_bytes(clave[:8], 'little') & (self.num_entradas - 1)
+    
+    def buscar(self, clave):
+        """Devuelve el fitness guardado para la clave, o None"""
+        mascara = self.num_entradas - 1
+        posicion = self._posicion(clave)
+        for sondeo in range(MAX_SONDEOS):
+            i = (posicion + sondeo) & mascara
+            control = int(self._control[i])
+            if control == 0:
+                break
+            if self._claves[i].tobytes() != clave:
+                continue
+            valores = self._valores[i].tobytes()
+            # Validar contra escrituras concurrentes
+            if control == int(self._control[i]) and control == _checksum(clave, valores):
+                self.aciertos += 1
+                return tuple(np.frombuffer(valores, dtype=np.float64).tolist())
+            break
+        self.fallos += 1
+        return None
+    
+    def guardar(self, clave, fitness):
+        """Guarda (o sobrescribe) la entrada de la clave"""
+        mascara = self.num_entradas - 1
+        posicion = self._posicion(clave)
+        destino = posicion
+        for sondeo in range(MAX_SONDEOS):
+            i = (posicion + sondeo) & mascara
+            if int(self._control[i]) == 0 or self._claves[i].tobytes() == clave:
+                destino = i
+                break
+        
+        valores = np.asarray(fitness, dtype=np.float64)
+        self._control[destino] = 0
+        self._claves[destino] = np.frombuffer(clave, dtype=np.uint8)
+        self._valores[destino] = valores
+        self._control[destino] = _checksum(clave, valores.tobytes())
+        self.escrituras += 1
+    
+    def buscar_lote(self, claves):
+        """
+        Args:
+            claves: Iterable de claves (bytes)
+        
+        Returns:
+            dict: clave -> fitness para las claves encontradas
+        """
+        encontrados = {}
+        for clave in claves:
+            fitness = self.buscar(clave)
+            if fitness is not None:
+                encontrados[clave] = fitness
+        return encontrados
+    
+    def guardar_lote(self, entradas):
+        """
+        Args:
+            entradas: dict (o iterable de pares) clave -> fitness
+        """
+        items = entradas.items() if isinstance(entradas, dict) else entradas
+        for clave, fitness in items:
+            self.guardar(clave, fitness)
+    
+    def ocupacion(self):
+        """Fracción de entradas ocupadas"""
+        return float(np.count_nonzero(self._control)) / self.num_entradas
+    
+    def cerrar(self):
+        """Libera las vistas y cierra la conexión de este proceso"""
+        self._claves = self._valores = self._control = None
+        self._memoria.close()
+    
+    def liberar(self):
+        """Cierra y elimina el segmento de memoria (solo el proceso que lo creó)"""
+        self.cerrar()
+        if self._propietario:
+            self._memoria.unlink()
+
+
+# ---------------------------------------------------------------------------
+# Integración con ProcessPoolExecutor
+# ---------------------------------------------------------------------------
+
+_respaldo_worker = None
+
+
+def memo_desde_entorno(config):
+    """
+    Crea el memo si la variable TESIS3_MEMO_COMPARTIDO está activa
+    
+    Returns:
+        MemoCompartido o None (opción desactivada)
+    """
+    valor = os.environ.get(VARIABLE_ENTORNO, '').strip()
+    if valor in ('', '0'):
+        return None
+    num_entradas = int(valor)
+    if num_entradas <= 1:
+        num_entradas = NUM_ENTRADAS_POR_DEFECTO
+    return MemoCompartido.crear(config, num_entradas)
+
+
+def reportar_memo(memo, resultados):
+    """
+    Imprime las evaluaciones ahorradas en todo el pool (el memo se libera
+    aparte, en un finally alrededor del pool)
+    
+    Args:
+        memo: MemoCompartido (o None)
+        resultados: Dicts de resultado con 'cache_aciertos_respaldo'
+    
+    Returns:
+        int: Evaluaciones resueltas por el memo (o el almacén persistente)
+            en lugar de simularse
+    """
+    ahorradas = sum(r.get('cache_aciertos_respaldo', 0) for r in resultados)
+    if memo is None:
+        if ahorradas:
+            print(f"Almacén de evaluaciones: {ahorradas} evaluaciones ahorradas")
+        return ahorradas
+    print(
+        f"Memo compartido: {ahorradas} evaluaciones ahorradas entre workers "
+        f"(ocupación {memo.ocupacion():.1%})"
+    )
+    return ahorradas
+
+
+def inicializar_worker(nombre, config, ruta_almacen=None):
+    """
+    initializer de ProcessPoolExecutor: conecta el worker al memo compartido y/o
+    al almacén persistente de evaluaciones
+    
+    Args:
+        nombre: Nombre del MemoCompartido (None = sin memo)
+        config: ProblemConfig
+        ruta_almacen: Archivo de AlmacenEvaluaciones (None = sin almacén)
+    """
+    global _respaldo_worker
+    niveles = []
+    if nombre:
+        niveles.append(MemoCompartido.conectar(nombre, config))
+    if ruta_almacen:
+        niveles.append(AlmacenEvaluaciones(ruta_almacen, config))
+    
+    if not niveles:
+        _respaldo_worker = None
+    elif len(niveles) == 1:
+        _respaldo_worker = niveles[0]
+    else:
+        _respaldo_worker = RespaldoEncadenado(niveles)
+
+
+def cache_del_worker():
+    """
+    Cache de fitness para una tarea del worker
+    
+    Returns:
+        CacheFitness respaldado por el memo compartido y/o el almacén, o None
+        si no hay respaldo (el algoritmo crea su cache por defecto)
+    """
+    if _respaldo_worker is None:
+        return None
+    return CacheFitness(respaldo=_respaldo_worker)
@@ -1,6 +1,8 @@
 """Función de fitness multiobjetivo (3 objetivos)"""
 import numpy as np
 
+from tesis3.src.utils import aceleracion
+
 
 def fitness_multiobjetivo(chromosome, config):
     """
@@ -14,17 +16,26 @@ def fitness_multiobjetivo(chromosome, config):
     Returns:
         tuple: (obj_makespan, obj_balance, obj_energia)
     """
-    genes = chromosome.genes
-    tiempos_iniciales = config.tiempos_iniciales
-    incrementos = config.incrementos
-    limite_enfriamiento = config.enfriamiento['limite']
-    factor_enfriamiento = config.enfriamiento['factor']
-    tiempo_enfriamiento = config.enfriamiento['tiempo']
+    genes = chromosome.genes_lectura
+    problema = config.compilar()
+    
+    if aceleracion.usar_kernel_fitness(config.num_maquinas):
+        return aceleracion.simular_cromosoma(
+            np.asarray(genes, dtype=np.int64),
+            problema.tiempos_trabajo,
+            problema.potencias_activas,
+            problema.potencias_inactivas,
+        )
+    
+    # Tiempo efectivo (incremento y enfriamiento ya aplicados) del k-ésimo trabajo
+    tiempos_trabajo = problema.tiempos_trabajo_lista
+    # El bucle es más rápido sobre enteros de Python que sobre escalares NumPy
+    genes = np.asarray(genes).tolist()
     
     # Inicializar
-    disponibilidad_maquinas = {i: 0 for i in range(1, config.num_maquinas + 1)}
-    tiempos_actuales = tiempos_iniciales[:]
-    tiempo_uso_maquinas = {i: 0 for i in range(1, config.num_maquinas + 1)}
+    disponibilidad_maquinas = [0] * config.num_maquinas
+    usos_maquinas = [0] * config.num_maquinas
+    tiempo_uso_maquinas = [0] * config.num_maquinas
     
     tiempo_total = 0
     
@@ -33,27 +44,38 @@ def fitness_multiobjetivo(chromosome, config):
         tiempo_pedido = 0
         
         for maquina in pedido:
-            tiempo_inicio = max(disponibilidad_maquinas[maquina], tiempo_pedido)
-            tiempo_trabajo = tiempos_actuales[maquina - 1]
-            
-            # Verificar enfriamiento (afecta el makespan pero no es objetivo)
-            if tiempo_trabajo >= tiempos_iniciales[maquina - 1] * limite_enfriamiento:
-                tiempo_trabajo += tiempo_enfriamiento  # Añadir tiempo de enfriamiento
-                tiempo_trabajo *= factor_enfriamiento   # Reducir eficiencia
+            m = maquina - 1
+            tiempo_inicio = max(disponibilidad_maquinas[m], tiempo_pedido)
+            # El enfriamiento (afecta el makespan pero no es objetivo) ya está en la tabla
+            tiempo_trabajo = tiempos_trabajo[m][usos_maquinas[m]]
             
             # Actualizar tiempos
-            tiempos_actuales[maquina - 1] *= 1 + incrementos[maquina - 1]
-            disponibilidad_maquinas[maquina] = tiempo_inicio + tiempo_trabajo
-            tiempo_uso_maquinas[maquina] += tiempo_trabajo
+            usos_maquinas[m] += 1
             tiempo_pedido = tiempo_inicio + tiempo_trabajo
+            disponibilidad_maquinas[m] = tiempo_pedido
+            tiempo_uso_maquinas[m] += tiempo_trabajo
         
         tiempo_total = max(tiempo_total, tiempo_pedido)
     
+    return objetivos_desde_tiempos(tiempo_total, tiempo_uso_maquinas, config)
+
+
+def objetivos_desde_tiempos(tiempo_total, tiempo_uso_maquinas, config):
+    """
+    Calcula los 3 objetivos a partir del resultado de la simulación
+    
+    Args:
+        tiempo_total: Makespan de la simulación
+        tiempo_uso_maquinas: Lista con el tiempo de trabajo acumulado por máquina
+        config: Instancia de ProblemConfig
+    
+    Returns:
+        tuple: (obj_makespan, obj_balance, obj_energia)
+    """
     # Calcular objetivos
     objetivo_makespan = 1 / tiempo_total if tiempo_total > 0 else 0
     
-    tiempos_uso = list(tiempo_uso_maquinas.values())
-    desviacion_std = np.std(tiempos_uso)
+    desviacion_std = np.std(tiempo_uso_maquinas)
     objetivo_balance = 1 / (desviacion_std + 1) ## Verificar el balance de carga por iqr
     
     # Calcular energía (sin enfriamiento como objetivo separado)
@@ -61,15 +83,118 @@ def fitness_multiobjetivo(chromosome, config):
     potencias_inactivas = config.energia['potencias_inactivas']
     
     energia_total = 0
-    for i in range(1, config.num_maquinas + 1):
+    for i in range(config.num_maquinas):
         tiempo_activo_hrs = tiempo_uso_maquinas[i] / 60
         tiempo_inactivo_hrs = (tiempo_total - tiempo_uso_maquinas[i]) / 60
         
-        energia_activa = potencias_activas[i - 1] * tiempo_activo_hrs
-        energia_inactiva = potencias_inactivas[i - 1] * tiempo_inactivo_hrs
+        energia_activa = potencias_activas[i] * tiempo_activo_hrs
+        energia_inactiva = potencias_inactivas[i] * tiempo_inactivo_hrs
         
         energia_total += energia_activa + energia_inactiva
     
     objetivo_energia = 1 / (energia_total + 1)
     
-    return objetivo_makespan, objetivo_balance, objetivo_energia
\ No newline at end of file
+    return objetivo_makespan, objetivo_balance, objetivo_energia
+
+
+def evaluar_poblacion(genes_array, config):
+    """
+    Evalúa los 3 objetivos para una población completa de forma vectorizada
+    Simula todos los individuos a la vez (vectorizado sobre el eje de población)
+    y reproduce exactamente las operaciones de fitness_multiobjetivo
+    
+    Args:
+        genes_array: Array entero (P, num_pedidos, num_etapas) con las máquinas asignadas
+        config: Instancia de ProblemConfig
+    
+    Returns:
+        np.ndarray: Array (P, 3) con (obj_makespan, obj_balance, obj_energia) por individuo
+    """
+    genes_array = np.asarray(genes_array)
+    if genes_array.ndim != 3:
+        raise ValueError(
+            f"Se esperaba un array (P, num_pedidos, num_etapas), encontrado {genes_array.shape}"
+        )
+    
+    num_individuos, num_pedidos, num_etapas = genes_array.shape
+    num_maquinas = config.num_maquinas
+    if num_individuos == 0:
+        return np.zeros((0, 3))
+    
+    problema = config.compilar()
+    tiempos_trabajo = problema.tiempos_trabajo
+    
+    if aceleracion.usar_kernel_fitness(config.num_maquinas):
+        return aceleracion.simular_lote(
+            np.ascontiguousarray(genes_array, dtype=np.int64),
+            tiempos_trabajo,
+            problema.potencias_activas,
+            problema.potencias_inactivas,
+        )
+    
+    # Índices de máquina 0-indexed para todo el lote
+    maquinas = genes_array.astype(np.intp) - 1
+    filas = np.arange(num_individuos)
+    
+    # Estado de la simulación por individuo: (P, num_maquinas)
+    disponibilidad_maquinas = np.zeros((num_individuos, num_maquinas))
+    usos_maquinas = np.zeros((num_individuos, num_maquinas), dtype=np.intp)
+    tiempo_uso_maquinas = np.zeros((num_individuos, num_maquinas))
+    tiempo_total = np.zeros(num_individuos)
+    
+    for pedido in range(num_pedidos):
+        tiempo_pedido = np.zeros(num_individuos)
+        
+        for etapa in range(num_etapas):
+            maquina = maquinas[:, pedido, etapa]
+            tiempo_inicio = np.maximum(disponibilidad_maquinas[filas, maquina], tiempo_pedido)
+            # Búsqueda en la tabla precalculada (incremento y enfriamiento incluidos)
+            tiempo_trabajo = tiempos_trabajo[maquina, usos_maquinas[filas, maquina]]
+            
+            usos_maquinas[filas, maquina] += 1
+            tiempo_pedido = tiempo_inicio + tiempo_trabajo
+            disponibilidad_maquinas[filas, maquina] = tiempo_pedido
+            tiempo_uso_maquinas[filas, maquina] += tiempo_trabajo
+        
+        tiempo_total = np.maximum(tiempo_total, tiempo_pedido)
+    
+    objetivos = np.empty((num_individuos, 3))
+    
+    con_tiempo = tiempo_total > 0
+    objetivos[:, 0] = np.where(con_tiempo, 1 / np.where(con_tiempo, tiempo_total, 1), 0)
+    objetivos[:, 1] = 1 / (np.std(tiempo_uso_maquinas, axis=1) + 1)
+    
+    # Energía: acumular máquina por máquina (mismo orden de suma que la versión escalar)
+    potencias_activas = problema.potencias_activas
+    potencias_inactivas = problema.potencias_inactivas
+    energia_total = np.zeros(num_individuos)
+    for i in range(num_maquinas):
+        tiempo_activo_hrs = tiempo_uso_maquinas[:, i] / 60
+        tiempo_inactivo_hrs = (tiempo_total - tiempo_uso_maquinas[:, i]) / 60
+        
+        energia_activa = potencias_activas[i] * tiempo_activo_hrs
+        energia_inactiva = potencias_inactivas[i] * tiempo_inactivo_hrs
+        
+        energia_total += energia_activa + energia_inactiva
+    
+    objetivos[:, 2] = 1 / (energia_total + 1)
+    
+    return objetivos
+
+
+def evaluar_individuos(individuos, config):
+    """
+    Evalúa una lista de Chromosome en una sola llamada a evaluar_poblacion
+    
+    Args:
+        individuos: Lista de Chromosome
+        config: Instancia de ProblemConfig
+    
+    Returns:
+        List[tuple]: Fitness (obj_makespan, obj_balance, obj_energia) por individuo,
+            idénticos a los de fitness_multiobjetivo
+    """
+    if len(individuos) == 0:
+        return []
+    genes_array = np.array([ind.genes_lectura for ind in individuos])
+    return [tuple(fila) for fila in evaluar_poblacion(genes_array, config).tolist()]
@@ -0,0 +1,210 @@
+"""Evaluación de fitness en paralelo dentro de una corrida (pool persistente)
+
+Los workers se crean una sola vez por corrida: cada uno recibe el ProblemConfig
+en el initializer (y compila el problema) y se conecta a dos bloques de memoria
+compartida, uno con los genes del lote y otro con los resultados. Por cada lote
+solo viajan por el pool los límites (inicio, fin) de cada bloque.
+
+Los fitness son idénticos a los de evaluar_individuos: cada fila de
+evaluar_poblacion se simula por separado, así que partir el lote no cambia los
+resultados ni el consumo de números aleatorios de la corrida.
+
+Uso típico:
+    with EvaluadorParalelo(config, num_workers=4) as evaluador:
+        nsga2(config, ..., evaluador=evaluador)
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from tesis3.src.fitness.multi_objective import evaluar_individuos, evaluar_poblacion
+
+# Individuos por ronda (tamaño de los buffers compartidos)
+CAPACIDAD_POR_DEFECTO = 4096
+# Lotes más chicos se evalúan en el proceso principal (no compensa el pool)
+MIN_LOTE_PARALELO = 64
+# Activa el evaluador en los scripts de experimentos (valor = número de workers)
+VARIABLE_ENTORNO = 'TESIS3_WORKERS_EVALUACION'
+
+
+# ---------------------------------------------------------------------------
+# Lado del worker
+# ---------------------------------------------------------------------------
+
+_estado_worker = None
+
+
+def _inicializar_worker(config, nombre_genes, nombre_resultados, forma_genes):
+    """initializer del pool: compila el problema y se conecta a los buffers"""
+    global _estado_worker
+    config.compilar()
+    memoria_genes = shared_memory.SharedMemory(name=nombre_genes)
+    memoria_resultados = shared_memory.SharedMemory(name=nombre_resultados)
+    genes = np.ndarray(forma_genes, dtype=np.int16, buffer=memoria_genes.buf)
+    resultados = np.ndarray((forma_genes[0], 3), dtype=np.float64, buffer=memoria_resultados.buf)
+    _estado_worker = (config, memoria_genes, memoria_resultados, genes, resultados)
+
+
+def _evaluar_bloque(inicio, fin):
+    """Evalúa las filas inicio..fin-1 del buffer de genes"""
+    config, _, _, genes, resultados = _estado_worker
+    resultados[inicio:fin] = evaluar_poblacion(genes[inicio:fin], config)
+    return fin - inicio
+
+
+# ---------------------------------------------------------------------------
+# Lado del proceso principal
+# ---------------------------------------------------------------------------
+
+class EvaluadorParalelo:
+    """Evalúa lotes de individuos repartiéndolos entre workers persistentes"""
+    
+    def __init__(self, config, num_workers=None, capacidad=CAPACIDAD_POR_DEFECTO,
+                 min_lote=MIN_LOTE_PARALELO):
+        """
+        Args:
+            config: ProblemConfig de la corrida
+            num_workers: Procesos del pool (por defecto os.cpu_count())
+            capacidad: Individuos por ronda; los lotes mayores se evalúan en varias
+            min_lote: Tamaño mínimo de lote para usar el pool
+        """
+        if capacidad < 1:
+            raise ValueError("capacidad debe ser >= 1")
+        self.config = config
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.capacidad = capacidad
+        self.min_lote = min_lote
+        self.evaluaciones_paralelas = 0
+        self.evaluaciones_locales = 0
+        
+        self._pool = None
+        self._memoria_genes = self._memoria_resultados = None
+        self._genes = self._resultados = None
+        if self.num_workers == 1:
+            # evaluar / evaluar_genes evalúan todo en el proceso principal
+            return
+        
+        forma_genes = (capacidad, config.num_pedidos, config.num_etapas)
+        self._memoria_genes = shared_memory.SharedMemory(
+            create=True, size=int(np.prod(forma_genes)) * 2
+        )
+        self._memoria_resultados = shared_memory.SharedMemory(
+            create=True, size=capacidad * 3 * 8
+        )
+        self._genes = np.ndarray(forma_genes, dtype=np.int16, buffer=self._memoria_genes.buf)
+        self._resultados = np.ndarray(
+            (capacidad, 3), dtype=np.float64, buffer=self._memoria_resultados.buf
+        )
+        try:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                initializer=_inicializar_worker,
+                initargs=(config, self._memoria_genes.name, self._memoria_resultados.name,
+                          forma_genes),
+            )
+        except BaseException:
+            # Sin pool nadie llamaría a cerrar(): los segmentos se liberan acá
+            self._liberar_memoria()
+            raise
+    
+    def evaluar(self, individuos):
+        """
+        Args:
+            individuos: Lista de Chromosome
+        
+        Returns:
+            List[tuple]: Fitness por individuo (idénticos a evaluar_individuos)
+        """
+        if len(individuos) < self.min_lote or self.num_workers == 1:
+            self.evaluaciones_locales += len(individuos)
+            return evaluar_individuos(individuos, self.config)
+        
+        fitness = []
+        for inicio in range(0, len(individuos), self.capacidad):
+            ronda = individuos[inicio:inicio + self.capacidad]
+            for i, ind in enumerate(ronda):
+                self._genes[i] = ind.genes_lectura
+            fitness.extend(self._evaluar_ronda(len(ronda)))
+        self.evaluaciones_paralelas += len(individuos)
+        return fitness
+    
+    def evaluar_genes(self, genes_array):
+        """
+        Evalúa un array de genes (P, num_pedidos, num_etapas), p. ej. un vecindario
+        
+        Returns:
+            np.ndarray: Array (P, 3), igual a evaluar_poblacion
+        """
+        genes_array = np.asarray(genes_array)
+        if len(genes_array) < self.min_lote or self.num_workers == 1:
+            self.evaluaciones_locales += len(genes_array)
+            return evaluar_poblacion(genes_array, self.config)
+        
+        partes = []
+        for inicio in range(0, len(genes_array), self.capacidad):
+            ronda = genes_array[inicio:inicio + self.capacidad]
+            self._genes[:len(ronda)] = ronda
+            partes.append(np.array(self._evaluar_ronda(len(ronda)), dtype=np.float64))
+        self.evaluaciones_paralelas += len(genes_array)
+        return np.concatenate(partes)
+    
+    def _evaluar_ronda(self, n):
+        """Reparte las n primeras filas del buffer entre los workers"""
+        cortes = np.linspace(0, n, min(self.num_workers, n) + 1).astype(int).tolist()
+        futuros = [
+            self._pool.submit(_evaluar_bloque, inicio, fin)
+            for inicio, fin in zip(cortes[:-1], cortes[1:])
+            if fin > inicio
+        ]
+        for futuro in futuros:
+            futuro.result()
+        return [tuple(fila) for fila in self._resultados[:n].tolist()]
+    
+    def estadisticas(self):
+        """
+        Returns:
+            dict: evaluaciones_paralelas, evaluaciones_locales y workers
+        """
+        return {
+            'evaluaciones_paralelas': self.evaluaciones_paralelas,
+            'evaluaciones_locales': self.evaluaciones_locales,
+            'workers': self.num_workers,
+        }
+    
+    def cerrar(self):
+        """Detiene el pool y libera la memoria compartida"""
+        if self._pool is None:
+            return
+        self._pool.shutdown()
+        self._pool = None
+        self._liberar_memoria()
+    
+    def _liberar_memoria(self):
+        """Cierra y elimina los buffers compartidos"""
+        self._genes = self._resultados = None
+        for memoria in (self._memoria_genes, self._memoria_resultados):
+            if memoria is not None:
+                memoria.close()
+                memoria.unlink()
+        self._memoria_genes = self._memoria_resultados = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def evaluador_desde_entorno(config):
+    """
+    Crea el evaluador si TESIS3_WORKERS_EVALUACION está definida
+    
+    Returns:
+        EvaluadorParalelo o None (opción desactivada o valor <= 1)
+    """
+    valor = os.environ.get(VARIABLE_ENTORNO, '').strip()
+    if valor in ('', '0', '1'):
+        return None
+    return EvaluadorParalelo(config, num_workers=int(valor))
@@ -1,6 +1,9 @@
 
 """Operadores de cruce stage-aware"""
 import random
+
+import numpy as np
+
 from tesis3.src.core.chromosome import Chromosome
 
 
@@ -19,23 +22,14 @@ def cruce_uniforme_por_etapa(padre1, padre2, config, prob_cruce=0.95):
     if random.random() > prob_cruce:
         return padre1.copy(), padre2.copy()
     
-    genes_hijo1 = []
-    genes_hijo2 = []
+    # Misma secuencia de random.random() que el recorrido pedido a pedido
+    num_genes = config.num_pedidos * config.num_etapas
+    desde_padre1 = np.array(
+        [random.random() < 0.5 for _ in range(num_genes)], dtype=bool
+    ).reshape(config.num_pedidos, config.num_etapas)
     
-    for i in range(config.num_pedidos):
-        pedido_hijo1 = []
-        pedido_hijo2 = []
-        
-        for etapa in range(config.num_etapas):
-            if random.random() < 0.5:
-                pedido_hijo1.append(padre1.genes[i][etapa])
-                pedido_hijo2.append(padre2.genes[i][etapa])
-            else:
-                pedido_hijo1.append(padre2.genes[i][etapa])
-                pedido_hijo2.append(padre1.genes[i][etapa])
-        
-        genes_hijo1.append(pedido_hijo1)
-        genes_hijo2.append(pedido_hijo2)
+    genes_hijo1 = np.where(desde_padre1, padre1.genes_lectura, padre2.genes_lectura)
+    genes_hijo2 = np.where(desde_padre1, padre2.genes_lectura, padre1.genes_lectura)
     
     hijo1 = Chromosome(genes_hijo1, config)
     hijo2 = Chromosome(genes_hijo2, config)
@@ -52,8 +46,8 @@ def cruce_un_punto(padre1, padre2, config, prob_cruce=0.95):
     
     punto = random.randint(1, config.num_pedidos - 1)
     
-    genes_hijo1 = padre1.genes[:punto] + padre2.genes[punto:]
-    genes_hijo2 = padre2.genes[:punto] + padre1.genes[punto:]
+    genes_hijo1 = np.concatenate((padre1.genes_lectura[:punto], padre2.genes_lectura[punto:]))
+    genes_hijo2 = np.concatenate((padre2.genes_lectura[:punto], padre1.genes_lectura[punto:]))
     
     hijo1 = Chromosome(genes_hijo1, config)
     hijo2 = Chromosome(genes_hijo2, config)
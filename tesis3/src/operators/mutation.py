@@ -15,8 +15,7 @@ def mutacion_swap_stage_aware(poblacion, config, tasa_mut=0.3):
             
             if len(ind_copy.genes) >= 2:
                 ped1, ped2 = random.sample(range(len(ind_copy.genes)), 2)
-                ind_copy.genes[ped1][etapa], ind_copy.genes[ped2][etapa] = \
-                    ind_copy.genes[ped2][etapa], ind_copy.genes[ped1][etapa]
+                ind_copy.genes[[ped1, ped2], etapa] = ind_copy.genes[[ped2, ped1], etapa]
             
             mutados.append(ind_copy)
         else:
@@ -36,12 +35,12 @@ def mutacion_insert_stage_aware(poblacion, config, tasa_mut=0.3):
             pedido_idx = random.randint(0, len(ind_copy.genes) - 1)
             etapa = random.randint(0, config.num_etapas - 1)
             
-            maquina_actual = ind_copy.genes[pedido_idx][etapa]
+            maquina_actual = ind_copy.genes[pedido_idx, etapa]
             opciones = [m for m in config.get_maquinas_etapa(etapa + 1) 
                        if m != maquina_actual]
             
             if opciones:
-                ind_copy.genes[pedido_idx][etapa] = random.choice(opciones)
+                ind_copy.genes[pedido_idx, etapa] = random.choice(opciones)
             
             mutados.append(ind_copy)
         else:
@@ -63,12 +62,8 @@ def mutacion_invert_stage_aware(poblacion, config, tasa_mut=0.3):
             if len(ind_copy.genes) >= 2:
                 etapa = random.randint(0, config.num_etapas - 1)
                 i, j = sorted(random.sample(range(len(ind_copy.genes)), 2))
-                # Extraer la secuencia de máquinas asignadas en la etapa elegida
-                segmento = [ind_copy.genes[k][etapa] for k in range(i, j + 1)]
-                segmento.reverse()
-                # Reasignar las máquinas invertidas solo en esa etapa
-                for offset, k in enumerate(range(i, j + 1)):
-                    ind_copy.genes[k][etapa] = segmento[offset]
+                # Invertir la secuencia de máquinas asignadas solo en la etapa elegida
+                ind_copy.genes[i:j + 1, etapa] = ind_copy.genes[i:j + 1, etapa][::-1].copy()
             
             mutados.append(ind_copy)
         else:
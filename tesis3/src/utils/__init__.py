@@ -1,4 +1,18 @@
-from .seeds import cargar_semillas, generar_semillas_estandar, guardar_semillas, verificar_semillas_archivo
+from .seeds import (
+    cargar_semillas,
+    generador_numpy,
+    generar_semillas_estandar,
+    guardar_semillas,
+    semillas_derivadas,
+    verificar_semillas_archivo,
+)
 
-__all__ = ['cargar_semillas', 'generar_semillas_estandar', 'guardar_semillas', 'verificar_semillas_archivo']
+__all__ = [
+    'cargar_semillas',
+    'generador_numpy',
+    'generar_semillas_estandar',
+    'guardar_semillas',
+    'semillas_derivadas',
+    'verificar_semillas_archivo',
+]
 
@@ -0,0 +1,277 @@
+"""Backend opcional con Numba para los kernels de fitness, dominancia y crowding
+
+Si numba está instalado se usa automáticamente (BACKEND = 'numba'); si no,
+el código cae al backend NumPy/Python original (BACKEND = 'python').
+La variable de entorno TESIS3_BACKEND=python fuerza el backend sin compilar.
+"""
+import os
+
+import numpy as np
+
+try:
+    import numba
+    NUMBA_DISPONIBLE = True
+except ImportError:
+    numba = None
+    NUMBA_DISPONIBLE = False
+
+
+if NUMBA_DISPONIBLE and os.environ.get('TESIS3_BACKEND', 'numba') != 'python':
+    BACKEND = 'numba'
+else:
+    BACKEND = 'python'
+
+
+def njit(funcion):
+    """Compila con numba.njit si está disponible; si no, devuelve la función sin cambios"""
+    if NUMBA_DISPONIBLE:
+        return numba.njit(cache=True)(funcion)
+    return funcion
+
+
+def usar_numba():
+    """Indica si los kernels compilados están activos"""
+    return BACKEND == 'numba'
+
+
+# ---------------------------------------------------------------------------
+# Kernels de fitness
+# ---------------------------------------------------------------------------
+
+# np.add.reduce solo usa un bloque pairwise sin recursión hasta 128 elementos;
+# con más máquinas el kernel de fitness no sería idéntico y se usa la versión NumPy
+MAX_MAQUINAS_KERNEL = 128
+
+
+def usar_kernel_fitness(num_maquinas):
+    """Indica si el kernel compilado de fitness puede usarse para este problema"""
+    return usar_numba() and num_maquinas <= MAX_MAQUINAS_KERNEL
+
+
+@njit
+def _suma_pairwise(valores):
+    """Suma con el mismo orden de operaciones que np.add.reduce (float64, n <= 128)"""
+    n = valores.shape[0]
+    if n < 8:
+        resultado = 0.0
+        for i in range(n):
+            resultado += valores[i]
+        return resultado
+    r0 = valores[0]
+    r1 = valores[1]
+    r2 = valores[2]
+    r3 = valores[3]
+    r4 = valores[4]
+    r5 = valores[5]
+    r6 = valores[6]
+    r7 = valores[7]
+    i = 8
+    while i < n - (n % 8):
+        r0 += valores[i]
+        r1 += valores[i + 1]
+        r2 += valores[i + 2]
+        r3 += valores[i + 3]
+        r4 += valores[i + 4]
+        r5 += valores[i + 5]
+        r6 += valores[i + 6]
+        r7 += valores[i + 7]
+        i += 8
+    resultado = ((r0 + r1) + (r2 + r3)) + ((r4 + r5) + (r6 + r7))
+    while i < n:
+        resultado += valores[i]
+        i += 1
+    return resultado
+
+
+@njit
+def _desviacion_std(valores):
+    """np.std reproducido paso a paso (media, cuadrados, suma pairwise)"""
+    n = valores.shape[0]
+    media = _suma_pairwise(valores) / n
+    cuadrados = np.empty(n)
+    for i in range(n):
+        diferencia = valores[i] - media
+        cuadrados[i] = diferencia * diferencia
+    return np.sqrt(_suma_pairwise(cuadrados) / n)
+
+
+@njit
+def simular_cromosoma(maquinas, tiempos_trabajo, potencias_activas, potencias_inactivas):
+    """
+    Simula un cromosoma y devuelve sus 3 objetivos
+    
+    Args:
+        maquinas: Array entero (num_pedidos, num_etapas) con máquinas 1-indexed
+        tiempos_trabajo: Tabla (num_maquinas, max_usos) de CompiledProblem
+        potencias_activas, potencias_inactivas: Arrays (num_maquinas,)
+    
+    Returns:
+        tuple: (obj_makespan, obj_balance, obj_energia)
+    """
+    num_pedidos, num_etapas = maquinas.shape
+    num_maquinas = tiempos_trabajo.shape[0]
+    disponibilidad_maquinas = np.zeros(num_maquinas)
+    usos_maquinas = np.zeros(num_maquinas, dtype=np.int64)
+    tiempo_uso_maquinas = np.zeros(num_maquinas)
+    tiempo_total = 0.0
+    
+    for i in range(num_pedidos):
+        tiempo_pedido = 0.0
+        for etapa in range(num_etapas):
+            m = maquinas[i, etapa] - 1
+            tiempo_inicio = max(disponibilidad_maquinas[m], tiempo_pedido)
+            tiempo_trabajo = tiempos_trabajo[m, usos_maquinas[m]]
+            
+            usos_maquinas[m] += 1
+            tiempo_pedido = tiempo_inicio + tiempo_trabajo
+            disponibilidad_maquinas[m] = tiempo_pedido
+            tiempo_uso_maquinas[m] += tiempo_trabajo
+        tiempo_total = max(tiempo_total, tiempo_pedido)
+    
+    objetivo_makespan = 1 / tiempo_total if tiempo_total > 0 else 0.0
+    objetivo_balance = 1 / (_desviacion_std(tiempo_uso_maquinas) + 1)
+    
+    energia_total = 0.0
+    for i in range(num_maquinas):
+        tiempo_activo_hrs = tiempo_uso_maquinas[i] / 60
+        tiempo_inactivo_hrs = (tiempo_total - tiempo_uso_maquinas[i]) / 60
+        energia_total += (potencias_activas[i] * tiempo_activo_hrs
+                          + potencias_inactivas[i] * tiempo_inactivo_hrs)
+    objetivo_energia = 1 / (energia_total + 1)
+    
+    return objetivo_makespan, objetivo_balance, objetivo_energia
+
+
+@njit
+def simular_lote(genes_array, tiempos_trabajo, potencias_activas, potencias_inactivas):
+    """Versión por lotes de simular_cromosoma: (P, num_pedidos, num_etapas) -> (P, 3)"""
+    num_individuos = genes_array.shape[0]
+    objetivos = np.empty((num_individuos, 3))
+    for p in range(num_individuos):
+        mk, bal, eng = simular_cromosoma(
+            genes_array[p], tiempos_trabajo, potencias_activas, potencias_inactivas
+        )
+        objetivos[p, 0] = mk
+        objetivos[p, 1] = bal
+        objetivos[p, 2] = eng
+    return objetivos
+
+
+# ---------------------------------------------------------------------------
+# Kernels de dominancia y crowding
+# ---------------------------------------------------------------------------
+
+@njit
+def frentes_no_dominados(fitness_array):
+    """
+    Clasificación no dominada (maximización) con el mismo orden de salida que
+    clasificacion_no_dominada
+    
+    Returns:
+        tuple: (orden, inicios) donde el frente k es orden[inicios[k]:inicios[k + 1]]
+    """
+    n, num_objetivos = fitness_array.shape
+    domina = np.zeros((n, n), dtype=np.bool_)
+    num_dominados = np.zeros(n, dtype=np.int64)
+    
+    for i in range(n):
+        for j in range(n):
+            if i == j:
+                continue
+            no_peor = True
+            mejor = False
+            for k in range(num_objetivos):
+                if not fitness_array[i, k] >= fitness_array[j, k]:
+                    no_peor = False
+                    break
+                if fitness_array[i, k] > fitness_array[j, k]:
+                    mejor = True
+            if no_peor and mejor:
+                domina[i, j] = True
+                num_dominados[j] += 1
+    
+    orden = np.empty(n, dtype=np.int64)
+    inicios = np.empty(n + 1, dtype=np.int64)
+    total = 0
+    for i in range(n):
+        if num_dominados[i] == 0:
+            orden[total] = i
+            total += 1
+    
+    num_frentes = 0
+    inicios[0] = 0
+    inicio_actual = 0
+    while total > inicio_actual:
+        fin_actual = total
+        num_frentes += 1
+        inicios[num_frentes] = fin_actual
+        for idx in range(inicio_actual, fin_actual):
+            i = orden[idx]
+            for j in range(n):
+                if domina[i, j]:
+                    num_dominados[j] -= 1
+                    if num_dominados[j] == 0:
+                        orden[total] = j
+                        total += 1
+        inicio_actual = fin_actual
+    
+    return orden, inicios[:num_frentes + 1]
+
+
+@njit
+def ultimos_dominadores(fitness_anterior, fitness_actual):
+    """
+    Posición del último punto de fitness_anterior que domina débilmente (>= en
+    todos los objetivos) a cada punto de fitness_actual, o -1 si ninguno
+    
+    Returns:
+        np.ndarray: Posiciones (len(fitness_actual),)
+    """
+    n_anterior, num_objetivos = fitness_anterior.shape
+    n_actual = fitness_actual.shape[0]
+    ultimos = np.full(n_actual, -1, dtype=np.int64)
+    for j in range(n_actual):
+        for i in range(n_anterior - 1, -1, -1):
+            no_peor = True
+            for k in range(num_objetivos):
+                if not fitness_anterior[i, k] >= fitness_actual[j, k]:
+                    no_peor = False
+                    break
+            if no_peor:
+                ultimos[j] = i
+                break
+    return ultimos
+
+
+@njit
+def distancias_crowding(fitness_array, indices_ordenados):
+    """
+    Distancia de crowding de un frente (n, num_objetivos) -> (n,)
+    
+    Args:
+        fitness_array: Array (n, num_objetivos)
+        indices_ordenados: np.argsort(fitness_array, axis=0), calculado con NumPy
+            para desempatar igual que distancia_crowding
+    """
+    n, num_objetivos = fitness_array.shape
+    distancias = np.zeros(n)
+    if n <= 2:
+        distancias[:] = np.inf
+        return distancias
+    
+    for m in range(num_objetivos):
+        primero = indices_ordenados[0, m]
+        ultimo = indices_ordenados[n - 1, m]
+        distancias[primero] = np.inf
+        distancias[ultimo] = np.inf
+        
+        rango = fitness_array[ultimo, m] - fitness_array[primero, m]
+        if rango == 0:
+            continue
+        
+        for pos in range(1, n - 1):
+            anterior = fitness_array[indices_ordenados[pos - 1, m], m]
+            siguiente = fitness_array[indices_ordenados[pos + 1, m], m]
+            distancias[indices_ordenados[pos, m]] += (siguiente - anterior) / rango
+    
+    return distancias
@@ -1,6 +1,10 @@
 
 """Utilidades para manejo de población"""
-from tesis3.src.core.chromosome import Chromosome
+import hashlib
+
+import numpy as np
+
+from tesis3.src.core.chromosome import DTYPE_GENES, TAMANO_CLAVE, Chromosome
 
 
 def inicializar_poblacion(config, tamano):
@@ -19,10 +23,243 @@ def inicializar_poblacion(config, tamano):
     
     while len(poblacion) < tamano:
         ind = Chromosome.random(config)
-        ind_tuple = tuple(tuple(pedido) for pedido in ind.genes)
+        clave = ind.clave
         
-        if ind_tuple not in individuos_unicos:
+        if clave not in individuos_unicos:
             poblacion.append(ind)
-            individuos_unicos.add(ind_tuple)
+            individuos_unicos.add(clave)
     
     return poblacion
+
+
+class PopulationMatrix:
+    """
+    Población como un único array contiguo (P, num_pedidos, num_etapas)
+    
+    Los operadores de variación trabajan sobre toda la población a la vez con un
+    np.random.Generator (ver seeds.generador_numpy) en lugar de una llamada a random
+    por gen. Las máquinas se guardan 1-indexed con el mismo dtype que Chromosome,
+    así que las claves coinciden con Chromosome.clave.
+    """
+    
+    def __init__(self, genes, config):
+        """
+        Args:
+            genes: Array (P, num_pedidos, num_etapas) con máquinas 1-indexed
+            config: ProblemConfig
+        """
+        genes = np.ascontiguousarray(genes, dtype=DTYPE_GENES)
+        if genes.ndim != 3:
+            raise ValueError(
+                f"Se esperaba un array (P, num_pedidos, num_etapas), encontrado {genes.shape}"
+            )
+        self.genes = genes
+        self.config = config
+        
+        # Máquinas válidas por etapa, rellenadas a la etapa con más máquinas
+        maquinas_etapas = [config.get_maquinas_etapa(e + 1) for e in range(config.num_etapas)]
+        self._num_opciones = np.array([len(m) for m in maquinas_etapas])
+        self._opciones = np.zeros((config.num_etapas, self._num_opciones.max()), dtype=DTYPE_GENES)
+        for etapa, maquinas in enumerate(maquinas_etapas):
+            self._opciones[etapa, :len(maquinas)] = maquinas
+    
+    def __len__(self):
+        return len(self.genes)
+    
+    @classmethod
+    def aleatoria(cls, config, tamano, rng, unicos=True):
+        """
+        Población inicial aleatoria por lotes (versión matricial de inicializar_poblacion)
+        
+        Args:
+            config: ProblemConfig
+            tamano: Número de individuos
+            rng: np.random.Generator
+            unicos: Si True, no repite individuos
+        
+        Returns:
+            PopulationMatrix
+        """
+        poblacion = cls(np.zeros((0, config.num_pedidos, config.num_etapas)), config)
+        faltantes = tamano
+        while faltantes > 0:
+            # Índice aleatorio dentro de las máquinas válidas de cada etapa
+            indices = (
+                rng.random((faltantes, config.num_pedidos, config.num_etapas))
+                * poblacion._num_opciones
+            ).astype(np.intp)
+            etapas = np.arange(config.num_etapas)
+            nuevos = poblacion._opciones[etapas, indices]
+            poblacion.genes = np.concatenate((poblacion.genes, nuevos))
+            if unicos:
+                poblacion.genes = poblacion.genes[poblacion.indices_unicos()]
+            faltantes = tamano - len(poblacion)
+        return poblacion
+    
+    @classmethod
+    def desde_cromosomas(cls, individuos, config):
+        """Construye la matriz a partir de una lista de Chromosome"""
+        genes = np.array([ind.genes_lectura for ind in individuos], dtype=DTYPE_GENES)
+        return cls(genes.reshape(len(individuos), config.num_pedidos, config.num_etapas), config)
+    
+    def a_cromosomas(self):
+        """Lista de Chromosome (uno por fila)"""
+        return [Chromosome(genes, self.config) for genes in self.genes]
+    
+    def claves(self):
+        """Claves de cada individuo (iguales a Chromosome.clave)"""
+        return [
+            hashlib.blake2b(genes.tobytes(), digest_size=TAMANO_CLAVE).digest()
+            for genes in self.genes
+        ]
+    
+    def indices_unicos(self):
+        """Índices de la primera aparición de cada individuo (en orden)"""
+        vistos = set()
+        indices = []
+        for i, clave in enumerate(self.claves()):
+            if clave not in vistos:
+                vistos.add(clave)
+                indices.append(i)
+        return np.array(indices, dtype=np.intp)
+    
+    def seleccionar(self, indices):
+        """Nueva PopulationMatrix con las filas indicadas (copia)"""
+        return PopulationMatrix(self.genes[np.asarray(indices, dtype=np.intp)], self.config)
+    
+    def concatenar(self, otra):
+        """Nueva PopulationMatrix con los individuos de ambas"""
+        return PopulationMatrix(np.concatenate((self.genes, otra.genes)), self.config)
+    
+    # ------------------------------------------------------------------
+    # Cruce
+    # ------------------------------------------------------------------
+    
+    def _padres(self, indices_padres1, indices_padres2):
+        padres1 = self.genes[np.asarray(indices_padres1, dtype=np.intp)]
+        padres2 = self.genes[np.asarray(indices_padres2, dtype=np.intp)]
+        return padres1, padres2
+    
+    def _hijos(self, padres1, padres2, desde_padre1, rng, prob_cruce):
+        """Aplica la máscara de herencia; las parejas sin cruce copian a los padres"""
+        sin_cruce = rng.random(len(padres1)) > prob_cruce
+        desde_padre1[sin_cruce] = True
+        hijos1 = np.where(desde_padre1, padres1, padres2)
+        hijos2 = np.where(desde_padre1, padres2, padres1)
+        # Hijos de la misma pareja quedan contiguos: (h1_0, h2_0, h1_1, h2_1, ...)
+        hijos = np.stack((hijos1, hijos2), axis=1).reshape(-1, *padres1.shape[1:])
+        return PopulationMatrix(hijos, self.config)
+    
+    def cruce_uniforme(self, indices_padres1, indices_padres2, rng, prob_cruce=0.95):
+        """
+        Cruce uniforme por gen para todas las parejas a la vez
+        
+        Args:
+            indices_padres1, indices_padres2: Índices (k,) de las parejas
+            rng: np.random.Generator
+            prob_cruce: Probabilidad de cruce de cada pareja
+        
+        Returns:
+            PopulationMatrix con 2k hijos
+        """
+        padres1, padres2 = self._padres(indices_padres1, indices_padres2)
+        desde_padre1 = rng.random(padres1.shape) < 0.5
+        return self._hijos(padres1, padres2, desde_padre1, rng, prob_cruce)
+    
+    def cruce_un_punto(self, indices_padres1, indices_padres2, rng, prob_cruce=0.95):
+        """
+        Cruce de un punto entre pedidos para todas las parejas a la vez
+        
+        Returns:
+            PopulationMatrix con 2k hijos
+        """
+        padres1, padres2 = self._padres(indices_padres1, indices_padres2)
+        num_parejas, num_pedidos, num_etapas = padres1.shape
+        puntos = rng.integers(1, num_pedidos, size=num_parejas)
+        desde_padre1 = np.arange(num_pedidos)[None, :] < puntos[:, None]
+        desde_padre1 = np.repeat(desde_padre1[:, :, None], num_etapas, axis=2)
+        return self._hijos(padres1, padres2, desde_padre1, rng, prob_cruce)
+    
+    # ------------------------------------------------------------------
+    # Mutación (en el lugar, sobre las filas seleccionadas)
+    # ------------------------------------------------------------------
+    
+    def _filas_mutadas(self, rng, tasa_mut):
+        return np.flatnonzero(rng.random(len(self.genes)) < tasa_mut)
+    
+    def _dos_pedidos_distintos(self, rng, num_filas):
+        num_pedidos = self.config.num_pedidos
+        pedidos1 = rng.integers(0, num_pedidos, size=num_filas)
+        pedidos2 = (pedidos1 + rng.integers(1, num_pedidos, size=num_filas)) % num_pedidos
+        return pedidos1, pedidos2
+    
+    def mutacion_swap(self, rng, tasa_mut=0.3):
+        """Intercambia las máquinas de 2 pedidos en una misma etapa"""
+        filas = self._filas_mutadas(rng, tasa_mut)
+        if len(filas) == 0 or self.config.num_pedidos < 2:
+            return self
+        etapas = rng.integers(0, self.config.num_etapas, size=len(filas))
+        pedidos1, pedidos2 = self._dos_pedidos_distintos(rng, len(filas))
+        
+        maquinas1 = self.genes[filas, pedidos1, etapas]
+        self.genes[filas, pedidos1, etapas] = self.genes[filas, pedidos2, etapas]
+        self.genes[filas, pedidos2, etapas] = maquinas1
+        return self
+    
+    def mutacion_insert(self, rng, tasa_mut=0.3):
+        """Cambia la máquina de un pedido en una etapa por otra válida distinta"""
+        filas = self._filas_mutadas(rng, tasa_mut)
+        if len(filas) == 0:
+            return self
+        etapas = rng.integers(0, self.config.num_etapas, size=len(filas))
+        pedidos = rng.integers(0, self.config.num_pedidos, size=len(filas))
+        
+        actuales = self.genes[filas, pedidos, etapas]
+        num_opciones = self._num_opciones[etapas]
+        posicion_actual = np.argmax(self._opciones[etapas] == actuales[:, None], axis=1)
+        # Índice uniforme entre las otras num_opciones - 1 máquinas (saltando la actual)
+        nuevas = (rng.random(len(filas)) * (num_opciones - 1)).astype(np.intp)
+        nuevas += nuevas >= posicion_actual
+        
+        con_opciones = num_opciones > 1
+        self.genes[filas[con_opciones], pedidos[con_opciones], etapas[con_opciones]] = \
+            self._opciones[etapas[con_opciones], nuevas[con_opciones]]
+        return self
+    
+    def mutacion_invert(self, rng, tasa_mut=0.3):
+        """Invierte las máquinas de un rango de pedidos dentro de una etapa"""
+        filas = self._filas_mutadas(rng, tasa_mut)
+        if len(filas) == 0 or self.config.num_pedidos < 2:
+            return self
+        etapas = rng.integers(0, self.config.num_etapas, size=len(filas))
+        pedidos1, pedidos2 = self._dos_pedidos_distintos(rng, len(filas))
+        inicios = np.minimum(pedidos1, pedidos2)[:, None]
+        fines = np.maximum(pedidos1, pedidos2)[:, None]
+        
+        posiciones = np.arange(self.config.num_pedidos)[None, :]
+        dentro = (posiciones >= inicios) & (posiciones <= fines)
+        origen = np.where(dentro, inicios + fines - posiciones, posiciones)
+        self.genes[filas[:, None], posiciones, etapas[:, None]] = \
+            self.genes[filas[:, None], origen, etapas[:, None]]
+        return self
+    
+    def aplicar_cruce(self, indices_padres1, indices_padres2, rng, metodo='uniforme',
+                      prob_cruce=0.95):
+        """Versión matricial de operators.crossover.aplicar_cruce"""
+        if metodo == 'uniforme':
+            return self.cruce_uniforme(indices_padres1, indices_padres2, rng, prob_cruce)
+        elif metodo == 'un_punto':
+            return self.cruce_un_punto(indices_padres1, indices_padres2, rng, prob_cruce)
+        else:
+            raise ValueError(f"Método de cruce desconocido: {metodo}")
+    
+    def aplicar_mutacion(self, rng, metodo='swap', tasa_mut=0.3):
+        """Versión matricial de operators.mutation.aplicar_mutacion (modifica en el lugar)"""
+        if metodo == 'swap':
+            return self.mutacion_swap(rng, tasa_mut)
+        elif metodo == 'insert':
+            return self.mutacion_insert(rng, tasa_mut)
+        elif metodo == 'invert':
+            return self.mutacion_invert(rng, tasa_mut)
+        else:
+            raise ValueError(f"Método de mutación desconocido: {metodo}")
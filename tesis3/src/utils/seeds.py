@@ -1,4 +1,7 @@
 """Utilidades para gestionar semillas de experimentos de forma centralizada"""
+import random
+
+import numpy as np
 import yaml
 from pathlib import Path
 from typing import List
@@ -146,3 +149,29 @@ def verificar_semillas_archivo(archivo_csv: str, semillas_esperadas: List[int])
         'completo': len(semillas_faltantes) == 0
     }
 
+
+def generador_numpy() -> np.random.Generator:
+    """
+    np.random.Generator derivado del estado de `random`
+    
+    Los scripts fijan la semilla con random.seed(semilla); así los operadores
+    matriciales (PopulationMatrix) son reproducibles con la misma semilla.
+    """
+    return np.random.default_rng(random.getrandbits(64))
+
+
+def semillas_derivadas(semilla, cantidad: int) -> List[int]:
+    """
+    Semillas independientes derivadas de una semilla (SeedSequence.spawn)
+    
+    Args:
+        semilla: Semilla de origen; None = derivada del estado de `random`
+        cantidad: Número de semillas
+    
+    Returns:
+        Lista de semillas de 32 bits, reproducible con la misma semilla
+    """
+    if semilla is None:
+        semilla = random.getrandbits(64)
+    hijas = np.random.SeedSequence(semilla).spawn(cantidad)
+    return [int(hija.generate_state(1)[0]) for hija in hijas]
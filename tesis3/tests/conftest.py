@@ -0,0 +1,33 @@
+"""Fixtures compartidas por los tests"""
+import pytest
+
+from tesis3.src.core.problem import ProblemConfig
+from tesis3.src.operators.crossover import aplicar_cruce
+from tesis3.src.operators.mutation import aplicar_mutacion
+
+
+@pytest.fixture
+def config():
+    """Fixture para configuración del problema"""
+    return ProblemConfig.from_yaml("tesis3/config/config.yaml")
+
+
+# Funciones de módulo (no lambdas): las islas y los pools las serializan
+def cruce_uniforme(p1, p2, cfg, prob):
+    return aplicar_cruce(p1, p2, cfg, 'uniforme', prob)
+
+
+def mutacion_swap(pob, cfg, prob):
+    return aplicar_mutacion(pob, cfg, 'swap', prob)
+
+
+@pytest.fixture
+def cruce():
+    """Operador de cruce de los tests de algoritmos (uniforme)"""
+    return cruce_uniforme
+
+
+@pytest.fixture
+def mutacion():
+    """Operador de mutación de los tests de algoritmos (swap)"""
+    return mutacion_swap
@@ -0,0 +1,70 @@
+"""Tests de paridad entre el backend compilado (Numba) y el backend NumPy/Python"""
+import random
+
+import numpy as np
+import pytest
+
+from tesis3.src.algorithms.nsga2 import clasificacion_no_dominada, distancia_crowding
+from tesis3.src.core.chromosome import Chromosome
+from tesis3.src.fitness.multi_objective import evaluar_poblacion, fitness_multiobjetivo
+from tesis3.src.utils import aceleracion
+
+
+def _con_backend(monkeypatch, backend, funcion, *args):
+    """Ejecuta funcion(*args) forzando el backend indicado"""
+    monkeypatch.setattr(aceleracion, 'BACKEND', backend)
+    return funcion(*args)
+
+
+def test_kernel_fitness_coincide_con_python(config):
+    """El kernel de simulación da los mismos objetivos que la versión Python
+    (compilado si numba está instalado, interpretado si no)"""
+    random.seed(0)
+    problema = config.compilar()
+    for _ in range(30):
+        crom = Chromosome.random(config)
+        objetivos = aceleracion.simular_cromosoma(
+            np.asarray(crom.genes, dtype=np.int64),
+            problema.tiempos_trabajo,
+            problema.potencias_activas,
+            problema.potencias_inactivas,
+        )
+        assert tuple(objetivos) == fitness_multiobjetivo(crom, config)
+
+
+@pytest.mark.skipif(not aceleracion.NUMBA_DISPONIBLE, reason="numba no instalado")
+def test_backends_dan_mismos_objetivos(config, monkeypatch):
+    """Ambos backends dan exactamente los mismos objetivos en cromosomas aleatorios"""
+    random.seed(1)
+    poblacion = [Chromosome.random(config) for _ in range(40)]
+    genes_array = np.array([crom.genes for crom in poblacion])
+
+    for crom in poblacion:
+        esperado = _con_backend(monkeypatch, 'python', fitness_multiobjetivo, crom, config)
+        obtenido = _con_backend(monkeypatch, 'numba', fitness_multiobjetivo, crom, config)
+        assert obtenido == esperado
+
+    lote_python = _con_backend(monkeypatch, 'python', evaluar_poblacion, genes_array, config)
+    lote_numba = _con_backend(monkeypatch, 'numba', evaluar_poblacion, genes_array, config)
+    assert np.array_equal(lote_python, lote_numba)
+
+
+@pytest.mark.skipif(not aceleracion.NUMBA_DISPONIBLE, reason="numba no instalado")
+def test_backends_dan_mismos_frentes_y_crowding(monkeypatch):
+    """Frentes (con su orden) y crowding idénticos, incluso con empates"""
+    rng = np.random.default_rng(2)
+    for _ in range(20):
+        n = int(rng.integers(3, 120))
+        fitness = [tuple(fila) for fila in np.round(rng.random((n, 3)) * 5).tolist()]
+
+        frentes_python = _con_backend(
+            monkeypatch, 'python', clasificacion_no_dominada, fitness, fitness
+        )
+        frentes_numba = _con_backend(
+            monkeypatch, 'numba', clasificacion_no_dominada, fitness, fitness
+        )
+        assert frentes_numba == frentes_python
+
+        crowding_python = _con_backend(monkeypatch, 'python', distancia_crowding, fitness)
+        crowding_numba = _con_backend(monkeypatch, 'numba', distancia_crowding, fitness)
+        assert crowding_numba == crowding_python
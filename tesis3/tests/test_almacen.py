@@ -0,0 +1,71 @@
+"""Tests para el almacén persistente de evaluaciones"""
+import random
+
+import pytest
+
+from tesis3.src.algorithms.nsga2 import evaluar_con_cache
+from tesis3.src.core.chromosome import Chromosome
+from tesis3.src.core.problem import ProblemConfig
+from tesis3.src.fitness.almacen import AlmacenEvaluaciones
+from tesis3.src.fitness.cache import CacheFitness, RespaldoEncadenado
+from tesis3.src.fitness.memo_compartido import MemoCompartido
+from tesis3.src.fitness.multi_objective import fitness_multiobjetivo
+
+
+@pytest.fixture
+def poblacion(config):
+    """Población aleatoria reproducible"""
+    random.seed(0)
+    return [Chromosome.random(config) for _ in range(20)]
+
+
+def test_almacen_persiste_entre_sesiones(config, poblacion, tmp_path):
+    """Lo evaluado en una sesión se recupera exacto al reabrir el archivo"""
+    ruta = tmp_path / "evaluaciones.sqlite"
+    with AlmacenEvaluaciones(ruta, config) as almacen:
+        evaluar_con_cache(poblacion, config, CacheFitness(respaldo=almacen))
+        assert len(almacen) == len(poblacion)
+    
+    with AlmacenEvaluaciones(ruta, config) as almacen:
+        cache = CacheFitness(respaldo=almacen)
+        fitness = evaluar_con_cache(poblacion, config, cache)
+        assert fitness == [fitness_multiobjetivo(ind, config) for ind in poblacion]
+        assert cache.aciertos_respaldo == len(poblacion)
+
+
+def test_almacen_separa_instancias(config, poblacion, tmp_path):
+    """Las evaluaciones de otra instancia (otra huella) no se devuelven"""
+    ruta = tmp_path / "evaluaciones.sqlite"
+    with AlmacenEvaluaciones(ruta, config) as almacen:
+        almacen.guardar_lote({ind.clave: (1.0, 2.0, 3.0) for ind in poblacion})
+    
+    otra = ProblemConfig.from_yaml("tesis3/config/config.yaml")
+    otra.num_pedidos = 41
+    with AlmacenEvaluaciones(ruta, otra) as almacen:
+        assert len(almacen) == 0
+        assert almacen.buscar_lote([ind.clave for ind in poblacion]) == {}
+
+
+def test_almacen_lotes_grandes(config, tmp_path):
+    """Las consultas se parten en bloques (más claves que el límite de parámetros)"""
+    entradas = {i.to_bytes(16, 'little'): (float(i), 0.5, 0.25) for i in range(1200)}
+    with AlmacenEvaluaciones(tmp_path / "evaluaciones.sqlite", config) as almacen:
+        almacen.guardar_lote(entradas)
+        assert almacen.buscar_lote(list(entradas) + [b'z' * 16]) == entradas
+        assert almacen.fallos == 1
+
+
+def test_respaldo_encadenado_promueve(config, poblacion, tmp_path):
+    """Lo encontrado en el almacén se copia al memo compartido"""
+    memo = MemoCompartido.crear(config, num_entradas=256)
+    try:
+        with AlmacenEvaluaciones(tmp_path / "evaluaciones.sqlite", config) as almacen:
+            evaluar_con_cache(poblacion, config, CacheFitness(respaldo=almacen))
+            
+            respaldo = RespaldoEncadenado([memo, almacen])
+            cache = CacheFitness(respaldo=respaldo)
+            evaluar_con_cache(poblacion, config, cache)
+            assert cache.aciertos_respaldo == len(poblacion)
+            assert len(memo.buscar_lote([ind.clave for ind in poblacion])) == len(poblacion)
+    finally:
+        memo.liberar()
@@ -0,0 +1,86 @@
+"""Tests del archivo de Pareto incremental (ND-tree)"""
+import numpy as np
+
+from tesis3.src.algorithms.archivo_pareto import ArchivoPareto
+from tesis3.src.algorithms.nsga2 import dominancia
+
+
+def test_archivo_coincide_con_fuerza_bruta():
+    """Inserciones y eliminaciones mantienen exactamente el conjunto no dominado"""
+    rng = np.random.default_rng(0)
+    for caso in range(40):
+        archivo = ArchivoPareto()
+        referencia = {}
+        n = int(rng.integers(1, 300))
+        if caso % 2:
+            # Valores discretos: empates y fitness repetidos
+            puntos = rng.integers(0, 12, size=(n, 3)).astype(float)
+        else:
+            puntos = rng.random((n, 3))
+            # Objetivos en conflicto: archivo grande (varias divisiones de hojas)
+            puntos[:, 2] = 2 - puntos[:, 0] - puntos[:, 1] + 0.1 * puntos[:, 2]
+        
+        for clave, fila in enumerate(puntos.tolist()):
+            fitness = tuple(fila)
+            if referencia and rng.random() < 0.1:
+                eliminada = sorted(referencia)[int(rng.integers(len(referencia)))]
+                assert archivo.eliminar(eliminada)
+                del referencia[eliminada]
+            
+            dominado = any(dominancia(otro, fitness) for otro in referencia.values())
+            assert archivo.insertar(None, fitness, clave=clave) == (not dominado)
+            if not dominado:
+                # Referencia por fuerza bruta: quitar los dominados por el nuevo punto
+                referencia = {
+                    otra: otro
+                    for otra, otro in referencia.items()
+                    if not dominancia(fitness, otro)
+                }
+                referencia[clave] = fitness
+            assert len(archivo) == len(referencia)
+        
+        assert sorted(archivo.fitness()) == sorted(referencia.values())
+        assert set(archivo.soluciones()) == {None}
+
+
+def test_archivo_operaciones_basicas():
+    """Claves repetidas, fitness iguales, eliminación y vaciado"""
+    archivo = ArchivoPareto()
+    assert archivo.insertar('a', (1.0, 2.0, 3.0), clave='a')
+    assert archivo.insertar('b', (1.0, 2.0, 3.0), clave='b')
+    assert archivo.insertar('a', (1.0, 2.0, 3.0), clave='a')
+    assert len(archivo) == 2
+    
+    assert not archivo.insertar('c', (0.5, 2.0, 3.0), clave='c')
+    assert archivo.esta_dominado((0.5, 2.0, 3.0))
+    assert not archivo.esta_dominado((1.0, 2.0, 3.0))
+    
+    assert archivo.insertar('d', (2.0, 2.0, 3.0), clave='d')
+    assert archivo.soluciones() == ['d']
+    assert 'a' not in archivo and 'd' in archivo
+    
+    assert not archivo.eliminar('a')
+    assert archivo.eliminar('d')
+    assert len(archivo) == 0
+    assert archivo.insertar('c', (0.5, 2.0, 3.0), clave='c')
+    archivo.limpiar()
+    assert len(archivo) == 0 and archivo.fitness() == []
+
+
+def test_archivo_acotado():
+    """Con max_tamano el archivo no crece más y conserva los extremos del frente"""
+    rng = np.random.default_rng(1)
+    archivo = ArchivoPareto(max_tamano=10)
+    puntos = rng.random((200, 3))
+    puntos[:, 2] = 2 - puntos[:, 0] - puntos[:, 1]
+    for clave, fila in enumerate(puntos.tolist()):
+        archivo.insertar(None, tuple(fila), clave=clave)
+        assert len(archivo) <= 10
+    
+    fitness = archivo.fitness()
+    assert len(fitness) == 10
+    for a in fitness:
+        assert not any(dominancia(b, a) for b in fitness)
+    # Los extremos tienen crowding infinito: nunca se recortan
+    for objetivo in range(2):
+        assert max(f[objetivo] for f in fitness) == puntos[:, objetivo].max()
@@ -0,0 +1,118 @@
+"""Tests de la búsqueda local del NSGA-II memético"""
+import random
+
+import numpy as np
+import pytest
+
+from tesis3.src.algorithms.nsga2 import dominancia
+from tesis3.src.algorithms.nsga2_memetic import (
+    BusquedaLocalPareto,
+    busqueda_local,
+    movimientos_un_gen,
+    nsga2_memetic,
+)
+from tesis3.src.core.chromosome import Chromosome
+from tesis3.src.fitness.multi_objective import fitness_multiobjetivo
+
+
+def test_movimientos_un_gen(config):
+    """Cada pedido y etapa con todas las máquinas de la etapa salvo la actual"""
+    random.seed(0)
+    genes = Chromosome.random(config).genes_lectura
+    pedidos, etapas, maquinas = movimientos_un_gen(genes, config)
+    
+    esperados = {
+        (p, e, m)
+        for p in range(config.num_pedidos)
+        for e in range(config.num_etapas)
+        for m in config.get_maquinas_etapa(e + 1)
+        if m != genes[p, e]
+    }
+    obtenidos = set(zip(pedidos.tolist(), etapas.tolist(), maquinas.tolist()))
+    assert obtenidos == esperados
+    assert len(pedidos) == len(esperados)
+
+
+@pytest.mark.parametrize("modo,tamano_bloque", [
+    ('aleatorio', None), ('mejor', None), ('primera', None), ('primera', 16),
+])
+def test_busqueda_local_no_empeora(config, modo, tamano_bloque):
+    """El resultado es válido y domina o iguala al original"""
+    random.seed(1)
+    mejoras = 0
+    for _ in range(10):
+        individuo = Chromosome.random(config)
+        resultado = busqueda_local(individuo, config, 4, modo=modo, tamano_bloque=tamano_bloque)
+        assert resultado.is_valid()
+        assert resultado is not individuo
+        inicial = fitness_multiobjetivo(individuo, config)
+        final = fitness_multiobjetivo(resultado, config)
+        assert dominancia(final, inicial) or final == inicial
+        mejoras += dominancia(final, inicial)
+    if modo == 'mejor':
+        # El vecindario completo encuentra una mejora desde un punto aleatorio
+        assert mejoras == 10
+
+
+def test_busqueda_local_mejor_movimiento(config):
+    """En modo 'mejor' un paso toma el vecino dominante de mayor mejora relativa"""
+    random.seed(2)
+    individuo = Chromosome.random(config)
+    resultado = busqueda_local(individuo, config, 1, modo='mejor')
+    
+    inicial = np.array(fitness_multiobjetivo(individuo, config))
+    mejor_mejora = -np.inf
+    for p, e, m in zip(*movimientos_un_gen(individuo.genes_lectura, config)):
+        vecino = individuo.copy()
+        vecino.asignar_gen(int(p), int(e), int(m))
+        fitness = np.array(fitness_multiobjetivo(vecino, config))
+        if dominancia(tuple(fitness), tuple(inicial)):
+            mejor_mejora = max(mejor_mejora, (fitness / inicial).sum())
+    final = np.array(fitness_multiobjetivo(resultado, config))
+    assert (final / inicial).sum() == pytest.approx(mejor_mejora)
+
+
+def test_busqueda_local_modo_desconocido(config):
+    random.seed(3)
+    with pytest.raises(ValueError):
+        busqueda_local(Chromosome.random(config), config, 2, modo='otro')
+
+
+def test_busqueda_local_pareto(config):
+    """Respeta el presupuesto, el archivo acotado queda no dominado y el estado persiste"""
+    random.seed(4)
+    semillas = [Chromosome.random(config) for _ in range(3)]
+    fitness_semillas = [fitness_multiobjetivo(ind, config) for ind in semillas]
+    pls = BusquedaLocalPareto(config, max_archivo=15, tamano_bloque=50)
+    
+    assert pls.ejecutar(semillas, fitness_semillas, 120) == 120
+    assert pls.ejecutar([], [], 70) == 70
+    assert pls.evaluaciones == 190
+    # Bloques de 50: 50 + 50 + 20 y luego 50 + 20
+    assert len(pls.explorados) == 5
+    
+    fitness = pls.archivo.fitness()
+    assert 0 < len(fitness) <= 15
+    for sol, fit in zip(pls.archivo.soluciones(), fitness):
+        assert sol.is_valid()
+        assert fitness_multiobjetivo(sol, config) == fit
+        assert not any(dominancia(otro, fit) for otro in fitness)
+    # Los vecinos mejoran el punto de partida
+    assert any(dominancia(fit, fitness_semillas[0]) for fit in fitness)
+
+
+def test_nsga2_memetic_con_pls(config, cruce, mutacion):
+    """nsga2_memetic con Pareto Local Search: presupuesto por aplicación"""
+    random.seed(5)
+    np.random.seed(5)
+    estadisticas = {}
+    frente, fitness, historial = nsga2_memetic(
+        config, cruce, mutacion, tamano_poblacion=12, num_generaciones=6,
+        cada_k_gen=2, verbose=False, estadisticas=estadisticas,
+        presupuesto_pls=40, max_archivo_pls=20,
+    )
+    assert len(historial) == 6 and len(frente) == len(fitness) > 0
+    assert estadisticas['evaluaciones_pls'] == 3 * 40
+    assert 0 < estadisticas['archivo_pls_tamano'] <= 20
+    for a in fitness:
+        assert not any(dominancia(b, a) for b in fitness)
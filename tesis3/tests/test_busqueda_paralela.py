@@ -0,0 +1,64 @@
+"""Tests de la búsqueda local en paralelo con secuencias aleatorias por tarea"""
+import random
+
+import numpy as np
+import pytest
+
+from tesis3.src.algorithms.busqueda_paralela import BusquedaLocalParalela
+from tesis3.src.algorithms.nsga2_memetic import busqueda_local, nsga2_memetic
+from tesis3.src.core.chromosome import Chromosome
+from tesis3.src.fitness.multi_objective import evaluar_individuos
+from tesis3.src.utils.seeds import semillas_derivadas
+
+
+@pytest.mark.parametrize("modo", ['aleatorio', 'mejor'])
+def test_busqueda_local_con_rng_propio(config, modo):
+    """Con rng el resultado depende solo de su semilla y `random` no se consume"""
+    random.seed(0)
+    individuo = Chromosome.random(config)
+    resultados = []
+    for semilla_global in (1, 2):
+        random.seed(semilla_global)
+        estado = random.getstate()
+        resultados.append(busqueda_local(
+            individuo, config, 10, modo=modo, rng=random.Random(5)
+        ).clave)
+        assert random.getstate() == estado
+    assert resultados[0] == resultados[1]
+
+
+def test_mismo_resultado_con_cualquier_numero_de_workers(config):
+    """El pool devuelve lo mismo que la ejecución en el proceso principal"""
+    random.seed(3)
+    individuos = [Chromosome.random(config) for _ in range(7)]
+    semillas = semillas_derivadas(11, len(individuos))
+    max_iters = [3, 5, 8, 1, 5, 5, 2]
+    
+    resultados = []
+    for num_workers in (1, 2, 3):
+        with BusquedaLocalParalela(config, num_workers=num_workers) as busqueda_paralela:
+            mejorados = busqueda_paralela.mejorar(individuos, max_iters, semillas)
+            assert busqueda_paralela.estadisticas()['busqueda_paralela_tareas'] == 7
+        resultados.append([(ind.clave, fit) for ind, fit in mejorados])
+    assert resultados[0] == resultados[1] == resultados[2]
+    
+    fitness = evaluar_individuos([ind for ind, _ in mejorados], config)
+    assert fitness == [fit for _, fit in mejorados]
+
+
+def test_nsga2_memetic_reproducible_con_busqueda_paralela(config, cruce, mutacion):
+    """La corrida es la misma con 1 o 2 workers de búsqueda local"""
+    resultados = []
+    for num_workers in (1, 2):
+        random.seed(4)
+        np.random.seed(4)
+        estadisticas = {}
+        with BusquedaLocalParalela(config, num_workers=num_workers) as busqueda_paralela:
+            _, fitness, historial = nsga2_memetic(
+                config, cruce, mutacion, tamano_poblacion=12, num_generaciones=6,
+                cada_k_gen=2, verbose=False, estadisticas=estadisticas,
+                busqueda_paralela=busqueda_paralela,
+            )
+        resultados.append((fitness, historial))
+        assert estadisticas['busqueda_paralela_tareas'] > 0
+    assert resultados[0] == resultados[1]
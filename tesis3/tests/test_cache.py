@@ -0,0 +1,51 @@
+"""Tests para el cache de fitness acotado"""
+import random
+
+from tesis3.src.algorithms.nsga2 import evaluar_con_cache
+from tesis3.src.core.chromosome import Chromosome
+from tesis3.src.fitness.cache import CacheFitness
+from tesis3.src.fitness.multi_objective import fitness_multiobjetivo
+
+
+def test_cache_desaloja_lru():
+    """Al superar max_entradas se desaloja la entrada usada hace más tiempo"""
+    cache = CacheFitness(max_entradas=2)
+    cache[b'a'] = (1.0, 1.0, 1.0)
+    cache[b'b'] = (2.0, 2.0, 2.0)
+    assert cache.get(b'a') == (1.0, 1.0, 1.0)
+    cache[b'c'] = (3.0, 3.0, 3.0)
+    
+    assert b'a' in cache and b'c' in cache
+    assert b'b' not in cache
+    assert cache.get(b'b') is None
+    
+    estadisticas = cache.estadisticas()
+    assert estadisticas['cache_aciertos'] == 1
+    assert estadisticas['cache_fallos'] == 1
+    assert estadisticas['cache_desalojos'] == 1
+    assert estadisticas['cache_entradas'] == 2
+
+
+def test_cache_limite_bytes():
+    """El límite de bytes estimados también acota el cache"""
+    cache = CacheFitness(max_entradas=None, max_bytes=1000)
+    for i in range(50):
+        cache[bytes([i])] = (float(i), float(i), float(i))
+    assert 0 < cache.bytes_estimados <= 1000
+    assert cache.desalojos == 50 - len(cache)
+    
+    cache.limpiar()
+    assert len(cache) == 0 and cache.bytes_estimados == 0
+
+
+def test_evaluar_con_cache_acotado(config):
+    """Un lote mayor que el cache devuelve el fitness correcto y cuenta fallos únicos"""
+    random.seed(0)
+    poblacion = [Chromosome.random(config) for _ in range(10)]
+    cache = CacheFitness(max_entradas=3)
+    
+    fitness = evaluar_con_cache(poblacion + poblacion[:2], config, cache)
+    assert fitness == [fitness_multiobjetivo(ind, config) for ind in poblacion + poblacion[:2]]
+    assert cache.fallos == 10
+    assert len(cache) == 3
+    assert cache.desalojos == 7
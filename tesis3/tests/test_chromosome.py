@@ -1,14 +1,11 @@
 
 """Tests para la clase Chromosome"""
-import pytest
-from tesis3.src.core.chromosome import Chromosome
-from tesis3.src.core.problem import ProblemConfig
+import pickle
 
+import numpy as np
+import pytest
 
-@pytest.fixture
-def config():
-    """Fixture para configuración del problema"""
-    return ProblemConfig.from_yaml("tesis3/config/config.yaml")
+from tesis3.src.core.chromosome import Chromosome
 
 
 def test_random_chromosome_is_valid(config):
@@ -48,3 +45,49 @@ def test_chromosome_copy(config):
     
     copia.genes[0][0] = 999
     assert original.genes[0][0] != 999
+
+
+def test_chromosome_genes_array(config):
+    """Los genes se guardan en un array compacto (num_pedidos, num_etapas)"""
+    chromosome = Chromosome.random(config)
+    assert chromosome.genes.shape == (config.num_pedidos, config.num_etapas)
+    
+    chromosome.genes = [[1, 4, 6, 10, 11]] * config.num_pedidos
+    assert chromosome.genes.dtype == np.int16
+    assert chromosome.is_valid()
+
+
+def test_chromosome_pickle_compatible(config):
+    """Pickle ida y vuelta, y carga del estado antiguo (genes como lista en __dict__)"""
+    original = Chromosome.random(config)
+    copia = pickle.loads(pickle.dumps(original))
+    assert np.array_equal(copia.genes, original.genes)
+    
+    antiguo = Chromosome.__new__(Chromosome)
+    antiguo.__setstate__({
+        'genes': original.genes.tolist(),
+        'config': config,
+        '_fitness': None,
+        '_objectives': None,
+    })
+    assert np.array_equal(antiguo.genes, original.genes)
+    assert antiguo.is_valid()
+
+
+def test_chromosome_clave(config):
+    """La clave identifica los genes y se invalida al modificarlos"""
+    original = Chromosome.random(config)
+    copia = original.copy()
+    assert copia.clave == original.clave
+    assert Chromosome(original.genes_lectura, config).clave == original.clave
+    
+    maquina = original.genes_lectura[0, 0]
+    otra = next(m for m in config.get_maquinas_etapa(1) if m != maquina)
+    copia.asignar_gen(0, 0, otra)
+    assert copia.clave != original.clave
+    
+    copia.genes[0][0] = maquina
+    assert copia.clave == original.clave
+    
+    with pytest.raises(ValueError):
+        original.genes_lectura[0, 0] = otra
@@ -0,0 +1,84 @@
+"""Tests para el modelo de islas con migración en anillo"""
+import os
+import random
+
+import numpy as np
+import pytest
+
+from tesis3.src.algorithms.islas import nsga2_islas, semillas_islas
+from tesis3.src.algorithms.nsga2 import dominancia, nsga2, reemplazar_peores
+from tesis3.src.core.chromosome import Chromosome
+
+
+def _cruce_que_muere(p1, p2, cfg, prob):
+    # Simula un proceso matado (OOM, segfault): sale sin pasar por los except
+    os._exit(9)
+
+
+def test_semillas_islas():
+    """Semillas distintas por isla y reproducibles"""
+    semillas = semillas_islas(7, 4)
+    assert len(set(semillas)) == 4
+    assert semillas == semillas_islas(7, 4)
+
+
+def test_reemplazar_peores(config):
+    """Los inmigrantes reemplazan al último frente; los repetidos se ignoran"""
+    random.seed(0)
+    poblacion = [Chromosome.random(config) for _ in range(5)]
+    inmigrantes = [Chromosome.random(config), poblacion[0].copy(), Chromosome.random(config)]
+    frentes = [[0, 3], [4, 1], [2]]
+    nueva = reemplazar_peores(poblacion, frentes, inmigrantes)
+    assert nueva[2] is inmigrantes[0]
+    assert nueva[1] is inmigrantes[2]
+    assert [nueva[i] for i in (0, 3, 4)] == [poblacion[i] for i in (0, 3, 4)]
+    assert reemplazar_peores(poblacion, frentes, [poblacion[1].copy()]) is poblacion
+
+
+def test_migracion_en_nsga2(config, cruce, mutacion):
+    """El callback recibe el frente 0 y sus inmigrantes entran a la población"""
+    recibidos = []
+    
+    def migracion(gen, poblacion, fitness_poblacion, frente):
+        recibidos.append((gen, len(poblacion), len(frente)))
+        if gen == 2:
+            return [Chromosome.random(config)]
+        return []
+    
+    random.seed(1)
+    np.random.seed(1)
+    nsga2(config, cruce, mutacion, tamano_poblacion=12, num_generaciones=4,
+          verbose=False, migracion=migracion)
+    assert [gen for gen, _, _ in recibidos] == [0, 1, 2, 3]
+    assert all(n == 12 and 0 < f <= 12 for _, n, f in recibidos)
+
+
+def test_nsga2_islas(config, cruce, mutacion):
+    """Frente combinado no dominado, migraciones en anillo y reproducibilidad"""
+    corridas = []
+    for _ in range(2):
+        estadisticas = {}
+        frente, fitness, historiales = nsga2_islas(
+            config, cruce, mutacion, num_islas=3, cada_m_migracion=2,
+            num_migrantes=2, semilla=5, estadisticas=estadisticas,
+            tamano_poblacion=12, num_generaciones=6,
+        )
+        corridas.append(fitness)
+    
+    assert len(frente) == len(fitness) > 0
+    assert len(historiales) == 3 and all(len(h) == 6 for h in historiales)
+    for a in fitness:
+        assert not any(dominancia(b, a) for b in fitness)
+    # Migraciones en las generaciones 2 y 4, hasta 2 migrantes por isla
+    assert estadisticas['migrantes_enviados'] == estadisticas['migrantes_recibidos']
+    assert 0 < estadisticas['migrantes_enviados'] <= 12
+    assert corridas[0] == corridas[1]
+
+
+def test_nsga2_islas_isla_muerta(config, mutacion):
+    """Una isla que muere sin enviar su resultado no deja al padre esperando"""
+    with pytest.raises(RuntimeError, match="sin enviar su resultado"):
+        nsga2_islas(
+            config, _cruce_que_muere, mutacion, num_islas=2, cada_m_migracion=100,
+            semilla=5, tamano_poblacion=12, num_generaciones=4,
+        )
@@ -0,0 +1,94 @@
+"""Tests para el memo de fitness compartido entre procesos"""
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from tesis3.src.algorithms.nsga2 import evaluar_con_cache
+from tesis3.src.core.chromosome import Chromosome
+from tesis3.src.core.problem import ProblemConfig
+from tesis3.src.fitness import memo_compartido
+from tesis3.src.fitness.cache import CacheFitness
+from tesis3.src.fitness.memo_compartido import MemoCompartido
+from tesis3.src.fitness.multi_objective import fitness_multiobjetivo
+
+
+@pytest.fixture
+def memo(config):
+    """Memo pequeño, liberado al terminar el test"""
+    memo = MemoCompartido.crear(config, num_entradas=64)
+    yield memo
+    memo.liberar()
+
+
+def _evaluar_en_worker(genes):
+    """Tarea de prueba: evalúa con el cache del worker y devuelve los aciertos del respaldo"""
+    config = ProblemConfig.from_yaml("tesis3/config/config.yaml")
+    individuos = [Chromosome(g, config) for g in genes]
+    cache = memo_compartido.cache_del_worker()
+    fitness = evaluar_con_cache(individuos, config, cache)
+    return fitness, cache.aciertos_respaldo
+
+
+def test_memo_guardar_y_buscar(config, memo):
+    """Lo guardado se encuentra; claves ausentes son fallos"""
+    assert memo.num_entradas == 64
+    memo.guardar_lote({b'a' * 16: (1.0, 2.0, 3.0), b'b' * 16: (4.0, 5.0, 6.0)})
+    
+    assert memo.buscar_lote([b'a' * 16, b'c' * 16]) == {b'a' * 16: (1.0, 2.0, 3.0)}
+    assert memo.buscar(b'b' * 16) == (4.0, 5.0, 6.0)
+    assert memo.fallos == 1
+
+
+def test_memo_entrada_corrupta_es_fallo(config, memo):
+    """Una entrada a medio escribir (checksum inválido) se trata como fallo"""
+    clave = b'x' * 16
+    memo.guardar(clave, (1.0, 2.0, 3.0))
+    i = int(np.flatnonzero(memo._control)[0])
+    memo._valores[i, 1] = 9.0
+    assert memo.buscar(clave) is None
+
+
+def test_memo_rechaza_otra_instancia(config, memo):
+    """Conectar con una configuración distinta falla por la huella"""
+    otra = ProblemConfig.from_yaml("tesis3/config/config.yaml")
+    otra.incrementos = [x * 2 for x in otra.incrementos]
+    with pytest.raises(ValueError):
+        MemoCompartido.conectar(memo.nombre, otra)
+
+
+def test_memo_compartido_entre_workers(config, memo):
+    """Un worker reutiliza lo que evaluó otro, con el mismo fitness"""
+    random.seed(0)
+    genes = [Chromosome.random(config).genes.tolist() for _ in range(8)]
+    esperado = [fitness_multiobjetivo(Chromosome(g, config), config) for g in genes]
+    
+    with ProcessPoolExecutor(
+        max_workers=1,
+        initializer=memo_compartido.inicializar_worker,
+        initargs=(memo.nombre, config),
+    ) as executor:
+        primero, ahorradas_primero = executor.submit(_evaluar_en_worker, genes).result()
+    with ProcessPoolExecutor(
+        max_workers=1,
+        initializer=memo_compartido.inicializar_worker,
+        initargs=(memo.nombre, config),
+    ) as executor:
+        segundo, ahorradas_segundo = executor.submit(_evaluar_en_worker, genes).result()
+    
+    assert primero == esperado and segundo == esperado
+    assert ahorradas_primero == 0
+    assert ahorradas_segundo == len(genes)
+
+
+def test_cache_con_respaldo(config, memo):
+    """evaluar_con_cache consulta el respaldo antes de simular"""
+    random.seed(1)
+    poblacion = [Chromosome.random(config) for _ in range(5)]
+    evaluar_con_cache(poblacion, config, CacheFitness(respaldo=memo))
+    
+    cache = CacheFitness(respaldo=memo)
+    fitness = evaluar_con_cache(poblacion, config, cache)
+    assert fitness == [fitness_multiobjetivo(ind, config) for ind in poblacion]
+    assert cache.estadisticas()['cache_aciertos_respaldo'] == 5
@@ -0,0 +1,52 @@
+"""Tests de la memoria tabú de la búsqueda local"""
+import random
+
+import pytest
+
+from tesis3.src.algorithms.memoria_tabu import MemoriaTabu
+from tesis3.src.algorithms.nsga2_memetic import busqueda_local
+from tesis3.src.core.chromosome import Chromosome
+
+
+def test_memoria_tabu_lru():
+    """Acotada por max_entradas, desaloja el movimiento usado hace más tiempo"""
+    memoria = MemoriaTabu(max_entradas=2)
+    memoria.registrar(b'a', 0, 0, 1)
+    memoria.registrar(b'a', 0, 1, 2)
+    assert memoria.es_tabu(b'a', 0, 0, 1)
+    assert not memoria.es_tabu(b'b', 0, 0, 1)
+    memoria.registrar(b'b', 3, 0, 1)
+    
+    assert len(memoria) == 2
+    assert not memoria.es_tabu(b'a', 0, 1, 2)
+    assert memoria.es_tabu(b'a', 0, 0, 1)
+    estadisticas = memoria.estadisticas()
+    assert estadisticas['tabu_aciertos'] == 2
+    assert estadisticas['tabu_consultas'] == 4
+    assert estadisticas['tabu_registrados'] == 3
+    assert estadisticas['tabu_desalojos'] == 1
+    
+    with pytest.raises(ValueError):
+        MemoriaTabu(max_entradas=0)
+
+
+@pytest.mark.parametrize("modo, tamano_bloque", [
+    ('aleatorio', None), ('mejor', None), ('primera', None), ('mejor', 40), ('primera', 40),
+])
+def test_busqueda_local_con_tabu_mismo_resultado(config, modo, tamano_bloque):
+    """Aplicaciones repetidas: mismos resultados sin re-evaluar lo ya rechazado"""
+    random.seed(6)
+    individuos = [Chromosome.random(config) for _ in range(4)]
+    memoria = MemoriaTabu()
+    
+    def aplicar(memoria_tabu):
+        random.seed(7)
+        return [
+            busqueda_local(ind, config, 20, modo=modo, tamano_bloque=tamano_bloque,
+                           memoria_tabu=memoria_tabu).clave
+            for _ in range(3)
+            for ind in individuos
+        ]
+    
+    assert aplicar(memoria) == aplicar(None)
+    assert memoria.estadisticas()['tabu_aciertos'] > 0
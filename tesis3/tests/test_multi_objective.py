@@ -0,0 +1,73 @@
+"""Tests para la función de fitness multiobjetivo"""
+import random
+
+import numpy as np
+import pytest
+
+from tesis3.src.core.chromosome import Chromosome
+from tesis3.src.fitness.incremental import EvaluadorIncremental
+from tesis3.src.fitness.multi_objective import (
+    evaluar_individuos,
+    evaluar_poblacion,
+    fitness_multiobjetivo,
+)
+
+
+@pytest.fixture
+def poblacion(config):
+    """Población aleatoria reproducible"""
+    random.seed(0)
+    return [Chromosome.random(config) for _ in range(50)]
+
+
+def test_evaluar_poblacion_coincide_con_escalar(config, poblacion):
+    """La evaluación por lotes debe dar exactamente los mismos objetivos"""
+    genes_array = np.array([ind.genes for ind in poblacion])
+    objetivos = evaluar_poblacion(genes_array, config)
+
+    assert objetivos.shape == (len(poblacion), 3)
+    for ind, fila in zip(poblacion, objetivos):
+        assert tuple(fila) == fitness_multiobjetivo(ind, config)
+
+
+def test_evaluar_individuos_devuelve_tuplas(config, poblacion):
+    """evaluar_individuos devuelve tuplas iguales a las de la versión escalar"""
+    resultado = evaluar_individuos(poblacion, config)
+    assert resultado == [fitness_multiobjetivo(ind, config) for ind in poblacion]
+
+
+def test_evaluar_poblacion_vacia(config):
+    """Un lote vacío devuelve un array (0, 3)"""
+    vacio = np.zeros((0, config.num_pedidos, config.num_etapas), dtype=int)
+    assert evaluar_poblacion(vacio, config).shape == (0, 3)
+
+
+def test_evaluar_poblacion_rechaza_forma_invalida(config, poblacion):
+    """Se requiere un array de 3 dimensiones"""
+    with pytest.raises(ValueError):
+        evaluar_poblacion(np.array(poblacion[0].genes), config)
+
+
+def test_evaluador_incremental_coincide_con_evaluacion_completa(config, poblacion):
+    """Evaluar y aplicar movimientos de un gen da el mismo fitness que re-simular todo"""
+    random.seed(1)
+    base = poblacion[0].copy()
+    evaluador = EvaluadorIncremental(base, config)
+    assert evaluador.fitness == fitness_multiobjetivo(base, config)
+
+    for _ in range(30):
+        pedido_idx = random.randrange(config.num_pedidos)
+        etapa = random.randrange(config.num_etapas)
+        maquina = random.choice(config.get_maquinas_etapa(etapa + 1))
+
+        vecino = base.copy()
+        vecino.genes[pedido_idx][etapa] = maquina
+        esperado = fitness_multiobjetivo(vecino, config)
+
+        assert evaluador.evaluar_movimiento(pedido_idx, etapa, maquina) == esperado
+        # Evaluar no debe modificar el cromosoma base
+        assert evaluador.fitness == fitness_multiobjetivo(base, config)
+
+        if random.random() < 0.5:
+            assert evaluador.aplicar_movimiento(pedido_idx, etapa, maquina) == esperado
+            base = vecino
@@ -0,0 +1,115 @@
+"""Tests de la clasificación no dominada por rangos y para tres objetivos"""
+import numpy as np
+import pytest
+
+from tesis3.src.algorithms import no_dominados
+from tesis3.src.algorithms.no_dominados import (
+    frentes_desde_rangos,
+    frentes_tres_objetivos,
+    rangos_desde_frentes,
+    rangos_no_dominados,
+    rangos_tres_objetivos,
+)
+from tesis3.src.algorithms.nsga2 import (
+    _clasificacion_cuadratica,
+    clasificacion_no_dominada,
+    dominancia,
+)
+from tesis3.src.utils import aceleracion
+
+
+def _frentes_referencia(fitness):
+    """Pelado original con listas de dominados (referencia de frentes y orden)"""
+    n = len(fitness)
+    dominados_por = [[] for _ in range(n)]
+    num_dominados = [0] * n
+    for i in range(n):
+        for j in range(n):
+            if i != j and dominancia(fitness[i], fitness[j]):
+                dominados_por[i].append(j)
+                num_dominados[j] += 1
+    
+    frentes = [[i for i in range(n) if num_dominados[i] == 0]]
+    while True:
+        siguiente_frente = []
+        for i in frentes[-1]:
+            for j in dominados_por[i]:
+                num_dominados[j] -= 1
+                if num_dominados[j] == 0:
+                    siguiente_frente.append(j)
+        if not siguiente_frente:
+            return frentes
+        frentes.append(siguiente_frente)
+
+
+def _casos(num_casos, semilla):
+    """Fitness aleatorios (n, 3) con empates, duplicados y muchos frentes"""
+    rng = np.random.default_rng(semilla)
+    for caso in range(num_casos):
+        n = int(rng.integers(1, 150))
+        if caso % 3 == 0:
+            fitness = rng.random((n, 3))
+        else:
+            # Valores discretos: empates en objetivos y puntos repetidos
+            fitness = rng.integers(0, int(rng.integers(2, 12)), size=(n, 3)).astype(float)
+        if caso % 4 == 0:
+            # Objetivos correlacionados: muchos frentes pequeños
+            fitness[:, 1] = fitness[:, 0] + 0.1 * fitness[:, 1]
+        yield fitness
+
+
+@pytest.mark.parametrize('backend', ['python', 'numba'])
+def test_frentes_identicos_al_pelado_original(backend, monkeypatch):
+    """Mismos frentes y mismo orden interno, con empates, duplicados y muchos frentes"""
+    if backend == 'numba' and not aceleracion.NUMBA_DISPONIBLE:
+        pytest.skip("numba no instalado")
+    monkeypatch.setattr(aceleracion, 'BACKEND', backend)
+    for fitness in _casos(60, semilla=0):
+        esperado = _frentes_referencia(fitness.tolist())
+        assert _clasificacion_cuadratica(fitness) == esperado
+        assert frentes_tres_objetivos(fitness) == esperado
+
+
+@pytest.mark.parametrize('backend', ['python', 'numba'])
+def test_rangos_no_dominados(backend, monkeypatch):
+    """Los rangos corresponden a los frentes de referencia"""
+    if backend == 'numba' and not aceleracion.NUMBA_DISPONIBLE:
+        pytest.skip("numba no instalado")
+    monkeypatch.setattr(aceleracion, 'BACKEND', backend)
+    for fitness in _casos(30, semilla=3):
+        frentes = _frentes_referencia(fitness.tolist())
+        rangos = rangos_no_dominados(fitness)
+        assert rangos.tolist() == rangos_desde_frentes(frentes, len(fitness)).tolist()
+        assert frentes_desde_rangos(rangos) == [sorted(frente) for frente in frentes]
+
+
+def test_rangos_desde_frentes_ubica_faltantes_en_el_ultimo_frente():
+    """Los índices fuera de todo frente (filtrados del frente 0) van al último"""
+    rangos = rangos_desde_frentes([[0, 3], [1], [2, 5]], 6)
+    assert rangos.tolist() == [0, 1, 2, 0, 2, 2]
+    assert rangos_desde_frentes([], 2).tolist() == [0, 0]
+
+
+def test_rangos_tres_objetivos():
+    """Rangos de un caso pequeño conocido, con un duplicado"""
+    fitness = np.array([
+        [3.0, 3.0, 3.0],
+        [1.0, 1.0, 1.0],
+        [3.0, 1.0, 2.0],
+        [1.0, 3.0, 2.0],
+        [1.0, 1.0, 1.0],
+        [0.0, 0.0, 0.0],
+    ])
+    assert rangos_tres_objetivos(fitness).tolist() == [0, 2, 1, 1, 2, 3]
+    assert frentes_tres_objetivos(fitness) == [[0], [2, 3], [1, 4], [5]]
+
+
+def test_clasificacion_usa_tres_objetivos_sobre_el_umbral(monkeypatch):
+    """Sobre el umbral clasificacion_no_dominada da el mismo resultado"""
+    rng = np.random.default_rng(1)
+    fitness = [tuple(fila) for fila in np.round(rng.random((80, 3)) * 6).tolist()]
+    esperado = clasificacion_no_dominada(fitness, fitness)
+    
+    monkeypatch.setattr(no_dominados, 'UMBRAL_TRES_OBJETIVOS', 10)
+    monkeypatch.setattr(no_dominados, 'UMBRAL_TRES_OBJETIVOS_NUMBA', 10)
+    assert clasificacion_no_dominada(fitness, fitness) == esperado
@@ -0,0 +1,206 @@
+"""Tests de selección de padres de NSGA-II"""
+import random
+
+import numpy as np
+
+from tesis3.src.algorithms.archivo_pareto import ArchivoPareto
+from tesis3.src.algorithms.nsga2 import (
+    crowding_por_frentes,
+    descartar_duplicados,
+    distancia_crowding,
+    dominancia,
+    filtrar_indices_similares,
+    filtrar_soluciones_similares,
+    frentes_vigentes,
+    indices_mayor_crowding,
+    mascara_soluciones_similares,
+    nsga2,
+    registrar_duplicados,
+    torneo_binario_lote,
+    truncar_por_crowding_iterativo,
+)
+from tesis3.src.core.chromosome import Chromosome
+from tesis3.src.operators.mutation import aplicar_mutacion
+
+
+def test_torneo_lote_comparacion_por_crowding():
+    """Gana el menor rango; a igual rango, el mayor crowding"""
+    rangos = np.array([0, 1, 1, 2])
+    crowding = np.array([0.5, np.inf, 0.2, 9.0])
+    rng = np.random.default_rng(0)
+    padres = torneo_binario_lote(rangos, crowding, 2000, rng)
+    
+    # Reproducir las mismas parejas de competidores
+    rng = np.random.default_rng(0)
+    competidor1 = rng.integers(0, 4, size=2000)
+    competidor2 = (competidor1 + rng.integers(1, 4, size=2000)) % 4
+    assert np.all(competidor1 != competidor2)
+    for a, b, ganador in zip(competidor1, competidor2, padres):
+        esperado = min((a, b), key=lambda i: (rangos[i], -crowding[i]))
+        assert ganador == esperado
+    
+    # El individuo 3 (peor rango) nunca gana; el 0 gana todos sus torneos
+    assert 3 not in padres
+    torneos_del_0 = (competidor1 == 0) | (competidor2 == 0)
+    assert np.count_nonzero(padres == 0) == np.count_nonzero(torneos_del_0)
+
+
+def test_crowding_por_frentes():
+    """El crowding se calcula dentro de cada frente; fuera de los frentes es 0"""
+    fitness = [(1.0, 5.0, 0.0), (2.0, 4.0, 0.0), (3.0, 3.0, 0.0), (4.0, 1.0, 0.0), (0.0, 0.0, 0.0)]
+    frentes = [[0, 1, 2, 3]]
+    crowding = crowding_por_frentes(fitness, frentes, 5)
+    assert crowding[:4].tolist() == distancia_crowding(fitness[:4])
+    assert crowding[4] == 0.0
+
+
+def test_mascara_soluciones_similares():
+    """Se elimina el punto similar dominado; las copias de un punto también cuentan"""
+    # 30 puntos separados (más de epsilon en las métricas normalizadas)
+    fitness = [(0.5 + 0.5 * t, 1.0 - 0.4 * t, 0.6 + 0.3 * t * t)
+               for t in np.linspace(0.0, 1.0, 30).tolist()]
+    # 30: casi igual y dominado por 0; 31: copia exacta de 5
+    fitness.append(tuple(f - 1e-4 for f in fitness[0]))
+    fitness.append(fitness[5])
+    
+    mantener = mascara_soluciones_similares(fitness, epsilon=0.01)
+    assert mantener.dtype == bool and len(mantener) == 32
+    assert mantener[0] and not mantener[30]
+    assert mantener[5] != mantener[31]
+    assert mantener[:30].all()
+    
+    # Los índices se filtran en el orden dado, con la máscara de su subconjunto
+    indices = list(range(31, -1, -2)) + list(range(0, 32, 2))
+    mantener_subconjunto = mascara_soluciones_similares([fitness[i] for i in indices], 0.01)
+    assert filtrar_indices_similares(indices, fitness, 0.01) == [
+        i for i, m in zip(indices, mantener_subconjunto) if m
+    ]
+    poblacion = list(range(32))
+    filtrada, fitness_filtrado = filtrar_soluciones_similares(poblacion, fitness, 0.01)
+    assert filtrada == [i for i in poblacion if mantener[i]]
+    assert fitness_filtrado == [fitness[i] for i in filtrada]
+
+
+def test_indices_mayor_crowding_igual_a_ordenar():
+    """Mismo resultado que ordenar todo el frente (empates por índice)"""
+    rng = np.random.default_rng(5)
+    for _ in range(50):
+        n = int(rng.integers(1, 40))
+        # Valores repetidos e infinitos para forzar empates en el corte
+        distancias = rng.integers(0, 5, size=n).astype(float)
+        distancias[rng.random(n) < 0.2] = np.inf
+        k = int(rng.integers(0, n + 1))
+        esperado = sorted(range(n), key=lambda i: distancias[i], reverse=True)[:k]
+        assert indices_mayor_crowding(distancias, k).tolist() == esperado
+
+
+def _truncar_referencia(fitness, k):
+    """Recalcula el crowding de todo el frente restante en cada eliminación"""
+    fitness = np.array(fitness, dtype=float)
+    rangos = np.ptp(fitness, axis=0)
+    restantes = list(range(len(fitness)))
+    while len(restantes) > k:
+        sub = fitness[restantes]
+        distancias = np.zeros(len(restantes))
+        for m in range(sub.shape[1]):
+            orden = np.argsort(sub[:, m], kind='stable')
+            distancias[orden[[0, -1]]] = np.inf
+            if rangos[m] > 0:
+                distancias[orden[1:-1]] += (sub[orden[2:], m] - sub[orden[:-2], m]) / rangos[m]
+        # Menor crowding; a igual crowding, el de mayor índice
+        peor = max(range(len(restantes)), key=lambda i: (-distancias[i], i))
+        del restantes[peor]
+    return sorted(restantes)
+
+
+def test_truncar_por_crowding_iterativo():
+    """Equivale a recalcular el crowding completo tras cada eliminación"""
+    rng = np.random.default_rng(8)
+    for _ in range(30):
+        n = int(rng.integers(3, 30))
+        fitness = [tuple(f) for f in rng.integers(0, 6, size=(n, 3)).astype(float)]
+        k = int(rng.integers(1, n))
+        elegidos = truncar_por_crowding_iterativo(fitness, k)
+        assert len(elegidos) == k
+        assert sorted(elegidos.tolist()) == _truncar_referencia(fitness, k)
+
+
+def test_frentes_vigentes(config):
+    """Los frentes dejan de valer si cambia un individuo o se marcan con None"""
+    random.seed(2)
+    poblacion = [Chromosome.random(config) for _ in range(6)]
+    claves = [ind.clave for ind in poblacion]
+    assert frentes_vigentes(poblacion, claves)
+    assert not frentes_vigentes(poblacion, None)
+    assert not frentes_vigentes(poblacion[:-1], claves)
+    
+    poblacion[3] = poblacion[3].copy()
+    assert frentes_vigentes(poblacion, claves)
+    poblacion[3] = Chromosome.random(config)
+    assert poblacion[3].clave != claves[3]
+    assert not frentes_vigentes(poblacion, claves)
+
+
+def test_nsga2_con_archivo_de_pareto(config, cruce, mutacion):
+    """El frente final sale del archivo: no dominado y sin repetidos"""
+    random.seed(7)
+    archivo = ArchivoPareto()
+    estadisticas = {}
+    frente, fitness, _ = nsga2(
+        config, cruce, mutacion, tamano_poblacion=20, num_generaciones=6,
+        epsilon_filtro=0.0, verbose=False, archivo=archivo, estadisticas=estadisticas,
+    )
+    assert len(frente) == len(archivo) == estadisticas['archivo_tamano']
+    assert len({ind.clave for ind in frente}) == len(frente)
+    for fit in fitness:
+        assert not any(dominancia(otro, fit) for otro in fitness)
+
+
+def test_nsga2_con_torneo_lote_es_reproducible(config, cruce, mutacion):
+    """Con torneo_lote la corrida depende solo de la semilla"""
+    resultados = []
+    for _ in range(2):
+        random.seed(5)
+        _, fitness, _ = nsga2(
+            config, cruce, mutacion, tamano_poblacion=20, num_generaciones=5,
+            verbose=False, torneo_lote=True,
+        )
+        resultados.append(sorted(fitness))
+    assert resultados[0] == resultados[1]
+    assert len(resultados[0]) > 0
+
+
+def test_descartar_duplicados(config):
+    """Los hijos repetidos se re-mutan hasta ser distintos de padres y hermanos"""
+    random.seed(4)
+    poblacion = [Chromosome.random(config) for _ in range(6)]
+    nuevo = Chromosome.random(config)
+    # 3 copias de padres, un hijo nuevo y su copia
+    descendencia = [poblacion[0].copy(), poblacion[3].copy(), nuevo, nuevo.copy(),
+                    poblacion[0].copy()]
+    
+    def mutacion_insert(pob, cfg, prob):
+        return aplicar_mutacion(pob, cfg, 'insert', prob)
+    
+    sin_cambios, evitados, restantes = descartar_duplicados(
+        descendencia, poblacion, config, mutacion_insert, 0
+    )
+    assert sin_cambios == descendencia
+    assert (evitados, restantes) == (0, 4)
+    
+    resultado, evitados, restantes = descartar_duplicados(
+        descendencia, poblacion, config, mutacion_insert, 10
+    )
+    claves = [ind.clave for ind in poblacion + resultado]
+    assert len(set(claves)) == len(claves)
+    assert (evitados, restantes) == (4, 0)
+    assert resultado[2] is nuevo
+    
+    estadisticas = {}
+    registrar_duplicados(estadisticas, 4, 0)
+    registrar_duplicados(estadisticas, 1, 2)
+    assert estadisticas == {
+        'duplicados_evitados': 5,
+        'duplicados_restantes': 2,
+        'duplicados_por_generacion': [4, 1],
+    }
@@ -0,0 +1,70 @@
+"""Tests del NSGA-II de estado estacionario asíncrono"""
+import random
+
+import numpy as np
+
+from tesis3.src.algorithms.nsga2 import clasificacion_no_dominada, dominancia
+from tesis3.src.algorithms.nsga2_asincrono import PoblacionEstable, nsga2_asincrono
+from tesis3.src.core.chromosome import Chromosome
+
+
+def test_poblacion_estable_igual_a_reclasificar(config):
+    """Tras cada inserción los frentes coinciden con una clasificación completa"""
+    random.seed(3)
+    rng = np.random.default_rng(3)
+    # Fitness con muchos empates y varios frentes
+    fitness = [tuple(f) for f in rng.integers(0, 5, size=(15, 3)).astype(float)]
+    poblacion = [Chromosome.random(config) for _ in range(15)]
+    estable = PoblacionEstable(poblacion, fitness)
+    
+    for _ in range(200):
+        nuevo = Chromosome.random(config)
+        fit = tuple(rng.integers(0, 5, size=3).astype(float))
+        eliminado = estable.insertar(nuevo, fit)
+        assert eliminado is not None
+        assert len(estable) == 15
+        
+        fitness_actual = [estable.fitness_de(i) for i in range(15)]
+        frentes = clasificacion_no_dominada(estable.individuos, fitness_actual)
+        assert [sorted(f) for f in estable.frentes] == [sorted(f) for f in frentes]
+        for rango, frente in enumerate(estable.frentes):
+            assert all(estable.rangos[i] == rango for i in frente)
+        assert estable.claves == {ind.clave for ind in estable.individuos}
+    
+    # Un genotipo repetido no se inserta
+    assert estable.insertar(estable.individuos[0].copy(), (9.0, 9.0, 9.0)) is None
+
+
+def test_nsga2_asincrono_secuencial(config, cruce, mutacion):
+    """Con un worker la corrida es reproducible y el frente no es dominado"""
+    corridas = []
+    for _ in range(2):
+        random.seed(6)
+        np.random.seed(6)
+        estadisticas = {}
+        frente, fitness, historial = nsga2_asincrono(
+            config, cruce, mutacion, tamano_poblacion=16, num_generaciones=5,
+            cada_k_local=7, max_iter_local=3, verbose=False, estadisticas=estadisticas,
+        )
+        corridas.append(fitness)
+    assert corridas[0] == corridas[1]
+    assert len(historial) == 5
+    assert estadisticas['nacimientos'] == 80
+    assert estadisticas['busquedas_locales'] == 80 // 7
+    for a in fitness:
+        assert not any(dominancia(b, a) for b in fitness)
+
+
+def test_nsga2_asincrono_con_workers(config, cruce, mutacion):
+    """Con varios workers se insertan todos los hijos previstos"""
+    random.seed(2)
+    np.random.seed(2)
+    estadisticas = {}
+    frente, fitness, historial = nsga2_asincrono(
+        config, cruce, mutacion, tamano_poblacion=16, num_generaciones=4,
+        cada_k_local=5, max_iter_local=3, num_workers=2, verbose=False,
+        estadisticas=estadisticas,
+    )
+    assert estadisticas['nacimientos'] == 64
+    assert len(historial) == 4
+    assert len(frente) == len(fitness) > 0
@@ -0,0 +1,87 @@
+"""Tests para la evaluación en paralelo con pool persistente"""
+import random
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from tesis3.src.algorithms.nsga2 import nsga2
+from tesis3.src.core.chromosome import Chromosome
+from tesis3.src.fitness.multi_objective import evaluar_individuos, evaluar_poblacion
+from tesis3.src.fitness import paralelo
+from tesis3.src.fitness.paralelo import EvaluadorParalelo
+
+
+@pytest.fixture
+def evaluador(config):
+    """Pool de 2 workers con buffers chicos (lotes de varias rondas)"""
+    evaluador = EvaluadorParalelo(config, num_workers=2, capacidad=16, min_lote=4)
+    yield evaluador
+    evaluador.cerrar()
+
+
+def test_evaluador_igual_a_evaluacion_local(config, evaluador):
+    """Mismos fitness que evaluar_individuos, también con varias rondas"""
+    random.seed(2)
+    individuos = [Chromosome.random(config) for _ in range(37)]
+    assert evaluador.evaluar(individuos) == evaluar_individuos(individuos, config)
+    # Lote chico: se evalúa en el proceso principal
+    assert evaluador.evaluar(individuos[:3]) == evaluar_individuos(individuos[:3], config)
+    
+    genes = np.array([ind.genes_lectura for ind in individuos])
+    assert np.array_equal(evaluador.evaluar_genes(genes), evaluar_poblacion(genes, config))
+    
+    estadisticas = evaluador.estadisticas()
+    assert estadisticas['evaluaciones_paralelas'] == 74
+    assert estadisticas['evaluaciones_locales'] == 3
+
+
+def test_evaluador_un_worker_sin_pool(config):
+    """Con un worker no se crean pool ni buffers compartidos"""
+    random.seed(3)
+    individuos = [Chromosome.random(config) for _ in range(8)]
+    with EvaluadorParalelo(config, num_workers=1, min_lote=4) as evaluador:
+        assert evaluador._pool is None and evaluador._memoria_genes is None
+        assert evaluador.evaluar(individuos) == evaluar_individuos(individuos, config)
+        assert evaluador.estadisticas()['evaluaciones_locales'] == 8
+
+
+def test_evaluador_libera_buffers_si_falla_el_pool(config, monkeypatch):
+    """Si el pool no se puede crear, los dos segmentos se eliminan"""
+    creados = []
+    
+    class MemoriaRegistrada(shared_memory.SharedMemory):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            creados.append(self.name)
+    
+    def pool_que_falla(**kwargs):
+        raise OSError("sin procesos")
+    
+    monkeypatch.setattr(paralelo.shared_memory, 'SharedMemory', MemoriaRegistrada)
+    monkeypatch.setattr(paralelo, 'ProcessPoolExecutor', pool_que_falla)
+    with pytest.raises(OSError):
+        EvaluadorParalelo(config, num_workers=2)
+    monkeypatch.undo()
+    
+    assert len(creados) == 2
+    for nombre in creados:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=nombre)
+
+
+def test_nsga2_con_evaluador_es_reproducible(config, evaluador, cruce, mutacion):
+    """Con la misma semilla, el pool no cambia el resultado de la corrida"""
+    resultados = []
+    for usar_pool in (False, True):
+        random.seed(11)
+        np.random.seed(11)
+        estadisticas = {}
+        _, fitness, historial = nsga2(
+            config, cruce, mutacion, tamano_poblacion=20, num_generaciones=8,
+            verbose=False, estadisticas=estadisticas,
+            evaluador=evaluador if usar_pool else None,
+        )
+        resultados.append((fitness, historial))
+    assert resultados[0] == resultados[1]
+    assert estadisticas['evaluaciones_paralelas'] > 0
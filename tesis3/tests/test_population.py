@@ -0,0 +1,86 @@
+"""Tests para la población matricial y sus operadores por lotes"""
+import random
+
+import numpy as np
+import pytest
+
+from tesis3.src.utils.population import PopulationMatrix, inicializar_poblacion
+from tesis3.src.utils.seeds import generador_numpy
+
+
+@pytest.fixture
+def poblacion(config):
+    """Población matricial aleatoria reproducible"""
+    return PopulationMatrix.aleatoria(config, 60, np.random.default_rng(0))
+
+
+def _todos_validos(poblacion):
+    return all(ind.is_valid() for ind in poblacion.a_cromosomas())
+
+
+def test_aleatoria_valida_y_unica(config, poblacion):
+    """La población inicial por lotes es válida, sin repetidos y con claves compatibles"""
+    assert poblacion.genes.shape == (60, config.num_pedidos, config.num_etapas)
+    assert _todos_validos(poblacion)
+    assert len(set(poblacion.claves())) == 60
+    assert poblacion.claves() == [ind.clave for ind in poblacion.a_cromosomas()]
+
+
+def test_desde_cromosomas_ida_y_vuelta(config):
+    """Convertir desde y hacia Chromosome conserva los genes"""
+    random.seed(0)
+    individuos = inicializar_poblacion(config, 10)
+    matriz = PopulationMatrix.desde_cromosomas(individuos, config)
+    assert [ind.clave for ind in matriz.a_cromosomas()] == [ind.clave for ind in individuos]
+
+
+@pytest.mark.parametrize("metodo", ["uniforme", "un_punto"])
+def test_cruce_hereda_de_los_padres(config, poblacion, metodo):
+    """Cada gen de un hijo viene de uno de sus padres, y los hermanos son complementarios"""
+    rng = np.random.default_rng(1)
+    padres1 = rng.integers(0, len(poblacion), size=30)
+    padres2 = rng.integers(0, len(poblacion), size=30)
+    hijos = poblacion.aplicar_cruce(padres1, padres2, rng, metodo=metodo, prob_cruce=0.9)
+    
+    assert len(hijos) == 60
+    assert _todos_validos(hijos)
+    g1, g2 = poblacion.genes[padres1], poblacion.genes[padres2]
+    h1, h2 = hijos.genes[0::2], hijos.genes[1::2]
+    assert np.all(((h1 == g1) & (h2 == g2)) | ((h1 == g2) & (h2 == g1)))
+    if metodo == 'un_punto':
+        # Hijo = prefijo de un padre + sufijo del otro (mismo corte en todas las etapas)
+        for k in range(len(padres1)):
+            assert any(
+                np.array_equal(h1[k], np.concatenate((g1[k][:c], g2[k][c:])))
+                for c in range(1, config.num_pedidos + 1)
+            )
+
+
+@pytest.mark.parametrize("metodo", ["swap", "insert", "invert"])
+def test_mutacion_mantiene_factibilidad(config, poblacion, metodo):
+    """Las mutaciones por lotes solo tocan una etapa y conservan la validez"""
+    original = poblacion.genes.copy()
+    poblacion.aplicar_mutacion(np.random.default_rng(2), metodo=metodo, tasa_mut=0.5)
+    
+    assert _todos_validos(poblacion)
+    cambiados = np.any(original != poblacion.genes, axis=(1, 2))
+    assert 0 < cambiados.sum() < len(poblacion)
+    # Cada individuo mutado cambia en una sola etapa
+    etapas_cambiadas = np.any(original != poblacion.genes, axis=1).sum(axis=1)
+    assert np.all(etapas_cambiadas <= 1)
+    if metodo in ('swap', 'invert'):
+        # Permutaciones dentro de la etapa: mismas máquinas, otro orden
+        assert np.array_equal(np.sort(original, axis=1), np.sort(poblacion.genes, axis=1))
+
+
+def test_operadores_reproducibles_con_semilla(config):
+    """Con la misma semilla de random, los operadores matriciales dan lo mismo"""
+    resultados = []
+    for _ in range(2):
+        random.seed(5)
+        rng = generador_numpy()
+        poblacion = PopulationMatrix.aleatoria(config, 20, rng)
+        hijos = poblacion.cruce_uniforme(np.arange(10), np.arange(10, 20), rng)
+        hijos.mutacion_invert(rng, 0.5)
+        resultados.append(hijos.genes)
+    assert np.array_equal(resultados[0], resultados[1])
@@ -0,0 +1,102 @@
+"""Tests del reparto adaptativo del presupuesto de búsqueda local"""
+import random
+
+import numpy as np
+import pytest
+
+from tesis3.src.algorithms.nsga2_memetic import movimientos_un_gen, nsga2_memetic
+from tesis3.src.algorithms.presupuesto_local import AsignadorPresupuestoLocal
+from tesis3.src.core.chromosome import Chromosome
+
+
+def _frente(n):
+    """Frente en la recta x + y = 1 (los extremos tienen crowding infinito)"""
+    return [(i / (n - 1), 1 - i / (n - 1), 1.0) for i in range(n)]
+
+
+def test_asignar_respeta_presupuesto(config):
+    """Iteraciones dentro de [min, max], total <= presupuesto y solo miembros del frente"""
+    random.seed(0)
+    poblacion = [Chromosome.random(config) for _ in range(12)]
+    fitness = _frente(10) + [(0.0, 0.0, 0.0)] * 2
+    frente = list(range(10))
+    asignador = AsignadorPresupuestoLocal(presupuesto=21, max_por_individuo=4)
+    
+    asignaciones = asignador.asignar(poblacion, fitness, frente)
+    assert sum(it for _, it in asignaciones) <= 21
+    assert all(idx in frente and 1 <= it <= 4 for idx, it in asignaciones)
+    assert len(set(idx for idx, _ in asignaciones)) == len(asignaciones)
+    # Los extremos del frente (mayor crowding) van primero
+    assert {idx for idx, _ in asignaciones[:2]} == {0, 9}
+    
+    # Con lotes de 10 evaluaciones por iteración alcanzan 2 iteraciones
+    asignaciones = asignador.asignar(poblacion, fitness, frente, costo_iteracion=10)
+    assert sum(it for _, it in asignaciones) == 2
+
+
+def test_registrar_prioriza_linajes_que_mejoran(config):
+    """Los éxitos pasan al individuo mejorado y suben su puntaje"""
+    random.seed(1)
+    poblacion = [Chromosome.random(config) for _ in range(6)]
+    fitness = [(1.0, 1.0, 1.0)] * 6
+    frente = list(range(6))
+    asignador = AsignadorPresupuestoLocal(presupuesto=100, peso_crowding=0.0)
+    asignador.asignar(poblacion, fitness, frente)
+    
+    for idx in frente:
+        mejorado = poblacion[idx].copy()
+        if idx == 3:
+            mejorado.asignar_gen(0, 0, [m for m in config.get_maquinas_etapa(1)
+                                        if m != mejorado.genes_lectura[0, 0]][0])
+            assert asignador.registrar(poblacion[idx], mejorado, fitness[idx],
+                                       (2.0, 1.0, 1.0), 5)
+            poblacion[idx] = mejorado
+        else:
+            assert not asignador.registrar(poblacion[idx], mejorado, fitness[idx],
+                                           fitness[idx], 5)
+    
+    estadistica = asignador.miembros[poblacion[3].clave]
+    assert (estadistica['intentos'], estadistica['exitos']) == (1, 1)
+    asignaciones = asignador.asignar(poblacion, fitness, frente)
+    assert asignaciones[0][0] == 3
+    assert asignador.estadisticas()['local_mejoras'] == 1
+
+
+def test_nsga2_memetic_con_presupuesto_local(config, cruce, mutacion):
+    """nsga2_memetic reparte el presupuesto en cada aplicación"""
+    random.seed(2)
+    np.random.seed(2)
+    estadisticas = {}
+    frente, fitness, historial = nsga2_memetic(
+        config, cruce, mutacion, tamano_poblacion=12, num_generaciones=6,
+        cada_k_gen=2, max_iter_local=4, verbose=False, estadisticas=estadisticas,
+        presupuesto_local=10,
+    )
+    assert len(historial) == 6 and len(frente) == len(fitness) > 0
+    assert estadisticas['local_aplicaciones'] == 3
+    assert 0 < estadisticas['local_iteraciones_asignadas'] <= 30
+    
+    with pytest.raises(ValueError):
+        nsga2_memetic(config, cruce, mutacion, tamano_poblacion=12, num_generaciones=2,
+                      verbose=False, presupuesto_local=10, presupuesto_pls=10)
+
+
+@pytest.mark.parametrize("modo", ['mejor', 'primera'])
+def test_nsga2_memetic_presupuesto_local_modos_en_lote(config, modo, cruce, mutacion):
+    """En los modos en lote el presupuesto se cuenta en lotes de vecinos"""
+    random.seed(3)
+    np.random.seed(3)
+    costo = len(movimientos_un_gen(Chromosome.random(config).genes_lectura, config)[0])
+    estadisticas = {}
+    nsga2_memetic(
+        config, cruce, mutacion, tamano_poblacion=12, num_generaciones=4,
+        cada_k_gen=2, max_iter_local=2, verbose=False, estadisticas=estadisticas,
+        modo_local=modo, presupuesto_local=2 * costo,
+    )
+    assert estadisticas['local_aplicaciones'] == 2
+    assert 0 < estadisticas['local_iteraciones_asignadas'] <= 4
+    
+    # Un presupuesto menor que un lote apagaría la búsqueda local
+    with pytest.raises(ValueError):
+        nsga2_memetic(config, cruce, mutacion, tamano_poblacion=12, num_generaciones=2,
+                      verbose=False, modo_local=modo, presupuesto_local=costo - 1)
@@ -32,3 +32,43 @@ def test_all_machines_covered():
     
     expected_machines = set(range(1, config.num_maquinas + 1))
     assert all_machines == expected_machines
+
+
+def test_compilar_precalcula_tiempos_con_enfriamiento():
+    """La tabla compilada reproduce el incremento compuesto y el enfriamiento"""
+    config = ProblemConfig.from_yaml("tesis3/config/config.yaml")
+    problema = config.compilar()
+    
+    assert problema.tiempos_trabajo.shape == (
+        config.num_maquinas, config.num_pedidos * config.num_etapas
+    )
+    assert problema.potencias_activas.flags['C_CONTIGUOUS']
+    assert list(problema.potencias_inactivas) == config.energia['potencias_inactivas']
+    
+    limite = config.enfriamiento['limite']
+    for maquina in range(config.num_maquinas):
+        tiempo_actual = config.tiempos_iniciales[maquina]
+        for k in range(config.num_pedidos):
+            esperado = tiempo_actual
+            if esperado >= config.tiempos_iniciales[maquina] * limite:
+                esperado = ((esperado + config.enfriamiento['tiempo'])
+                            * config.enfriamiento['factor'])
+            assert problema.tiempos_trabajo[maquina, k] == esperado
+            tiempo_actual *= 1 + config.incrementos[maquina]
+
+
+def test_compilar_se_construye_una_vez():
+    """El modelo compilado se reutiliza entre llamadas"""
+    config = ProblemConfig.from_yaml("tesis3/config/config.yaml")
+    assert config.compilar() is config.compilar()
+
+
+def test_huella_identifica_la_instancia():
+    """La huella es estable para la misma instancia y cambia con sus parámetros"""
+    config = ProblemConfig.from_yaml("tesis3/config/config.yaml")
+    otra = ProblemConfig.from_yaml("tesis3/config/config.yaml")
+    assert len(config.huella()) == 16
+    assert config.huella() == otra.huella()
+    
+    otra.tiempos_iniciales = [t + 1 for t in otra.tiempos_iniciales]
+    assert config.huella() != otra.huella()
@@ -0,0 +1,105 @@
+"""Smoke tests del armado del pool en los scripts de experimentos en paralelo"""
+import importlib.util
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import pytest
+
+from tesis3.src.core.problem import ProblemConfig
+from tesis3.src.fitness.almacen import AlmacenEvaluaciones
+from tesis3.src.fitness.memo_compartido import cache_del_worker
+
+DIRECTORIO_SCRIPTS = Path("tesis3/experiments/paralelizacion")
+SCRIPTS = ['ablacion', 'comparacion_operadores', 'tunning_multimetrica']
+
+
+class _PoolCreado(Exception):
+    """Corta main() en cuanto se crea el pool (no se ejecuta el experimento)"""
+
+
+def _cargar_script(nombre):
+    pytest.importorskip("psutil")
+    spec = importlib.util.spec_from_file_location(
+        f"_script_{nombre}", DIRECTORIO_SCRIPTS / f"{nombre}.py"
+    )
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+def _respaldo_del_worker():
+    """Tarea de prueba: respaldo de la cache con el que quedó el worker"""
+    respaldo = cache_del_worker().respaldo
+    return type(respaldo).__name__, respaldo.ruta
+
+
+def _armar_pool(nombre, monkeypatch):
+    """
+    Corre main() del script hasta la creación del pool
+    
+    Returns:
+        dict: Argumentos con los que el script crea el ProcessPoolExecutor
+    """
+    modulo = _cargar_script(nombre)
+    argumentos = {}
+    
+    def pool_falso(**kwargs):
+        argumentos.update(kwargs)
+        raise _PoolCreado
+    
+    respuestas = iter(['1', 's'])
+    monkeypatch.setattr('builtins.input', lambda *args: next(respuestas))
+    monkeypatch.setattr(modulo, 'detectar_capacidades_sistema', lambda: (1, 1, 1.0))
+    monkeypatch.setattr(modulo, 'ProcessPoolExecutor', pool_falso)
+    if hasattr(modulo, 'detectar_resultados_previos'):
+        # Sin resultados previos: hay tareas pendientes y no se escribe en results/
+        monkeypatch.setattr(modulo, 'detectar_resultados_previos', lambda *args, **kwargs: {})
+    with pytest.raises(_PoolCreado):
+        modulo.main()
+    return argumentos
+
+
+@pytest.mark.parametrize("nombre", SCRIPTS)
+def test_main_arma_el_pool(nombre, monkeypatch):
+    """main() llega a crear el pool con el initializer del memo / almacén"""
+    monkeypatch.delenv('TESIS3_MEMO_COMPARTIDO', raising=False)
+    monkeypatch.delenv('TESIS3_ALMACEN_EVALUACIONES', raising=False)
+    argumentos = _armar_pool(nombre, monkeypatch)
+    
+    nombre_memo, config, ruta_almacen = argumentos['initargs']
+    assert argumentos['max_workers'] == 1
+    assert nombre_memo is None and ruta_almacen is None
+    assert isinstance(config, ProblemConfig)
+
+
+@pytest.mark.parametrize("nombre", SCRIPTS)
+def test_worker_abre_el_almacen(nombre, monkeypatch, tmp_path):
+    """Con TESIS3_ALMACEN_EVALUACIONES los workers del script abren el almacén SQLite"""
+    ruta = str(tmp_path / "evaluaciones.sqlite")
+    monkeypatch.delenv('TESIS3_MEMO_COMPARTIDO', raising=False)
+    monkeypatch.setenv('TESIS3_ALMACEN_EVALUACIONES', ruta)
+    argumentos = _armar_pool(nombre, monkeypatch)
+    assert argumentos['initargs'][2] == ruta
+    
+    with ProcessPoolExecutor(max_workers=1,
+                             mp_context=multiprocessing.get_context('fork'),
+                             initializer=argumentos['initializer'],
+                             initargs=argumentos['initargs']) as pool:
+        assert pool.submit(_respaldo_del_worker).result() == (
+            AlmacenEvaluaciones.__name__, ruta
+        )
+    assert (tmp_path / "evaluaciones.sqlite").exists()
+
+
+@pytest.mark.parametrize("nombre", SCRIPTS)
+def test_memo_se_libera_si_el_pool_falla(nombre, monkeypatch):
+    """Una excepción dentro del bloque del pool no deja vivo el segmento del memo"""
+    monkeypatch.setenv('TESIS3_MEMO_COMPARTIDO', '1')
+    monkeypatch.delenv('TESIS3_ALMACEN_EVALUACIONES', raising=False)
+    nombre_memo = _armar_pool(nombre, monkeypatch)['initargs'][0]
+    
+    assert nombre_memo is not None
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=nombre_memo)